@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark du chiffrement: ancienne implémentation (décodage + AES.new
+à chaque appel) contre CryptoEngine (clés pré-décodées, mémo des chiffrés)
+"""
+import base64
+import json
+import os
+import sys
+import timeit
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from crypto import CryptoEngine  # noqa: E402
+
+KEY_B64 = "qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ="
+IV_B64 = "k3vi7ZFUB8/XSID2AXEwug=="
+
+
+def legacy_encrypt(text: str) -> str:
+    key = base64.b64decode(KEY_B64)
+    iv = base64.b64decode(IV_B64)
+    cipher = AES.new(key, AES.MODE_CBC, iv)
+    return base64.b64encode(cipher.encrypt(pad(text.encode(), AES.block_size))).decode()
+
+
+def legacy_decrypt(encrypted_b64: str) -> dict:
+    key = base64.b64decode(KEY_B64)
+    iv = base64.b64decode(IV_B64)
+    cipher = AES.new(key, AES.MODE_CBC, iv)
+    return json.loads(unpad(cipher.decrypt(base64.b64decode(encrypted_b64)), AES.block_size).decode())
+
+
+def measure(func, *args, number: int) -> float:
+    """Temps moyen par appel en microsecondes (meilleur de 5 séries)"""
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    engine = CryptoEngine(KEY_B64, IV_B64)
+    small = {"idDossierCivil": 13967222, "affaire": "DC"}
+    large = [{"idDecision": i, "contenuDecision": "حكم " * 40, "dateDecision": "01/01/2025"} for i in range(200)]
+
+    cases = [
+        ("encrypt id_juridiction", legacy_encrypt, engine.encrypt, ("13",), 20000),
+        ("encrypt numéro dossier", legacy_encrypt, engine.encrypt, ("202512028569",), 20000),
+        ("encrypt typeaffaire", legacy_encrypt, engine.encrypt, ("DC",), 20000),
+        ("decrypt carte (petit)", legacy_decrypt, engine.decrypt, (legacy_encrypt(json.dumps(small)),), 20000),
+        ("decrypt décisions (200)", legacy_decrypt, engine.decrypt, (legacy_encrypt(json.dumps(large)),), 200),
+    ]
+
+    print(f"{'cas':<28}{'avant (µs)':>12}{'après (µs)':>12}{'gain':>8}")
+    for name, before, after, args, number in cases:
+        t_before = measure(before, *args, number=number)
+        t_after = measure(after, *args, number=number)
+        print(f"{name:<28}{t_before:>12.2f}{t_after:>12.2f}{t_before / t_after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Test de charge de bout en bout: débit (req/s) et latences p50/p95/p99 de l'API
+sur des dossiers jamais vus (cold), déjà en cache (warm) ou un mélange (mixed)
+
+    python bench/load_test.py --spawn                       # lance le faux Mahakim et l'API
+    python bench/load_test.py --url http://localhost:8000 --workload mixed --hit-ratio 0.9
+    python bench/load_test.py --spawn --output load.json    # résultats en JSON
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List
+
+import httpx
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+API_DIR = os.path.dirname(BENCH_DIR)
+
+WORKLOADS = ("cold", "warm", "mixed")
+
+# "source" est la première clé des réponses: inutile de décoder tout le dossier côté client
+SOURCE = re.compile(rb'^\{"source":\s*"(\w+)"')
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile au rang le plus proche (valeurs déjà triées)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class DossierIds:
+    """Numéros de dossier valides: un jeu chaud réutilisé et des numéros neufs à la demande"""
+
+    def __init__(self, warm_size: int, seed: int | None = None):
+        self.random = random.Random(seed)
+        # Préfixe propre au lancement: un cache persistant ne fausse pas les misses
+        self.run = self.random.randrange(1000, 10000)
+        self.counter = 0
+        self.warm = [self.fresh() for _ in range(warm_size)]
+
+    def fresh(self) -> str:
+        self.counter += 1
+        return f"2025{self.run}{self.counter:07d}"
+
+    def pick(self, workload: str, hit_ratio: float) -> str:
+        if workload == "warm" or (workload == "mixed" and self.random.random() < hit_ratio):
+            return self.random.choice(self.warm)
+        return self.fresh()
+
+
+async def run_workload(client: httpx.AsyncClient, workload: str, requests: int, concurrency: int,
+                       ids: DossierIds, hit_ratio: float, juridiction: str) -> dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    sources: Counter = Counter()
+    queue = [ids.pick(workload, hit_ratio) for _ in range(requests)]
+
+    async def worker():
+        while queue:
+            dossier = queue.pop()
+            start = time.perf_counter()
+            try:
+                response = await client.get(f"/dossier/{juridiction}/{dossier}")
+                statuses[str(response.status_code)] += 1
+                if response.status_code == 200:
+                    match = SOURCE.match(response.content)
+                    sources[match.group(1).decode() if match else "?"] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "workload": workload,
+        "requests": requests,
+        "concurrency": concurrency,
+        "hit_ratio": hit_ratio if workload == "mixed" else None,
+        "duration": round(elapsed, 3),
+        "rps": round(requests / elapsed, 1),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "mean": round(sum(latencies) / len(latencies), 2),
+            "max": round(latencies[-1], 2)
+        },
+        "errors": sum(count for status, count in statuses.items() if status != "200"),
+        "status": dict(statuses),
+        "sources": dict(sources)
+    }
+
+
+async def warm_up(client: httpx.AsyncClient, ids: DossierIds, concurrency: int, juridiction: str):
+    """Met le jeu chaud en cache avant les mesures warm et mixed"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(dossier: str):
+        async with semaphore:
+            await client.get(f"/dossier/{juridiction}/{dossier}")
+
+    await asyncio.gather(*(one(dossier) for dossier in ids.warm))
+
+
+async def run(args) -> List[dict]:
+    ids = DossierIds(args.warm_size, args.seed)
+    workloads = WORKLOADS if args.workload == "all" else (args.workload,)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+        if any(workload != "cold" for workload in workloads):
+            await warm_up(client, ids, args.concurrency, args.juridiction)
+        results = []
+        for workload in workloads:
+            result = await run_workload(client, workload, args.requests, args.concurrency,
+                                        ids, args.hit_ratio, args.juridiction)
+            print_result(result)
+            results.append(result)
+    return results
+
+
+def print_result(result: dict):
+    latency = result["latency_ms"]
+    print(f"{result['workload']:<6}{result['rps']:>10.1f} req/s   p50 {latency['p50']:>8.1f} ms   "
+          f"p95 {latency['p95']:>8.1f} ms   p99 {latency['p99']:>8.1f} ms   "
+          f"erreurs {result['errors']}   {result['sources']}")
+
+
+def wait_ready(url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(url, timeout=1).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} ne répond pas")
+
+
+@contextmanager
+def spawn(args):
+    """Faux Mahakim + API locale (cache mémoire, régulateur relevé pour mesurer l'API)"""
+    mock_port, api_port = args.mock_port, args.api_port
+    mock = subprocess.Popen([
+        sys.executable, os.path.join(BENCH_DIR, "mock_mahakim.py"), "--port", str(mock_port),
+        "--latency", str(args.mock_latency), "--error-rate", str(args.mock_error_rate),
+        "--decisions", str(args.mock_decisions)
+    ])
+    env: Dict[str, str] = {
+        **os.environ,
+        "MAHAKIM_BASE_URL": f"http://127.0.0.1:{mock_port}/middleware/api/SuiviDossiers",
+        "CACHE_BACKEND": "local",
+        "CACHE_DISK_PATH": "",
+        "KEY_RECOVERY": "false",
+        "UPSTREAM_RATE": os.getenv("UPSTREAM_RATE", "1000"),
+        "UPSTREAM_MAX_RATE": os.getenv("UPSTREAM_MAX_RATE", "1000"),
+        "UPSTREAM_CONCURRENCY": os.getenv("UPSTREAM_CONCURRENCY", "64"),
+        "HTTP_MAX_CONNECTIONS": os.getenv("HTTP_MAX_CONNECTIONS", "64"),
+    }
+    api = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "main:app", "--port", str(api_port), "--log-level", "warning"
+    ], cwd=API_DIR, env=env)
+    try:
+        wait_ready(f"http://127.0.0.1:{mock_port}/stats")
+        wait_ready(f"http://127.0.0.1:{api_port}/health")
+        args.url = f"http://127.0.0.1:{api_port}"
+        yield
+    finally:
+        for process in (api, mock):
+            process.terminate()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test de charge de l'API Mahakim")
+    parser.add_argument("--url", default="http://localhost:8000", help="URL de l'API (ignorée avec --spawn)")
+    parser.add_argument("--workload", choices=WORKLOADS + ("all",), default="all")
+    parser.add_argument("--requests", type=int, default=1000, help="Requêtes par scénario")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requêtes simultanées")
+    parser.add_argument("--warm-size", type=int, default=200, help="Dossiers mis en cache avant warm/mixed")
+    parser.add_argument("--hit-ratio", type=float, default=0.8, help="Part de hits du scénario mixed")
+    parser.add_argument("--juridiction", default="13")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int, help="Graine des numéros de dossier (tirage reproductible)")
+    parser.add_argument("--output", help="Fichier JSON des résultats")
+    parser.add_argument("--spawn", action="store_true", help="Lance le faux Mahakim et l'API en local")
+    parser.add_argument("--api-port", type=int, default=8098)
+    parser.add_argument("--mock-port", type=int, default=8099)
+    parser.add_argument("--mock-latency", type=float, default=100, help="Latence du faux Mahakim (ms)")
+    parser.add_argument("--mock-error-rate", type=float, default=0, help="Part d'erreurs 503 du faux Mahakim")
+    parser.add_argument("--mock-decisions", type=int, default=20, help="Décisions par dossier")
+    args = parser.parse_args()
+
+    if args.spawn:
+        with spawn(args):
+            results = asyncio.run(run(args))
+    else:
+        results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}, f, indent=2)
+        print(f"💾 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
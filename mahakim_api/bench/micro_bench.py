@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks des chemins critiques: chiffrement, cache (get_cache/set_cache
+de main.py à 10k, 100k et 1M entrées), statistiques du cache, JSON
+
+    python bench/micro_bench.py --save                       # bench/baselines/<commit>.json
+    python bench/micro_bench.py --compare bench/baselines/7604ffe.json --fail-over 0.15
+    python bench/micro_bench.py --only crypto,json --sizes 10000
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import jsoncodec  # noqa: E402
+import main  # noqa: E402
+from cache import TTLCache  # noqa: E402
+from cache_backends import LocalBackend  # noqa: E402
+from packed import PackedEntry  # noqa: E402
+
+GROUPS = ("crypto", "cache", "stats", "json")
+SIZES = (10_000, 100_000, 1_000_000)
+REPEAT = 5
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def measure(func: Callable, number: int) -> float:
+    """Temps moyen par appel en microsecondes (meilleure de REPEAT séries)"""
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number * 1e6
+
+
+async def measure_async(func: Callable, number: int) -> float:
+    """Comme measure(), pour une coroutine (attendue `number` fois par série)"""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def decision_list(count: int) -> List[dict]:
+    """Décisions au format Mahakim (texte arabe, comme les vraies réponses)"""
+    return [
+        {"idDecision": 1000 + i, "dateDecision": f"{1 + i % 28:02d}/01/2025", "typeDecision": "حكم تمهيدي",
+         "contenuDecision": "حكم " * 150, "numeroDecision": f"{i}/2025", "finalite": i % 5 == 0}
+        for i in range(count)
+    ]
+
+
+def dossier(decisions: int = 20) -> dict:
+    return {
+        "carte": {"idDossierCivil": 13967222, "affaire": "DC", "numeroCompletDossier": "202512028569",
+                  "lastJugement": {"dateProchaineAudienceString": "25/11/2025", "finalite": None}},
+        "decisions": decision_list(decisions),
+        "parties": [{"idPartie": i, "nomPrenomPartie": f"Partie {i}"} for i in range(4)],
+        "expertises": [],
+        "timestamp": "2025-11-01T10:00:00"
+    }
+
+
+def bench_crypto(results: Dict[str, dict]):
+    engine = main.crypto
+    carte = json.dumps(dossier()["carte"])
+    for label, text in (("numéro dossier", "202512028569"), ("carte", carte)):
+        # AES seul, sans le mémo: coût réel du premier chiffrement d'un dossier
+        material = engine.current
+        results[f"crypto.KeyMaterial.encrypt {label}"] = {"us": measure(lambda: material.encrypt(text), 5000)}
+    results["crypto.main.encrypt numéro dossier (mémo)"] = {"us": measure(lambda: main.encrypt("202512028569"), 20000)}
+    for label, count in (("carte", 0), ("décisions x20", 20), ("décisions x200", 200)):
+        payload = carte if count == 0 else json.dumps(decision_list(count), ensure_ascii=False)
+        encrypted = engine.current.encrypt(payload)
+        number = 20000 if count == 0 else max(50, 4000 // count)
+        results[f"crypto.main.decrypt {label}"] = {"us": measure(lambda: main.decrypt(encrypted), number),
+                                              "bytes": len(encrypted)}
+
+
+async def bench_cache(results: Dict[str, dict], sizes: List[int], groups: List[str]):
+    """get_cache/set_cache de main.py sur un backend local rempli à `size` entrées"""
+    entry = PackedEntry.build(dossier(), {name: time.time() for name in main.SECTION_TTLS}, main.crypto.fingerprint)
+    blob = entry.pack()
+    previous = main.cache_backend
+    try:
+        for size in sizes:
+            memory = TTLCache(max_entries=size, max_bytes=size * len(blob) * 2, default_ttl=main.CACHE_TTL)
+            # Même blob partagé: on mesure l'index du cache, pas la mémoire des dossiers
+            for i in range(size):
+                memory.set(f"13:{i}", blob, main.CACHE_TTL, len(blob))
+            main.cache_backend = LocalBackend(memory)
+            keys = [f"13:{random.randrange(size)}" for _ in range(4096)]
+            label = f"{size // 1000}k" if size < 1_000_000 else f"{size // 1_000_000}M"
+
+            if "cache" in groups:
+                position = iter(range(10 ** 9))
+                hit = lambda: main.get_cache(keys[next(position) % 4096])  # noqa: E731
+                results[f"cache.get_cache hit {label}"] = {"us": await measure_async(hit, 20000)}
+                results[f"cache.get_cache miss {label}"] = {"us": await measure_async(
+                    lambda: main.get_cache("13:absent"), 20000)}
+                fresh = iter(range(size, 10 ** 9))
+                # Cache plein: chaque insertion évince l'entrée la moins récente
+                insert = lambda: main.set_cache(f"13:{next(fresh)}", entry)  # noqa: E731
+                results[f"cache.set_cache éviction {label}"] = {"us": await measure_async(insert, 5000)}
+            if "stats" in groups:
+                results[f"stats.cache_stats {label}"] = {"us": await measure_async(
+                    lambda: main.cache_stats(0), 2000)}
+                results[f"stats.cache_stats top=10 {label}"] = {"us": await measure_async(
+                    lambda: main.cache_stats(10), 3 if size >= 1_000_000 else 20)}
+            del memory
+    finally:
+        main.cache_backend = previous
+
+
+def bench_json(results: Dict[str, dict]):
+    for count in (200, 2000):
+        decisions = decision_list(count)
+        encoded = jsoncodec.dumps(decisions)
+        number = max(5, 4000 // count)
+        results[f"json.dumps décisions x{count} ({jsoncodec.name})"] = {
+            "us": measure(lambda: jsoncodec.dumps(decisions), number), "bytes": len(encoded)}
+        results[f"json.loads décisions x{count} ({jsoncodec.name})"] = {
+            "us": measure(lambda: jsoncodec.loads(encoded), number)}
+        if jsoncodec.name != "json":
+            results[f"json.dumps décisions x{count} (json)"] = {
+                "us": measure(lambda: json.dumps(decisions, ensure_ascii=False).encode(), number)}
+            results[f"json.loads décisions x{count} (json)"] = {
+                "us": measure(lambda: json.loads(encoded), number)}
+    entry = PackedEntry.build(dossier(200), {name: time.time() for name in main.SECTION_TTLS})
+    results["json.render hit (sans ré-encodage)"] = {
+        "us": measure(lambda: main.render({"source": "cache", "data": entry}), 2000)}
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, dict], baseline: dict, fail_over: float) -> bool:
+    """Affiche l'écart avec une référence; False si un cas ralentit de plus de fail_over"""
+    reference = baseline["results"]
+    print(f"\nRéférence: {baseline.get('commit') or '?'} ({baseline.get('created_at')})")
+    print(f"{'cas':<50}{'réf. (µs)':>12}{'actuel (µs)':>13}{'écart':>9}")
+    ok = True
+    for name, result in results.items():
+        if name not in reference:
+            continue
+        before, after = reference[name]["us"], result["us"]
+        change = after / before - 1
+        flag = ""
+        if change > fail_over:
+            flag, ok = "  ⚠️", False
+        print(f"{name:<50}{before:>12.2f}{after:>13.2f}{change:>+8.0%}{flag}")
+    return ok
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Microbenchmarks de l'API Mahakim")
+    parser.add_argument("--only", help=f"Groupes à mesurer parmi {','.join(GROUPS)}")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Tailles du cache (entrées)")
+    parser.add_argument("--save", nargs="?", const="",
+                        help="Enregistre les résultats (défaut: bench/baselines/<commit>.json)")
+    parser.add_argument("--compare", help="Référence JSON à laquelle comparer")
+    parser.add_argument("--fail-over", type=float, default=0.2,
+                        help="Ralentissement toléré avant échec avec --compare (0.2 = +20 %%)")
+    args = parser.parse_args()
+    groups = args.only.split(",") if args.only else list(GROUPS)
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    results: Dict[str, dict] = {}
+    if "crypto" in groups:
+        bench_crypto(results)
+    if "cache" in groups or "stats" in groups:
+        asyncio.run(bench_cache(results, sizes, groups))
+    if "json" in groups:
+        bench_json(results)
+    for result in results.values():
+        result["us"] = round(result["us"], 3)
+
+    print(f"{'cas':<50}{'µs/op':>12}{'op/s':>14}")
+    for name, result in results.items():
+        print(f"{name:<50}{result['us']:>12.2f}{1e6 / result['us']:>14,.0f}")
+
+    report = {
+        "commit": git_commit(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "json_codec": jsoncodec.name,
+        "results": results
+    }
+    if args.save is not None:
+        args.save = args.save or os.path.join(BASELINE_DIR, f"{report['commit'] or 'local'}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.fail_over):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
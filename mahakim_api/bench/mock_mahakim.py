@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Faux Mahakim (SuiviDossiers) pour mesurer l'API sans solliciter le vrai site:
+réponses chiffrées en AES comme l'original, latence, taux d'erreur et taille
+des dossiers réglables
+
+    python bench/mock_mahakim.py --port 8099 --latency 150 --error-rate 0.02
+    MAHAKIM_BASE_URL=http://localhost:8099/middleware/api/SuiviDossiers uvicorn main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import sys
+
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from crypto import CryptoEngine  # noqa: E402
+
+# === Comportement (variables d'environnement ou options de la ligne de commande) ===
+CONFIG = {
+    # Latence moyenne et variation uniforme autour de celle-ci (millisecondes)
+    "latency": float(os.getenv("MOCK_LATENCY_MS", "100")),
+    "jitter": float(os.getenv("MOCK_JITTER_MS", "50")),
+    # Part des appels en 503
+    "error_rate": float(os.getenv("MOCK_ERROR_RATE", "0")),
+    # Taille des dossiers: décisions et parties par dossier, longueur du texte d'une décision
+    "decisions": int(os.getenv("MOCK_DECISIONS", "20")),
+    "parties": int(os.getenv("MOCK_PARTIES", "4")),
+    "text_size": int(os.getenv("MOCK_TEXT_SIZE", "600")),
+}
+
+crypto = CryptoEngine(
+    os.getenv("CRYPTO_KEY", "qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ="),
+    os.getenv("CRYPTO_IV", "k3vi7ZFUB8/XSID2AXEwug==")
+)
+stats = {"requests": 0, "errors": 0}
+
+app = FastAPI(title="Faux Mahakim")
+
+
+def internal_id(numero: str) -> int:
+    """ID interne stable d'un numéro de dossier"""
+    return int(hashlib.sha256(numero.encode()).hexdigest()[:7], 16)
+
+
+def carte(numero: str, id_juridiction: str) -> dict:
+    n = internal_id(numero)
+    return {
+        "idDossierCivil": n,
+        "affaire": "DC",
+        "numeroCompletDossier": numero,
+        "idJuridiction": id_juridiction,
+        "libelleJuridiction": "المحكمة الابتدائية",
+        "objetDossier": "أداء",
+        "lastJugement": {
+            "dateProchaineAudienceString": f"{1 + n % 28:02d}/{1 + n % 12:02d}/2026",
+            "finalite": None
+        }
+    }
+
+
+def decisions(n: int) -> list:
+    text = ("حكم " * CONFIG["text_size"])[:CONFIG["text_size"]]
+    return [
+        {"idDecision": n * 1000 + i, "dateDecision": f"{1 + i % 28:02d}/01/2025",
+         "typeDecision": "حكم تمهيدي", "contenuDecision": text}
+        for i in range(CONFIG["decisions"])
+    ]
+
+
+def parties(n: int) -> list:
+    return [
+        {"idPartie": n * 100 + i, "nomPrenomPartie": f"Partie {i}", "qualite": "مدعي" if i % 2 else "مدعى عليه"}
+        for i in range(CONFIG["parties"])
+    ]
+
+
+async def respond(payload) -> JSONResponse:
+    stats["requests"] += 1
+    delay = CONFIG["latency"] + random.uniform(-CONFIG["jitter"], CONFIG["jitter"])
+    await asyncio.sleep(max(delay, 0) / 1000)
+    if random.random() < CONFIG["error_rate"]:
+        stats["errors"] += 1
+        return JSONResponse({"succes": False, "message": "Service indisponible"}, status_code=503)
+    # Chiffrement direct: les réponses ne sont pas mémoïsées comme les paramètres
+    return JSONResponse({"succes": True, "data": crypto.current.encrypt(json.dumps(payload, ensure_ascii=False))})
+
+
+def clear(value: str) -> str:
+    return crypto.current.decrypt(value).decode()
+
+
+@app.get("/middleware/api/SuiviDossiers/CarteDossier")
+async def carte_dossier(numeroCompletDossier: str, idjuridiction: str, csrt: str = ""):
+    return await respond(carte(clear(numeroCompletDossier), clear(idjuridiction)))
+
+
+@app.get("/middleware/api/SuiviDossiers/ListeDicisions")
+async def liste_decisions(idDossiers: str, typeaffaire: str = "", csrt: str = ""):
+    return await respond(decisions(int(clear(idDossiers))))
+
+
+@app.get("/middleware/api/SuiviDossiers/ListeParties")
+async def liste_parties(idDoss: str, typeaffaire: str = "", csrt: str = ""):
+    return await respond(parties(int(clear(idDoss))))
+
+
+@app.get("/middleware/api/SuiviDossiers/ListeExpertisesJudiciaire")
+async def liste_expertises(idDossiers: str, typeaffaire: str = "", csrt: str = ""):
+    return await respond([])
+
+
+@app.get("/stats")
+async def mock_stats():
+    return {**stats, "config": CONFIG}
+
+
+@app.put("/config")
+async def update_config(latency: float = Query(None), jitter: float = Query(None), error_rate: float = Query(None),
+                        decisions: int = Query(None), parties: int = Query(None), text_size: int = Query(None)):
+    """Change le comportement sans redémarrer (ex: panne simulée en cours de test)"""
+    updates = {"latency": latency, "jitter": jitter, "error_rate": error_rate,
+               "decisions": decisions, "parties": parties, "text_size": text_size}
+    CONFIG.update({name: value for name, value in updates.items() if value is not None})
+    return CONFIG
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Faux Mahakim pour les benchmarks")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, help="Latence moyenne (ms)")
+    parser.add_argument("--jitter", type=float, help="Variation de latence (ms)")
+    parser.add_argument("--error-rate", type=float, help="Part des appels en 503 (0 à 1)")
+    parser.add_argument("--decisions", type=int, help="Décisions par dossier")
+    parser.add_argument("--parties", type=int, help="Parties par dossier")
+    parser.add_argument("--text-size", type=int, help="Caractères par décision")
+    args = parser.parse_args()
+    for name in CONFIG:
+        value = getattr(args, name)
+        if value is not None:
+            CONFIG[name] = value
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
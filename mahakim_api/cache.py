@@ -0,0 +1,156 @@
+"""
+Cache mémoire borné: expiration TTL (horloge monotone) + éviction LRU
+"""
+import heapq
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def estimate_size(value: Any) -> int:
+    """Taille approximative d'une valeur en octets (JSON encodé)"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode())
+
+
+class _Entry:
+    __slots__ = ("value", "expires", "size", "seq")
+
+    def __init__(self, value: Any, expires: float, size: int, seq: int):
+        self.value = value
+        self.expires = expires
+        self.size = size
+        self.seq = seq
+
+
+class TTLCache:
+    """
+    Cache clé/valeur avec nombre d'entrées et budget mémoire maximum.
+    Les expirations sont indexées dans un tas: le nettoyage ne parcourt
+    que les entrées réellement expirées, et les statistiques sont des compteurs.
+    """
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 256 * 1024 * 1024,
+                 default_ttl: float = 86400, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires > self.clock()
+
+    def get(self, key: str, count: bool = True) -> Any:
+        """
+        Retourne la valeur si présente et non expirée, sinon None.
+        count=False: lecture annexe, hors des compteurs hits/misses
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += count
+            return None
+        if entry.expires <= self.clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += count
+            return None
+        self._entries.move_to_end(key)
+        self.hits += count
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: float | None = None, size: int | None = None):
+        """Insère ou remplace une entrée puis évince les moins récentes si besoin"""
+        size = estimate_size(value) if size is None else size
+        if size > self.max_bytes:
+            # Une entrée plus grosse que tout le budget n'est jamais conservée
+            self.rejected += 1
+            self.delete(key)
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        self._seq += 1
+        expires = self.clock() + (self.default_ttl if ttl is None else ttl)
+        self._entries[key] = _Entry(value, expires, size, self._seq)
+        self.bytes += size
+        heapq.heappush(self._heap, (expires, self._seq, key))
+
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+        # Les remplacements laissent des éléments périmés dans le tas
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._rebuild_heap()
+
+    def delete(self, key: str) -> bool:
+        if key in self._entries:
+            self._remove(key)
+            return True
+        return False
+
+    def clear(self):
+        self._entries.clear()
+        self._heap.clear()
+        self.bytes = 0
+
+    def sweep(self) -> int:
+        """Supprime les entrées expirées; coût proportionnel au nombre d'expirées"""
+        now = self.clock()
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, seq, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry.seq == seq:
+                self._remove(key)
+                self.expirations += 1
+                removed += 1
+        return removed
+
+    def largest(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Les n entrées les plus volumineuses"""
+        now = self.clock()
+        top = heapq.nlargest(n, self._entries.items(), key=lambda item: item[1].size)
+        return [
+            {"key": key, "bytes": entry.size, "ttl": round(max(entry.expires - now, 0), 1)}
+            for key, entry in top
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "rejected": self.rejected
+        }
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+
+    def _rebuild_heap(self):
+        self._heap = [(e.expires, e.seq, k) for k, e in self._entries.items()]
+        heapq.heapify(self._heap)
@@ -0,0 +1,298 @@
+"""
+Backends de cache interchangeables: local (mémoire + disque) ou Redis partagé
+"""
+import asyncio
+import json
+import logging
+from typing import Any, AsyncIterator, Dict
+
+from cache import TTLCache
+from disk_cache import DiskCache, decode_value, encode_value
+
+_logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Interface commune des backends de cache"""
+
+    name = "base"
+    # État (save_state/load_state) et bail vus par tous les workers
+    shared = False
+
+    async def start(self):
+        """Ouverture des connexions (démarrage de l'application)"""
+
+    async def close(self):
+        """Fermeture des connexions (arrêt de l'application)"""
+
+    async def get(self, key: str, count: bool = True) -> Any:
+        """count=False: lecture annexe (marqueur, historique) hors du taux de hit"""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def clear(self):
+        raise NotImplementedError
+
+    async def sweep(self) -> int:
+        """Nettoyage des entrées expirées, si le backend ne le fait pas lui-même"""
+        return 0
+
+    async def stats(self, top: int = 0) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    async def save_state(self, name: str, value: dict):
+        """Conserve un état partagé hors cache (non effacé par clear)"""
+
+    async def load_state(self, name: str) -> dict | None:
+        return None
+
+    async def delete_state(self, name: str):
+        """Supprime un état conservé par save_state"""
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Prend ou prolonge un bail exclusif entre workers (toujours accordé sans état partagé)"""
+        return True
+
+    async def publish(self, event: dict):
+        """Diffuse un événement aux autres workers (aucun en local)"""
+
+    async def events(self) -> AsyncIterator[dict]:
+        """Événements publiés par les autres workers"""
+        return
+        yield
+
+
+class LocalBackend(CacheBackend):
+    """
+    Cache propre au processus: mémoire TTL+LRU, avec tier disque optionnel.
+    Le fichier SQLite du tier disque porte aussi l'état et le bail, partagés
+    par les workers d'une même machine; sans lui, un seul worker est possible.
+    """
+
+    name = "local"
+
+    def __init__(self, memory: TTLCache, disk: DiskCache | None = None):
+        self.memory = memory
+        self.disk = disk
+        self.shared = disk is not None
+        self._state: Dict[str, dict] = {}
+
+    async def close(self):
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.close)
+
+    async def get(self, key: str, count: bool = True) -> Any:
+        value = self.memory.get(key, count)
+        if value is None and self.disk is not None:
+            found = await self.disk.run(self.disk.get, key, count)
+            if found:
+                # Remonter l'entrée en mémoire avec son expiration d'origine
+                value, remaining = found
+                self.memory.set(key, value, ttl=remaining)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self.memory.set(key, value, ttl=ttl)
+        if self.disk is not None:
+            await self.disk.run(self.disk.set, key, value, ttl)
+
+    async def delete(self, key: str):
+        self.memory.delete(key)
+        if self.disk is not None:
+            await self.disk.run(self.disk.delete, key)
+
+    async def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            await self.disk.run(self.disk.clear)
+
+    async def sweep(self) -> int:
+        removed = self.memory.sweep()
+        if self.disk is not None:
+            await self.disk.run(self.disk.purge_expired)
+        return removed
+
+    async def stats(self, top: int = 0) -> Dict[str, Any]:
+        stats = {"backend": self.name, "total": len(self.memory), **self.memory.stats()}
+        if self.disk is not None:
+            # Les hits disque depuis le démarrage mesurent le redémarrage à chaud
+            stats["disk"] = self.disk.stats()
+        if top:
+            stats["largest"] = self.memory.largest(top)
+        return stats
+
+
+    async def save_state(self, name: str, value: dict):
+        # Avec le tier disque, l'état survit aux redémarrages et est vu des autres workers
+        if self.disk is not None:
+            await self.disk.run(self.disk.save_state, name, value)
+        else:
+            self._state[name] = value
+
+    async def load_state(self, name: str) -> dict | None:
+        # Toujours relu sur disque: un autre worker a pu le modifier
+        if self.disk is not None:
+            return await self.disk.run(self.disk.load_state, name)
+        return self._state.get(name)
+
+    async def delete_state(self, name: str):
+        self._state.pop(name, None)
+        if self.disk is not None:
+            await self.disk.run(self.disk.delete_state, name)
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        if self.disk is not None:
+            return await self.disk.run(self.disk.acquire_lease, name, owner, ttl)
+        return True
+
+
+class RedisBackend(CacheBackend):
+    """
+    Cache partagé entre workers et réplicas via le protocole Redis.
+    Une erreur Redis est traitée comme un miss: le service reste disponible.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, url: str, prefix: str = "mahakim:", compression_level: int = 6):
+        self.url = url
+        self.prefix = prefix
+        self.keyspace = f"{prefix}cache:"
+        self.channel = f"{prefix}events"
+        self.compression_level = compression_level
+        self._redis = None
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def start(self):
+        # Dépendance optionnelle: requise uniquement avec CACHE_BACKEND=redis
+        import redis.asyncio as aioredis
+        self._redis = aioredis.from_url(self.url)
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def get(self, key: str, count: bool = True) -> Any:
+        try:
+            blob = await self._redis.get(self.keyspace + key)
+        except Exception as e:
+            self._error("get", e)
+            return None
+        if blob is None:
+            self.misses += count
+            return None
+        self.hits += count
+        return decode_value(blob)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        try:
+            await self._redis.set(
+                self.keyspace + key, encode_value(value, self.compression_level), px=int(ttl * 1000)
+            )
+        except Exception as e:
+            self._error("set", e)
+
+    async def delete(self, key: str):
+        try:
+            await self._redis.delete(self.keyspace + key)
+        except Exception as e:
+            self._error("delete", e)
+
+    async def clear(self):
+        """Supprime toutes les entrées du préfixe, pour tous les workers"""
+        try:
+            batch = []
+            async for key in self._redis.scan_iter(match=f"{self.keyspace}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._redis.delete(*batch)
+                    batch = []
+            if batch:
+                await self._redis.delete(*batch)
+        except Exception as e:
+            self._error("clear", e)
+
+    async def stats(self, top: int = 0) -> Dict[str, Any]:
+        used_memory = None
+        try:
+            used_memory = (await self._redis.info("memory")).get("used_memory")
+        except Exception as e:
+            self._error("stats", e)
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.name,
+            "prefix": self.prefix,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "errors": self.errors,
+            "used_memory": used_memory
+        }
+
+    async def save_state(self, name: str, value: dict):
+        try:
+            await self._redis.set(f"{self.prefix}state:{name}", json.dumps(value))
+        except Exception as e:
+            self._error("save_state", e)
+
+    async def load_state(self, name: str) -> dict | None:
+        try:
+            raw = await self._redis.get(f"{self.prefix}state:{name}")
+        except Exception as e:
+            self._error("load_state", e)
+            return None
+        return json.loads(raw) if raw else None
+
+    async def delete_state(self, name: str):
+        try:
+            await self._redis.delete(f"{self.prefix}state:{name}")
+        except Exception as e:
+            self._error("delete_state", e)
+
+    async def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        key = f"{self.prefix}lease:{name}"
+        try:
+            if await self._redis.set(key, owner, nx=True, px=int(ttl * 1000)):
+                return True
+            if await self._redis.get(key) == owner.encode():
+                await self._redis.pexpire(key, int(ttl * 1000))
+                return True
+        except Exception as e:
+            self._error("acquire_lease", e)
+        return False
+
+    async def publish(self, event: dict):
+        try:
+            await self._redis.publish(self.channel, json.dumps(event))
+        except Exception as e:
+            self._error("publish", e)
+
+    async def events(self) -> AsyncIterator[dict]:
+        """Abonnement au canal d'événements, avec reconnexion en cas de coupure"""
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        yield json.loads(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._error("events", e)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+    def _error(self, operation: str, error: Exception):
+        self.errors += 1
+        _logger.warning("Redis %s en échec: %s", operation, error)
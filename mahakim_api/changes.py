@@ -0,0 +1,154 @@
+"""
+Historique des changements d'un dossier: diff structurel entre deux versions
+"""
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from packed import PackedEntry, compress, decompress
+
+# Sections listes: champs identifiant un élément d'une version à l'autre
+ITEM_KEYS = {
+    "decisions": ("idDecision", "id"),
+    "parties": ("idPartie", "idPartieDossier", "id"),
+    "expertises": ("numeroDossierMI", "numero", "id")
+}
+
+
+def item_key(section: str, item: Any) -> str:
+    """Identifiant d'un élément; à défaut, empreinte de son contenu"""
+    if isinstance(item, dict):
+        for field in ITEM_KEYS.get(section, ()):
+            if item.get(field) not in (None, ""):
+                return str(item[field])
+    raw = json.dumps(item, ensure_ascii=False, sort_keys=True, default=str)
+    return "#" + hashlib.sha256(raw.encode()).hexdigest()[:12]
+
+
+def diff_fields(old: Any, new: Any, prefix: str = "") -> Dict[str, dict]:
+    """Champs modifiés entre deux objets, chemins pointés (lastJugement.dateProchaineAudienceString)"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed = {}
+        for name in old.keys() | new.keys():
+            changed.update(diff_fields(old.get(name), new.get(name), f"{prefix}{name}."))
+        return changed
+    if old != new:
+        return {prefix.rstrip("."): {"old": old, "new": new}}
+    return {}
+
+
+def diff_list(section: str, old: List[Any], new: List[Any]) -> dict:
+    previous = {item_key(section, item): item for item in old}
+    current = {item_key(section, item): item for item in new}
+    diff = {}
+    added = [item for key, item in current.items() if key not in previous]
+    changed = []
+    for key, item in current.items():
+        if key in previous:
+            fields = diff_fields(previous[key], item)
+            if fields:
+                changed.append({"id": key, "fields": fields})
+    removed = [key for key in previous if key not in current]
+    if added:
+        diff["added"] = added
+    if changed:
+        diff["changed"] = changed
+    if removed:
+        diff["removed"] = removed
+    return diff
+
+
+def diff_dossier(old: dict, new: dict) -> dict:
+    """Diff par section; les sections inchangées sont omises"""
+    diff = {}
+    for section in old.keys() | new.keys():
+        if section == "timestamp":
+            continue
+        before, after = old.get(section), new.get(section)
+        if before == after:
+            continue
+        if isinstance(before, list) and isinstance(after, list):
+            section_diff = diff_list(section, before, after)
+        elif isinstance(before, dict) and isinstance(after, dict):
+            section_diff = diff_fields(before, after)
+        else:
+            section_diff = {"old": before, "new": after}
+        if section_diff:
+            diff[section] = section_diff
+    return diff
+
+
+class History:
+    """
+    Historique d'un dossier tel que stocké en cache: les changements et la
+    version de référence, gardée sous la forme du corps compressé de son
+    PackedEntry (décompressé seulement pour calculer le diff suivant).
+    """
+
+    __slots__ = ("etag", "since", "changes", "method", "body")
+
+    def __init__(self, etag: str, since: str, changes: List[dict], method: str, body: bytes):
+        self.etag = etag
+        self.since = since
+        self.changes = changes
+        self.method = method
+        self.body = body
+
+    @property
+    def snapshot(self) -> dict:
+        return PackedEntry({}, self.method, self.body, "").data
+
+    def pack(self) -> bytes:
+        """En-tête JSON compressé en zlib (longueur sur 4 octets) suivi du corps de la référence"""
+        header = json.dumps({"etag": self.etag, "since": self.since, "method": self.method,
+                             "changes": self.changes}, ensure_ascii=False).encode()
+        header = compress(header, "zlib")
+        return len(header).to_bytes(4, "big") + header + self.body
+
+    @classmethod
+    def unpack(cls, blob: bytes) -> "History":
+        size = int.from_bytes(blob[:4], "big")
+        header = json.loads(decompress(blob[4:4 + size], "zlib"))
+        return cls(header["etag"], header["since"], header["changes"], header["method"], blob[4 + size:])
+
+
+def record_version(history: History | None, entry: PackedEntry, max_changes: int) -> History:
+    """
+    Met à jour l'historique avec la version récupérée: la version précédente
+    est conservée comme référence, un changement est ajouté si le contenu diffère.
+    """
+    at = entry.data["timestamp"]
+    if history is None:
+        return History(entry.etag, at, [], entry.method, entry.body)
+    if history.etag == entry.etag:
+        return history
+    change = {"at": at, "from": history.etag, "to": entry.etag, "diff": diff_dossier(history.snapshot, entry.data)}
+    changes = history.changes + [change]
+    since = history.since
+    if len(changes) > max_changes:
+        # L'historique n'est plus complet qu'à partir du dernier changement oublié
+        since = changes[-max_changes - 1]["at"]
+        changes = changes[-max_changes:]
+    return History(entry.etag, since, changes, entry.method, entry.body)
+
+
+def changes_since(history: History, since: str | None) -> dict:
+    """
+    Changements postérieurs à `since` (ETag ou date ISO). Sans `since`, le
+    dernier changement. complete=False si l'historique ne remonte pas assez loin.
+    """
+    changes = history.changes
+    if since is None:
+        return {"complete": True, "changes": changes[-1:]}
+    if since.startswith(("W/", '"')):
+        tag = since.removeprefix("W/")
+        if history.etag.removeprefix("W/") == tag:
+            return {"complete": True, "changes": []}
+        for index, change in enumerate(changes):
+            if change["from"].removeprefix("W/") == tag:
+                return {"complete": True, "changes": changes[index:]}
+        return {"complete": False, "changes": changes}
+    return {
+        "complete": since >= history.since,
+        "changes": [change for change in changes if change["at"] > since]
+    }
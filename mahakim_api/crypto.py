@@ -0,0 +1,207 @@
+"""
+Moteur de chiffrement AES-256-CBC Mahakim: clés pré-décodées et mémoïsation
+"""
+import base64
+import hashlib
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+import jsoncodec
+
+# En dessous de ce nombre de blocs, le CBC est chaîné à la main sur un objet
+# ECB réutilisé, ce qui évite de recréer un chiffreur (expansion de clé) par appel
+SMALL_ENCRYPT_BLOCKS = 4
+SMALL_DECRYPT_BYTES = 2048
+
+# Plus gros chiffré conservé comme échantillon pour tester des clés candidates
+SAMPLE_MAX_BYTES = 65536
+
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+
+class KeyMaterial:
+    """Une version de clé: octets décodés, chiffreur ECB et mémo des chiffrés"""
+
+    def __init__(self, key_b64: str, iv_b64: str, memo_size: int = 4096):
+        self.key_b64 = key_b64
+        self.iv_b64 = iv_b64
+        self.key = base64.b64decode(key_b64)
+        self.iv = base64.b64decode(iv_b64)
+        if len(self.key) != 32:
+            raise ValueError("La clé doit faire 32 bytes (256 bits)")
+        if len(self.iv) != 16:
+            raise ValueError("L'IV doit faire 16 bytes (128 bits)")
+        self.fingerprint = hashlib.sha256(self.key + self.iv).hexdigest()[:12]
+        self.activated_at = 0.0
+        self.memo_size = memo_size
+        # Ordre LRU: les juridictions et types d'affaire, redemandés sans cesse, restent
+        # en tête face aux numéros de dossier et IDs internes vus une seule fois
+        self.memo: "OrderedDict[str, str]" = OrderedDict()
+        self._ecb = AES.new(self.key, AES.MODE_ECB)
+
+    def encrypt(self, text: str) -> str:
+        padded = pad(text.encode(), AES.block_size)
+        if len(padded) <= SMALL_ENCRYPT_BLOCKS * AES.block_size:
+            blocks = []
+            previous = self.iv
+            for i in range(0, len(padded), AES.block_size):
+                previous = self._ecb.encrypt(_xor(padded[i:i + AES.block_size], previous))
+                blocks.append(previous)
+            encrypted = b"".join(blocks)
+        else:
+            encrypted = AES.new(self.key, AES.MODE_CBC, self.iv).encrypt(padded)
+        return base64.b64encode(encrypted).decode()
+
+    def decrypt(self, encrypted_b64: str) -> bytes:
+        encrypted = base64.b64decode(encrypted_b64)
+        if len(encrypted) <= SMALL_DECRYPT_BYTES and len(encrypted) % AES.block_size == 0:
+            # CBC: P[i] = D(C[i]) xor C[i-1], calculé en un seul passage ECB
+            decrypted = _xor(self._ecb.decrypt(encrypted), self.iv + encrypted[:-AES.block_size])
+        else:
+            decrypted = AES.new(self.key, AES.MODE_CBC, self.iv).decrypt(encrypted)
+        return unpad(decrypted, AES.block_size)
+
+
+class DecryptHealth:
+    """
+    Taux d'échec du déchiffrement sur les `window` dernières réponses: au-delà de
+    `threshold`, la clé active est suspecte (Mahakim a probablement changé de clé).
+    Le dernier chiffré en échec sert d'échantillon pour valider une nouvelle clé.
+    """
+
+    def __init__(self, window: int = 50, threshold: float = 0.5, min_samples: int = 5):
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.outcomes = deque(maxlen=window)
+        self.sample: str | None = None
+        self.successes = 0
+        self.failures = 0
+
+    def record(self, ok: bool, encrypted_b64: str = None):
+        self.outcomes.append(ok)
+        if ok:
+            self.successes += 1
+            return
+        self.failures += 1
+        if encrypted_b64 and len(encrypted_b64) <= SAMPLE_MAX_BYTES:
+            self.sample = encrypted_b64
+
+    @property
+    def failure_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    @property
+    def suspect(self) -> bool:
+        return len(self.outcomes) >= self.min_samples and self.failure_rate >= self.threshold
+
+    def reset(self):
+        """Nouvelle clé: les échecs de l'ancienne ne comptent plus"""
+        self.outcomes.clear()
+        self.sample = None
+
+    def stats(self) -> dict:
+        return {
+            "suspect": self.suspect,
+            "failure_rate": round(self.failure_rate, 3),
+            "window": len(self.outcomes),
+            "successes": self.successes,
+            "failures": self.failures,
+            "sample": self.sample is not None
+        }
+
+
+def trial_decrypt(key_b64: str, iv_b64: str, encrypted_b64: str) -> bool:
+    """La clé déchiffre-t-elle l'échantillon en JSON valide ?"""
+    try:
+        jsoncodec.loads(KeyMaterial(key_b64, iv_b64, memo_size=0).decrypt(encrypted_b64))
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+class CryptoEngine:
+    """
+    Chiffrement des paramètres et déchiffrement des réponses Mahakim.
+    L'IV étant fixe, un même texte donne toujours le même chiffré: les
+    juridictions, types d'affaire et numéros déjà vus sont servis depuis le mémo.
+    """
+
+    def __init__(self, key_b64: str, iv_b64: str, memo_size: int = 4096, health: DecryptHealth = None):
+        self.memo_size = memo_size
+        self.health = health or DecryptHealth()
+        self.versions: Dict[str, KeyMaterial] = {}
+        self.current = None
+        self.set_keys(key_b64, iv_b64)
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def set_keys(self, key_b64: str, iv_b64: str) -> KeyMaterial:
+        """Active une version de clé (ValueError si invalide); les anciennes restent connues"""
+        material = KeyMaterial(key_b64, iv_b64, self.memo_size)
+        material = self.versions.setdefault(material.fingerprint, material)
+        if material is not self.current:
+            material.activated_at = time.time()
+            self.health.reset()
+        self.current = material
+        return material
+
+    @property
+    def fingerprint(self) -> str:
+        return self.current.fingerprint
+
+    def keys(self) -> dict:
+        return {"key": self.current.key_b64, "iv": self.current.iv_b64}
+
+    def encrypt(self, text: str) -> str:
+        """Chiffre un texte avec AES-256-CBC (mémoïsé par version de clé, CRYPTO_MEMO_SIZE=0 pour désactiver)"""
+        material = self.current
+        if material.memo_size <= 0:
+            return material.encrypt(text)
+        encrypted = self.memoized(text)
+        if encrypted is not None:
+            return encrypted
+        self.memo_misses += 1
+        encrypted = material.encrypt(text)
+        if material.memo and len(material.memo) >= material.memo_size:
+            material.memo.popitem(last=False)
+        material.memo[text] = encrypted
+        return encrypted
+
+    def memoized(self, text: str) -> str | None:
+        """Chiffré déjà mémoïsé pour la clé active (compté comme hit), sinon None"""
+        material = self.current
+        encrypted = material.memo.get(text)
+        if encrypted is not None:
+            material.memo.move_to_end(text)
+            self.memo_hits += 1
+        return encrypted
+
+    def decrypt_bytes(self, encrypted_b64: str) -> bytes:
+        """Déchiffre une réponse AES-256-CBC sans la parser"""
+        return self.current.decrypt(encrypted_b64)
+
+    def decrypt(self, encrypted_b64: str) -> dict:
+        """Déchiffre une réponse AES-256-CBC et parse le JSON"""
+        return jsoncodec.loads(self.decrypt_bytes(encrypted_b64))
+
+    def encrypt_many(self, texts: List[str]) -> List[str]:
+        return [self.encrypt(text) for text in texts]
+
+    def decrypt_many(self, payloads: List[str]) -> List[dict]:
+        return [self.decrypt(payload) for payload in payloads]
+
+    def stats(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "versions": list(self.versions),
+            "memo_entries": len(self.current.memo),
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "health": self.health.stats()
+        }
@@ -0,0 +1,169 @@
+"""
+Cache persistant sur disque (SQLite), derrière le cache mémoire
+"""
+import asyncio
+import os
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+import jsoncodec
+
+# Préfixe des valeurs déjà encodées (bytes), stockées telles quelles: un flux
+# zlib ne commence jamais par un octet nul
+RAW_PREFIX = b"\x00"
+
+
+def encode_value(value: Any, level: int = 6) -> bytes:
+    """JSON compressé, format commun aux backends hors processus"""
+    if isinstance(value, bytes):
+        return RAW_PREFIX + value
+    return zlib.compress(jsoncodec.dumps(value), level)
+
+
+def decode_value(blob: bytes) -> Any:
+    if blob[:1] == RAW_PREFIX:
+        return bytes(blob[1:])
+    return jsoncodec.loads(zlib.decompress(blob))
+
+
+class DiskCache:
+    """
+    Entrées JSON compressées (zlib) avec expiration en temps réel (epoch),
+    pour survivre aux redémarrages du conteneur.
+
+    Les méthodes sont synchrones: depuis la boucle asyncio, passer par run(),
+    qui les exécute dans le thread dédié à la connexion SQLite. Le nombre
+    d'entrées et le volume sont des compteurs, comme pour TTLCache.
+    """
+
+    def __init__(self, path: str, compression_level: int = 6, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.compression_level = compression_level
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.expirations = 0
+        # Un seul thread: les appels sur la connexion restent sérialisés et ordonnés
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " expires REAL NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS leases (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        # Seul comptage complet: au démarrage, sur les entrées persistées
+        self.entries, self.bytes = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Exécute une méthode du cache hors de la boucle asyncio"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def get(self, key: str, count: bool = True) -> Tuple[Any, float] | None:
+        """Retourne (valeur, TTL restant) si l'entrée existe et n'est pas expirée"""
+        row = self._db.execute(
+            "SELECT value, expires FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += count
+            return None
+        remaining = row[1] - self.clock()
+        if remaining <= 0:
+            self.delete(key)
+            self.expirations += 1
+            self.misses += count
+            return None
+        self.hits += count
+        return decode_value(row[0]), remaining
+
+    def set(self, key: str, value: Any, ttl: float):
+        blob = encode_value(value, self.compression_level)
+        previous = self._db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires, size) VALUES (?, ?, ?, ?)",
+            (key, blob, self.clock() + ttl, len(blob))
+        )
+        if previous:
+            self.bytes -= previous[0]
+        else:
+            self.entries += 1
+        self.bytes += len(blob)
+        self.writes += 1
+
+    def delete(self, key: str):
+        row = self._db.execute("DELETE FROM entries WHERE key = ? RETURNING size", (key,)).fetchone()
+        if row:
+            self.entries -= 1
+            self.bytes -= row[0]
+
+    def clear(self):
+        self._db.execute("DELETE FROM entries")
+        self.entries = 0
+        self.bytes = 0
+
+    def purge_expired(self) -> int:
+        """Supprime les entrées expirées (appelé par le nettoyage périodique)"""
+        sizes = self._db.execute("DELETE FROM entries WHERE expires <= ? RETURNING size", (self.clock(),)).fetchall()
+        self.entries -= len(sizes)
+        self.bytes -= sum(size for size, in sizes)
+        self.expirations += len(sizes)
+        return len(sizes)
+
+    def save_state(self, name: str, value: dict):
+        """État conservé hors cache: non effacé par clear ni par l'expiration"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO state (name, value) VALUES (?, ?)", (name, jsoncodec.dumps(value).decode())
+        )
+
+    def load_state(self, name: str) -> dict | None:
+        row = self._db.execute("SELECT value FROM state WHERE name = ?", (name,)).fetchone()
+        return jsoncodec.loads(row[0]) if row else None
+
+    def delete_state(self, name: str):
+        self._db.execute("DELETE FROM state WHERE name = ?", (name,))
+
+    def acquire_lease(self, name: str, owner: str, ttl: float) -> bool:
+        """Bail exclusif entre les processus qui partagent le fichier (une seule requête, atomique)"""
+        now = self.clock()
+        row = self._db.execute(
+            "INSERT INTO leases (name, owner, expires) VALUES (?, ?, ?)"
+            " ON CONFLICT (name) DO UPDATE SET owner = excluded.owner, expires = excluded.expires"
+            " WHERE leases.owner = excluded.owner OR leases.expires <= ?"
+            " RETURNING owner",
+            (name, owner, now + ttl, now)
+        ).fetchone()
+        return row is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Compteurs seulement: les entrées expirées comptent jusqu'au prochain nettoyage"""
+        return {
+            "path": self.path,
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "expirations": self.expirations
+        }
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self._db.close()
@@ -0,0 +1,50 @@
+"""
+Codec JSON interchangeable: orjson si disponible, sinon module standard
+"""
+import json
+import os
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle
+    orjson = None
+
+# "auto" (orjson si installé), "orjson" ou "json"
+JSON_CODEC = os.getenv("JSON_CODEC", "auto")
+
+if JSON_CODEC == "orjson" and orjson is None:
+    raise RuntimeError("JSON_CODEC=orjson mais orjson n'est pas installé")
+
+if orjson is not None and JSON_CODEC in ("auto", "orjson"):
+    name = "orjson"
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps_sorted(value: Any) -> bytes:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+else:
+    name = "json"
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":")).encode()
+
+    def dumps_sorted(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, default=str, separators=(",", ":"), sort_keys=True).encode()
+
+
+def dumps_with(head: dict, key: str, raw: bytes) -> bytes:
+    """
+    Sérialise `head` et y ajoute `key` dont la valeur est déjà du JSON encodé
+    (corps mis en cache), sans le décoder ni le ré-encoder.
+    """
+    encoded = dumps(head)
+    separator = b"," if len(encoded) > 2 else b""
+    return encoded[:-1] + separator + dumps(key) + b":" + raw + b"}"
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Découverte des clés Mahakim sans navigateur: page d'accueil de l'application,
+téléchargement parallèle des fichiers JS et recherche des clés au fil du flux
+
+    python key_discovery.py                                  # site de Mahakim
+    python key_discovery.py --url http://localhost:8001/     # copie locale servie en HTTP
+    python key_discovery.py --dir bundles/ --sample <chiffré> # fichiers enregistrés, hors ligne
+"""
+import argparse
+import asyncio
+import hashlib
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+
+MAHAKIM_URL = "https://www.mahakim.ma/"
+
+# Chaînes base64 de 44 caractères (KEY, 32 octets) et de 24 caractères (IV, 16 octets)
+KEY_PATTERN = re.compile(rb'"([A-Za-z0-9+/]{43}=)"')
+IV_PATTERN = re.compile(rb'"([A-Za-z0-9+/]{22}==)"')
+
+# Fichiers JS de la page d'accueil, puis chunks chargés à la demande par les bundles
+SCRIPT_SRC = re.compile(rb'<script[^>]+src=["\']([^"\']+\.js)["\']', re.I)
+CHUNK_REF = re.compile(rb'["\']((?:[\w-]+/)*[\w.-]+\.js)["\']')
+# Table du runtime webpack (Angular): {592:"a1b2c3d4e5f6a7b8"} -> 592.a1b2c3d4e5f6a7b8.js
+CHUNK_MAP = re.compile(rb'(\d+|"[\w-]+"):"([0-9a-f]{16,20})"')
+# Empreinte de contenu dans le nom du fichier (main.3f2a...js): inutile de le retélécharger
+NAME_HASH = re.compile(r"[.-]([0-9a-f]{16,20})\.js$")
+
+CHUNK_SIZE = 65536
+# Recouvrement entre deux morceaux du flux pour ne pas couper une chaîne recherchée
+OVERLAP = 256
+MAX_BUNDLES = 150
+MAX_DEPTH = 3
+
+
+class BundleScan:
+    """Candidats et références trouvés dans un fichier JS (lu morceau par morceau)"""
+
+    def __init__(self):
+        self.keys: Dict[str, None] = {}
+        self.ivs: Dict[str, None] = {}
+        self.refs: Dict[str, None] = {}
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._tail = b""
+
+    def feed(self, chunk: bytes):
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        window = self._tail + chunk
+        for match in KEY_PATTERN.finditer(window):
+            self.keys.setdefault(match.group(1).decode(), None)
+        for match in IV_PATTERN.finditer(window):
+            self.ivs.setdefault(match.group(1).decode(), None)
+        for match in CHUNK_REF.finditer(window):
+            self.refs.setdefault(match.group(1).decode(), None)
+        for match in CHUNK_MAP.finditer(window):
+            chunk_id = match.group(1).decode().strip('"')
+            self.refs.setdefault(f"{chunk_id}.{match.group(2).decode()}.js", None)
+        self._tail = window[-OVERLAP:]
+
+    @property
+    def digest(self) -> str:
+        return self._hash.hexdigest()[:20]
+
+    def as_dict(self) -> dict:
+        return {"digest": self.digest, "size": self.size, "keys": list(self.keys), "ivs": list(self.ivs)}
+
+
+def scan_bytes(chunks: Iterable[bytes]) -> BundleScan:
+    scan = BundleScan()
+    for chunk in chunks:
+        scan.feed(chunk)
+    return scan
+
+
+def scan_file(path: Path) -> BundleScan:
+    """Fichier JS enregistré, lu par morceaux comme un téléchargement"""
+    with open(path, "rb") as f:
+        return scan_bytes(iter(lambda: f.read(CHUNK_SIZE), b""))
+
+
+def collect_candidates(scans: Iterable[BundleScan]) -> Tuple[List[str], List[str]]:
+    """Clés et IV dans l'ordre de découverte, sans doublon"""
+    keys: Dict[str, None] = {}
+    ivs: Dict[str, None] = {}
+    for scan in scans:
+        keys.update(scan.keys)
+        ivs.update(scan.ivs)
+    return list(keys), list(ivs)
+
+
+class KeyDiscovery:
+    """
+    Parcourt l'application Mahakim: page d'accueil, bundles et chunks référencés
+    (jusqu'à MAX_DEPTH niveaux), téléchargés en parallèle. Les analyses sont
+    gardées par empreinte de contenu: un bundle inchangé n'est pas réanalysé
+    (ni retéléchargé si son nom porte l'empreinte ou si le serveur répond 304).
+    """
+
+    def __init__(self, base_url: str = MAHAKIM_URL, concurrency: int = 6, timeout: float = 20,
+                 transport: httpx.AsyncBaseTransport = None):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.transport = transport
+        self.scans: Dict[str, BundleScan] = {}
+        # URL -> (empreinte, ETag, Last-Modified) du dernier téléchargement
+        self.validators: Dict[str, Tuple[str, str | None, str | None]] = {}
+        self.last_report: dict = {}
+
+    async def run(self) -> Tuple[List[str], List[str]]:
+        """(clés candidates, IV candidats) trouvés dans les fichiers JS de l'application"""
+        started = time.perf_counter()
+        report = {"bundles": 0, "downloaded": 0, "not_modified": 0, "skipped": 0, "errors": 0, "bytes": 0}
+        async with httpx.AsyncClient(transport=self.transport, timeout=self.timeout, follow_redirects=True,
+                                     headers={"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"}) as client:
+            response = await client.get(self.base_url)
+            response.raise_for_status()
+            base = str(response.url)
+            match = re.search(rb'<base\s+href=["\']([^"\']*)["\']', response.content, re.I)
+            if match:
+                base = urljoin(base, match.group(1).decode())
+            pending = [urljoin(base, src.decode()) for src in SCRIPT_SRC.findall(response.content)]
+            seen = set(pending)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            found: List[BundleScan] = []
+
+            async def fetch(url: str) -> BundleScan | None:
+                async with semaphore:
+                    try:
+                        scan, outcome = await self._scan_url(client, url)
+                    except httpx.HTTPError:
+                        report["errors"] += 1
+                        return None
+                report[outcome] += 1
+                return scan
+
+            for _ in range(MAX_DEPTH):
+                if not pending:
+                    break
+                scans = [scan for scan in await asyncio.gather(*(fetch(url) for url in pending)) if scan]
+                found += scans
+                pending = []
+                for scan in scans:
+                    for ref in scan.refs:
+                        url = urljoin(base, ref)
+                        if url not in seen and len(seen) < MAX_BUNDLES and urlsplit(url).netloc == urlsplit(base).netloc:
+                            seen.add(url)
+                            pending.append(url)
+
+        report["bundles"] = len(found)
+        report["bytes"] = sum(scan.size for scan in found)
+        keys, ivs = collect_candidates(found)
+        report.update(keys=len(keys), ivs=len(ivs), duration=round(time.perf_counter() - started, 2))
+        self.last_report = report
+        return keys, ivs
+
+    async def _scan_url(self, client: httpx.AsyncClient, url: str) -> Tuple[BundleScan, str]:
+        """Analyse d'un bundle -> (analyse, "downloaded" | "not_modified" | "skipped")"""
+        known = self.validators.get(url)
+        name_hash = NAME_HASH.search(urlsplit(url).path)
+        if known and name_hash and known[0] in self.scans:
+            return self.scans[known[0]], "skipped"
+        headers = {}
+        if known and known[0] in self.scans:
+            if known[1]:
+                headers["If-None-Match"] = known[1]
+            if known[2]:
+                headers["If-Modified-Since"] = known[2]
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304:
+                return self.scans[known[0]], "not_modified"
+            response.raise_for_status()
+            scan = BundleScan()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                scan.feed(chunk)
+        # Même contenu sous une autre URL: l'analyse existante est reprise
+        scan = self.scans.setdefault(scan.digest, scan)
+        self.validators[url] = (scan.digest, response.headers.get("etag"), response.headers.get("last-modified"))
+        return scan, "downloaded"
+
+
+def main():
+    from crypto import trial_decrypt
+
+    parser = argparse.ArgumentParser(description="Cherche les clés AES de Mahakim dans ses fichiers JS")
+    parser.add_argument("--url", default=MAHAKIM_URL, help="Page d'accueil de l'application")
+    parser.add_argument("--dir", help="Dossier de fichiers JS enregistrés (hors ligne, remplace --url)")
+    parser.add_argument("--sample", help="Réponse chiffrée (champ data) pour valider les candidats")
+    parser.add_argument("--concurrency", type=int, default=6, help="Téléchargements simultanés")
+    args = parser.parse_args()
+
+    if args.dir:
+        paths = sorted(Path(args.dir).rglob("*.js"))
+        keys, ivs = collect_candidates(scan_file(path) for path in paths)
+        print(f"📦 {len(paths)} fichiers JS analysés")
+    else:
+        discovery = KeyDiscovery(args.url, args.concurrency)
+        keys, ivs = asyncio.run(discovery.run())
+        report = discovery.last_report
+        print(f"📦 {report['bundles']} fichiers JS analysés ({report['bytes'] // 1024} Ko, "
+              f"{report['errors']} erreurs) en {report['duration']}s")
+
+    for key in keys:
+        print(f"  🔑 KEY candidate: {key}")
+    for iv in ivs:
+        print(f"  🧭 IV candidat: {iv}")
+    if not args.sample:
+        sys.exit(0 if keys and ivs else 1)
+    for key in keys:
+        for iv in ivs:
+            if trial_decrypt(key, iv, args.sample):
+                print(f"✅ Clés validées sur l'échantillon:\n   KEY: {key}\n   IV:  {iv}")
+                sys.exit(0)
+    print("❌ Aucun couple candidat ne déchiffre l'échantillon")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Récupération automatique des clés après un changement côté Mahakim:
+découverte de candidats, validation par déchiffrement d'un échantillon, bascule
+"""
+import itertools
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Iterable, List, Tuple
+
+from crypto import trial_decrypt
+
+# Découverte: () -> (clés candidates, IV candidats)
+Discover = Callable[[], Awaitable[Tuple[List[str], List[str]]]]
+
+
+def find_valid_keys(pairs: Iterable[Tuple[str, str]], sample: str) -> Tuple[str, str] | None:
+    """Premier couple (clé, IV) qui déchiffre l'échantillon, s'il y en a un"""
+    for key_b64, iv_b64 in pairs:
+        if trial_decrypt(key_b64, iv_b64, sample):
+            return key_b64, iv_b64
+    return None
+
+
+class KeyRecovery:
+    """Tentatives de récupération, espacées d'au moins `interval` secondes"""
+
+    def __init__(self, discover: Discover, interval: float):
+        self.discover = discover
+        self.interval = interval
+        self.status = "idle"
+        self.attempts = 0
+        self.candidates_tested = 0
+        self.last_attempt: float | None = None
+        self.last_error: str | None = None
+        self.last_swap: float | None = None
+
+    def due(self, now: float) -> bool:
+        return self.last_attempt is None or now - self.last_attempt >= self.interval
+
+    async def attempt(self, sample: str, known: List[Tuple[str, str]]) -> Tuple[str, str] | None:
+        """
+        Cherche une clé qui déchiffre `sample`: d'abord parmi les versions déjà
+        connues (retour à une ancienne clé), puis parmi les candidats découverts.
+        """
+        self.attempts += 1
+        self.last_attempt = time.time()
+        self.last_error = None
+        self.status = "discovering"
+        try:
+            found = find_valid_keys(known, sample)
+            self.candidates_tested += len(known)
+            if found is None:
+                keys, ivs = await self.discover()
+                pairs = list(itertools.product(keys, ivs))
+                found = find_valid_keys(pairs, sample)
+                self.candidates_tested += len(pairs)
+                if found is None:
+                    self.last_error = f"Aucun des {len(pairs)} couples candidats ne déchiffre l'échantillon"
+        except Exception as e:
+            self.last_error = f"Découverte en échec: {str(e) or type(e).__name__}"
+            found = None
+        if found is None:
+            self.status = "failed"
+            return None
+        self.status = "swapped"
+        self.last_swap = time.time()
+        return found
+
+    def stats(self) -> dict:
+        return {
+            "status": self.status,
+            "attempts": self.attempts,
+            "candidates_tested": self.candidates_tested,
+            "last_attempt": datetime.fromtimestamp(self.last_attempt).isoformat() if self.last_attempt else None,
+            "last_error": self.last_error,
+            "last_swap": datetime.fromtimestamp(self.last_swap).isoformat() if self.last_swap else None
+        }
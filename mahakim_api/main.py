@@ -2,104 +2,446 @@
 """
 API FastAPI pour Mahakim - Simple et efficace
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from pydantic import BaseModel
 import httpx
-import base64
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
 import secrets
 import json
-from datetime import datetime, timedelta
-from typing import Dict, Any
+import asyncio
+import logging
+import time
+from datetime import datetime
+from contextlib import asynccontextmanager
+from typing import List
+from urllib.parse import urlsplit
 import os
+import re
+import zlib
 
-app = FastAPI(title="Mahakim API")
+import changes
+import jsoncodec
+import metrics
+import packed
+import timing
+import upstream
+from cache import TTLCache
+from cache_backends import LocalBackend, RedisBackend
+from crypto import CryptoEngine, DecryptHealth, trial_decrypt
+from key_discovery import KeyDiscovery
+from key_rotation import KeyRecovery
+from resilience import CircuitOpenError, backoff_delay
+from disk_cache import DiskCache
+from packed import PackedEntry
+from prefetch import PrefetchJob, parse_dossiers
+from projection import Projection
+from singleflight import SingleFlight
+from watchlist import Watch, Watchlist
 
-# === Cache simple en mémoire ===
-cache: Dict[str, Dict[str, Any]] = {}
+_logger = logging.getLogger(__name__)
 
-# === Clés de chiffrement (modifiables dynamiquement) ===
-crypto_keys = {
-    "key": os.getenv("CRYPTO_KEY", "qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ="),
-    "iv": os.getenv("CRYPTO_IV", "k3vi7ZFUB8/XSID2AXEwug==")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Ouvre le client HTTP et le backend de cache, lance les tâches de fond; les arrête à la fin"""
+    upstream.open_client()
+    await cache_backend.start()
+    await load_shared_keys()
+    watchlist.load(await cache_backend.load_state("watchlist"))
+    tasks = [
+        asyncio.create_task(run_cache_sweeper()),
+        asyncio.create_task(run_event_listener()),
+        asyncio.create_task(run_key_recovery())
+    ]
+    if watch_enabled:
+        tasks.append(asyncio.create_task(run_watch_scheduler()))
+    else:
+        _logger.warning("Suivi désactivé: %d workers sans état partagé (CACHE_BACKEND=redis ou CACHE_DISK_PATH requis)",
+                        WEB_CONCURRENCY)
+    yield
+    for task in tasks:
+        task.cancel()
+    await cache_backend.close()
+    await upstream.close_client()
+
+app = FastAPI(title="Mahakim API", lifespan=lifespan)
+
+@app.middleware("http")
+async def track_requests(request: Request, call_next):
+    """Requêtes en cours et durée par route (gabarit, pas l'URL brute)"""
+    start = time.perf_counter()
+    status = 500
+    try:
+        with metrics.API_INFLIGHT.track_inprogress():
+            response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        metrics.API_LATENCY.labels(
+            route.path if route is not None else "inconnue", str(status)
+        ).observe(time.perf_counter() - start)
+
+# Surchargeable pour viser le faux Mahakim des benchmarks (bench/mock_mahakim.py)
+BASE_URL = os.getenv("MAHAKIM_BASE_URL", "https://www.mahakim.ma/middleware/api/SuiviDossiers")
+
+# Délai maximum (secondes) pour chacun des appels secondaires
+SECTION_TIMEOUT = float(os.getenv("SECTION_TIMEOUT", "15"))
+
+# === Lot de dossiers (POST /dossiers/batch) ===
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "4"))
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "16"))
+
+# === TTL par section: les parties changent rarement, les décisions souvent ===
+SECTION_TTLS = {
+    "carte": float(os.getenv("TTL_CARTE", "43200")),
+    "decisions": float(os.getenv("TTL_DECISIONS", "21600")),
+    "parties": float(os.getenv("TTL_PARTIES", "604800")),
+    "expertises": float(os.getenv("TTL_EXPERTISES", "86400"))
 }
 
+# Retard maximum (secondes) pendant lequel une section périmée est servie
+# immédiatement puis rafraîchie en arrière-plan (surchargeable par ?max-stale=)
+CACHE_MAX_STALE = float(os.getenv("CACHE_MAX_STALE", "86400"))
+
+# Échec de la récupération de la carte (Mahakim injoignable, pas dossier inconnu)
+FETCH_ERROR = "Erreur de récupération"
+NOT_FOUND = "Dossier introuvable"
+
+# Formats acceptés avant tout chiffrement ou appel réseau (ex: 13 / 202512028569)
+JURIDICTION_PATTERN = re.compile(os.getenv("JURIDICTION_PATTERN", r"\d{1,6}"))
+DOSSIER_PATTERN = re.compile(os.getenv("DOSSIER_PATTERN", r"(19|20)\d{2}\d{4}\d{1,8}"))
+
+# Dossiers introuvables mis en cache (secondes): évite de réinterroger Mahakim à chaque retry
+NEGATIVE_TTL = float(os.getenv("NEGATIVE_TTL", "600"))
+
+# Appels secondaires: section -> (endpoint Mahakim, nom du paramètre ID)
+SECONDARY_SECTIONS = {
+    "decisions": ("ListeDicisions", "idDossiers"),
+    "parties": ("ListeParties", "idDoss"),
+    "expertises": ("ListeExpertisesJudiciaire", "idDossiers")
+}
+
+# === Préchargement du cache (POST /cache/prefetch) ===
+PREFETCH_RATE = float(os.getenv("PREFETCH_RATE", "1"))
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", "2"))
+PREFETCH_MAX_ITEMS = int(os.getenv("PREFETCH_MAX_ITEMS", "10000"))
+# Tâches récentes conservées, période de publication de leur progression (secondes)
+PREFETCH_MAX_JOBS = 20
+PREFETCH_REPORT_INTERVAL = 1
+
+# === Backend de cache: "local" (par processus) ou "redis" (partagé entre workers) ===
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "local")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_PREFIX = os.getenv("REDIS_PREFIX", "mahakim:")
+
+# === Cache en mémoire borné (TTL + LRU) ===
+# Une entrée est conservée tant qu'une de ses sections peut encore être servie
+CACHE_TTL = max(SECTION_TTLS.values()) + CACHE_MAX_STALE
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_MB", "256")) * 1024 * 1024
+CACHE_SWEEP_INTERVAL = float(os.getenv("CACHE_SWEEP_INTERVAL", "60"))
+
+# === Cache persistant sur disque (optionnel, survit aux redémarrages) ===
+CACHE_DISK_PATH = os.getenv("CACHE_DISK_PATH", "")
+CACHE_DISK_COMPRESSION = int(os.getenv("CACHE_DISK_COMPRESSION", "6"))
+
+# === Historique des changements par dossier (GET /dossier/.../changes) ===
+CHANGES_MAX = int(os.getenv("CHANGES_MAX", "20"))
+CHANGES_TTL = float(os.getenv("CHANGES_TTL", str(30 * 86400)))
+
+# === Liste de suivi: consultation planifiée selon l'urgence (POST /watchlist) ===
+WATCH_CALLBACK_URL = os.getenv("WATCH_CALLBACK_URL", "")
+# Hôtes autorisés pour un callback_url fourni à l'inscription (sinon seul WATCH_CALLBACK_URL)
+WATCH_CALLBACK_HOSTS = {host.strip().lower() for host in os.getenv("WATCH_CALLBACK_HOSTS", "").split(",") if host.strip()}
+WATCH_CALLBACK_TIMEOUT = float(os.getenv("WATCH_CALLBACK_TIMEOUT", "10"))
+# Budget global de consultations des dossiers suivis (par minute, un seul worker planifie)
+WATCH_RATE = float(os.getenv("WATCH_RATE", "30"))
+WATCH_CONCURRENCY = int(os.getenv("WATCH_CONCURRENCY", "2"))
+WATCH_INTERVALS = {
+    "urgent": float(os.getenv("WATCH_INTERVAL_URGENT", "1800")),
+    "soon": float(os.getenv("WATCH_INTERVAL_SOON", "21600")),
+    "default": float(os.getenv("WATCH_INTERVAL_DEFAULT", "86400")),
+    "closed": float(os.getenv("WATCH_INTERVAL_CLOSED", "604800"))
+}
+WATCH_RETRY_INTERVAL = float(os.getenv("WATCH_RETRY_INTERVAL", "900"))
+WATCH_LEASE_TTL = 30
+# Workers uvicorn/gunicorn (--workers vaut WEB_CONCURRENCY par défaut)
+WEB_CONCURRENCY = upstream.WEB_CONCURRENCY
+
+if WATCH_RATE <= 0:
+    raise RuntimeError("WATCH_RATE doit être strictement positif (consultations par minute)")
+if WATCH_CONCURRENCY < 1:
+    raise RuntimeError("WATCH_CONCURRENCY doit valoir au moins 1")
+if min(WATCH_INTERVALS.values()) <= 0 or WATCH_RETRY_INTERVAL <= 0:
+    raise RuntimeError("WATCH_INTERVAL_* et WATCH_RETRY_INTERVAL doivent être strictement positifs")
+
+# === Détection d'un changement de clé Mahakim et récupération automatique ===
+# Clé suspecte si au moins KEY_FAILURE_THRESHOLD des KEY_FAILURE_WINDOW derniers déchiffrements échouent
+KEY_FAILURE_WINDOW = int(os.getenv("KEY_FAILURE_WINDOW", "50"))
+KEY_FAILURE_THRESHOLD = float(os.getenv("KEY_FAILURE_THRESHOLD", "0.5"))
+KEY_FAILURE_MIN_SAMPLES = int(os.getenv("KEY_FAILURE_MIN_SAMPLES", "5"))
+KEY_RECOVERY = os.getenv("KEY_RECOVERY", "true").lower() == "true"
+# Délai minimum entre deux découvertes (secondes)
+KEY_RECOVERY_INTERVAL = float(os.getenv("KEY_RECOVERY_INTERVAL", "300"))
+KEY_DISCOVERY_URL = os.getenv("KEY_DISCOVERY_URL", "https://www.mahakim.ma/")
+KEY_DISCOVERY_CONCURRENCY = int(os.getenv("KEY_DISCOVERY_CONCURRENCY", "6"))
+KEY_CHECK_INTERVAL = 15
+
+if CACHE_BACKEND == "redis":
+    cache_backend = RedisBackend(REDIS_URL, REDIS_PREFIX, CACHE_DISK_COMPRESSION)
+else:
+    cache_backend = LocalBackend(
+        TTLCache(max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES, default_ttl=CACHE_TTL),
+        DiskCache(CACHE_DISK_PATH, CACHE_DISK_COMPRESSION) if CACHE_DISK_PATH else None
+    )
+
+# Rafraîchissements en arrière-plan (stale-while-revalidate)
+background_tasks = set()
+swr_stats = {"stale_served": 0, "refreshes": 0, "refresh_errors": 0, "degraded_served": 0}
+negative_stats = {"hits": 0, "stored": 0, "invalid_rejected": 0}
+
+# Tâches de préchargement lancées par ce worker; leur progression est publiée
+# dans l'état partagé (prefetch:<id>) pour être suivie depuis n'importe quel worker
+prefetch_jobs = {}
+
+# Identifiant du worker, pour ignorer ses propres événements diffusés
+WORKER_ID = secrets.token_hex(8)
+
+# Récupérations Mahakim en cours, partagées par les requêtes concurrentes
+dossier_flights = SingleFlight()
+
+# Dossiers suivis; le planificateur ne tourne que sur le worker qui détient le bail
+watchlist = Watchlist(WATCH_INTERVALS, WATCH_RETRY_INTERVAL)
+watch_leader = False
+# Sans état partagé (backend local sans disque), chaque worker aurait ses propres
+# inscriptions et planifierait seul: le suivi n'est alors permis qu'avec un worker
+watch_enabled = cache_backend.shared or WEB_CONCURRENCY <= 1
+
+metrics.register_cache_collector(cache_backend, dossier_flights)
+
+# === Clés de chiffrement (modifiables dynamiquement) ===
+crypto = CryptoEngine(
+    os.getenv("CRYPTO_KEY", "qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ="),
+    os.getenv("CRYPTO_IV", "k3vi7ZFUB8/XSID2AXEwug=="),
+    memo_size=int(os.getenv("CRYPTO_MEMO_SIZE", "4096")),
+    health=DecryptHealth(KEY_FAILURE_WINDOW, KEY_FAILURE_THRESHOLD, KEY_FAILURE_MIN_SAMPLES)
+)
+metrics.CRYPTO_KEY_SUSPECT.set_function(lambda: float(crypto.health.suspect))
+
+# Candidats cherchés dans les fichiers JS de Mahakim (analyses gardées d'une tentative à l'autre)
+key_discovery = KeyDiscovery(KEY_DISCOVERY_URL, KEY_DISCOVERY_CONCURRENCY)
+key_recovery = KeyRecovery(key_discovery.run, KEY_RECOVERY_INTERVAL)
+
 class DossierRequest(BaseModel):
     id_dossier: str
     id_juridiction: str
 
+class BatchItem(DossierRequest):
+    # ETag déjà connu de l'appelant: le dossier n'est pas renvoyé s'il n'a pas changé
+    etag: str | None = None
+
+class BatchRequest(BaseModel):
+    dossiers: List[BatchItem]
+    concurrency: int | None = None
+
 class KeysUpdate(BaseModel):
     key: str
     iv: str
 
+class WatchRequest(BaseModel):
+    dossiers: List[DossierRequest]
+    callback_url: str | None = None
+
 def encrypt(text: str) -> str:
-    """Chiffre un texte avec AES-256-CBC"""
-    key = base64.b64decode(crypto_keys["key"])
-    iv = base64.b64decode(crypto_keys["iv"])
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    encrypted = cipher.encrypt(pad(text.encode(), AES.block_size))
-    return base64.b64encode(encrypted).decode()
+    """Chiffre un texte avec AES-256-CBC (seuls les chiffrés hors mémo sont mesurés)"""
+    encrypted = crypto.memoized(text)
+    if encrypted is not None:
+        return encrypted
+    with timing.span("encrypt"), metrics.CRYPTO_DURATION.labels("encrypt").time():
+        return crypto.encrypt(text)
 
 def decrypt(encrypted_b64: str) -> dict:
     """Déchiffre une réponse AES-256-CBC"""
-    key = base64.b64decode(crypto_keys["key"])
-    iv = base64.b64decode(crypto_keys["iv"])
-    encrypted = base64.b64decode(encrypted_b64)
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    decrypted = unpad(cipher.decrypt(encrypted), AES.block_size)
-    return json.loads(decrypted.decode())
-
-def get_cache(cache_key: str) -> dict | None:
+    try:
+        with timing.span("decrypt"), metrics.CRYPTO_DURATION.labels("decrypt").time():
+            decrypted = crypto.decrypt_bytes(encrypted_b64)
+        with timing.span("json"):
+            result = jsoncodec.loads(decrypted)
+    except Exception:
+        # Échecs répétés: Mahakim a probablement changé de clé
+        crypto.health.record(False, encrypted_b64)
+        raise
+    crypto.health.record(True)
+    return result
+
+async def get_cache(cache_key: str) -> PackedEntry | None:
     """Récupère depuis le cache si valide"""
-    if cache_key in cache:
-        entry = cache[cache_key]
-        if datetime.fromisoformat(entry["expires"]) > datetime.now():
-            return entry["data"]
-        del cache[cache_key]
-    return None
-
-def set_cache(cache_key: str, data: dict):
-    """Met en cache pour 24h"""
-    cache[cache_key] = {
-        "data": data,
-        "expires": (datetime.now() + timedelta(days=1)).isoformat()
-    }
+    with timing.span("cache"):
+        blob = await cache_backend.get(cache_key)
+    # Entrée au format antérieur (cache disque ou Redis): ignorée
+    if not isinstance(blob, bytes):
+        return None
+    try:
+        return PackedEntry.unpack(blob)
+    except (KeyError, ValueError):
+        return None
+
+async def set_cache(cache_key: str, entry: PackedEntry):
+    """Met en cache jusqu'à ce que la section la plus durable ne soit plus servable"""
+    await cache_backend.set(cache_key, entry.pack(), CACHE_TTL)
+
+async def run_cache_sweeper():
+    """Nettoyage périodique des entrées expirées"""
+    while True:
+        await asyncio.sleep(CACHE_SWEEP_INTERVAL)
+        await cache_backend.sweep()
+
+async def apply_keys(key: str, iv: str):
+    """
+    Active des clés sur ce worker et les diffuse aux autres. Le cache n'est pas
+    vidé: les entrées d'une autre version de clé sont rafraîchies à leur prochaine lecture.
+    """
+    crypto.set_keys(key, iv)
+    await cache_backend.save_state("keys", {"key": key, "iv": iv})
+    await cache_backend.publish({"type": "keys", "origin": WORKER_ID, "key": key, "iv": iv})
+
+async def adopt_shared_keys(sample: str) -> bool:
+    """
+    Reprend les clés enregistrées par un autre worker (récupération ou PUT /keys)
+    si elles déchiffrent l'échantillon en échec. Sans diffusion (backend local
+    avec disque), c'est ainsi qu'elles parviennent aux autres workers.
+    """
+    keys = await cache_backend.load_state("keys")
+    if not keys or keys == crypto.keys() or not trial_decrypt(keys["key"], keys["iv"], sample):
+        return False
+    crypto.set_keys(keys["key"], keys["iv"])
+    return True
+
+async def check_keys():
+    """Clé suspecte: reprend les clés partagées, sinon cherche la nouvelle clé et l'active"""
+    sample = crypto.health.sample
+    if not crypto.health.suspect or sample is None:
+        return
+    if await adopt_shared_keys(sample):
+        _logger.warning("Clé %s reprise de l'état partagé", crypto.fingerprint)
+        return
+    if not key_recovery.due(time.time()):
+        return
+    # Un seul worker à la fois interroge le site de Mahakim
+    if not await cache_backend.acquire_lease("key_recovery", WORKER_ID, KEY_RECOVERY_INTERVAL):
+        return
+    _logger.warning("Clé %s suspecte (%.0f%% d'échecs): recherche d'une nouvelle clé",
+                    crypto.fingerprint, 100 * crypto.health.failure_rate)
+    known = [(m.key_b64, m.iv_b64) for m in crypto.versions.values() if m is not crypto.current]
+    found = await key_recovery.attempt(sample, known)
+    if found is None:
+        _logger.warning("Récupération des clés en échec: %s", key_recovery.last_error)
+        return
+    await apply_keys(*found)
+    _logger.warning("Nouvelle clé %s activée", crypto.fingerprint)
+
+async def run_key_recovery():
+    """Vérifie la clé active toutes les KEY_CHECK_INTERVAL secondes"""
+    while KEY_RECOVERY:
+        await asyncio.sleep(KEY_CHECK_INTERVAL)
+        await check_keys()
+
+async def load_shared_keys():
+    """Reprend les clés publiées par un autre worker (backend partagé)"""
+    keys = await cache_backend.load_state("keys")
+    if keys:
+        crypto.set_keys(keys["key"], keys["iv"])
+
+async def run_event_listener():
+    """Applique les changements de clés publiés par les autres workers"""
+    async for event in cache_backend.events():
+        if event.get("origin") == WORKER_ID:
+            continue
+        if event.get("type") == "keys":
+            crypto.set_keys(event["key"], event["iv"])
+        elif event.get("type") == "watchlist":
+            watchlist.load(await cache_backend.load_state("watchlist"))
 
 async def fetch_url(url: str, params: dict) -> dict:
-    """Fait une requête HTTP et déchiffre la réponse"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
-        "Accept": "application/json",
-        "Referer": "https://www.mahakim.ma/"
-    }
-    async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        
-        # Essayer de parser le JSON
-        try:
-            result = response.json()
-        except json.JSONDecodeError:
-            return {"error": "Réponse non-JSON", "text": response.text[:500]}
-        
-        # Si la réponse contient des données chiffrées
-        if isinstance(result, dict):
-            # Essayer avec "data" (Mahakim retourne soit "succes" soit "status")
-            encrypted_data = result.get("data")
-            if encrypted_data and isinstance(encrypted_data, str):
-                try:
-                    decrypted = decrypt(encrypted_data)
-                    result["data_decrypted"] = decrypted
-                    return decrypted
-                except Exception as e:
-                    result["decrypt_error"] = str(e)
-        
-        return result
+    """Fait une requête HTTP (client partagé, débit régulé) et déchiffre la réponse"""
+    with timing.span(metrics.endpoint_name(url)):
+        response = await upstream.get(url, params)
+    response.raise_for_status()
+    
+    # Essayer de parser le JSON
+    try:
+        with timing.span("json"):
+            result = jsoncodec.loads(response.content)
+    except json.JSONDecodeError:
+        metrics.UPSTREAM_ERRORS.labels(metrics.endpoint_name(url), "non_json").inc()
+        return {"error": "Réponse non-JSON", "text": response.text[:500]}
+    
+    # Si la réponse contient des données chiffrées
+    if isinstance(result, dict):
+        # Essayer avec "data" (Mahakim retourne soit "succes" soit "status")
+        encrypted_data = result.get("data")
+        if encrypted_data and isinstance(encrypted_data, str):
+            try:
+                decrypted = decrypt(encrypted_data)
+                result["data_decrypted"] = decrypted
+                return decrypted
+            except Exception as e:
+                metrics.UPSTREAM_ERRORS.labels(metrics.endpoint_name(url), "decrypt").inc()
+                result["decrypt_error"] = str(e)
+    
+    return result
 
-async def process_dossier(juridiction_enc: str, dossier_enc: str, csrf: str) -> dict:
-    """Traite un dossier et retourne toutes ses données"""
-    base_url = "https://www.mahakim.ma/middleware/api/SuiviDossiers"
+async def fetch_section(url: str, params: dict) -> dict:
+    """Appel secondaire borné par SECTION_TIMEOUT"""
+    try:
+        return await asyncio.wait_for(fetch_url(url, params), SECTION_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise TimeoutError(f"Délai dépassé ({SECTION_TIMEOUT:g}s)")
+
+def dossier_ref(carte: dict) -> dict | None:
+    """IDs internes nécessaires aux appels secondaires (civil ou pénal)"""
+    # Dossiers civils utilisent "idDossierCivil", pénaux utilisent "id"
+    id_dossier_interne = carte.get("idDossierCivil") or carte.get("id")
+    if not id_dossier_interne:
+        return None
+    return {"id": str(id_dossier_interne), "affaire": carte.get("affaire", "DC")}
+
+async def fetch_sections(ref: dict, names: list, csrf: str) -> tuple:
+    """Exécute les appels secondaires demandés en parallèle -> (résultats, erreurs)"""
+    # Chiffrer les nouveaux paramètres
+    id_dossier_enc, type_affaire_enc = encrypt(ref["id"]), encrypt(ref["affaire"])
+    
+    calls = {}
+    for name in names:
+        endpoint, id_param = SECONDARY_SECTIONS[name]
+        params = {
+            id_param: id_dossier_enc,
+            "typeaffaire": type_affaire_enc,
+            "csrt": csrf
+        }
+        calls[name] = fetch_section(f"{BASE_URL}/{endpoint}", params)
+    responses = await asyncio.gather(*calls.values(), return_exceptions=True)
+    
+    results = {}
+    errors = {}
+    for name, response in zip(calls, responses):
+        if isinstance(response, Exception):
+            # Une section en échec ne fait pas perdre les autres
+            errors[name] = str(response).split("\n")[0] or type(response).__name__
+        elif isinstance(response, dict) and "decrypt_error" in response:
+            # Clé périmée: surtout ne pas mettre en cache la réponse chiffrée
+            errors[name] = f"Déchiffrement impossible: {response['decrypt_error']}"
+        else:
+            results[name] = response
+    return results, errors
+
+async def process_dossier(juridiction_enc: str, dossier_enc: str, csrf: str,
+                          sections: list = None) -> dict:
+    """Traite un dossier et retourne toutes ses données (ou la carte + les sections demandées)"""
+    base_url = BASE_URL
+    sections = list(SECONDARY_SECTIONS) if sections is None else sections
     
     # ÉTAPE 1: Récupérer la carte du dossier
     params_carte = {
@@ -110,9 +452,13 @@ async def process_dossier(juridiction_enc: str, dossier_enc: str, csrf: str) ->
     
     try:
         carte = await fetch_url(f"{base_url}/CarteDossier", params_carte)
+    except (httpx.HTTPError, CircuitOpenError):
+        # Mahakim injoignable ou disjoncteur ouvert: fetch_dossier répond 502/503
+        # (ou sert l'entrée périmée) au lieu d'un 200 portant une erreur
+        raise
     except Exception as e:
         return {
-            "error": "Erreur de récupération",
+            "error": FETCH_ERROR,
             "message": f"Impossible de récupérer le dossier: {str(e)}",
             "carte": {}
         }
@@ -120,192 +466,741 @@ async def process_dossier(juridiction_enc: str, dossier_enc: str, csrf: str) ->
     # Vérifier si le dossier existe et extraire l'ID interne
     if not isinstance(carte, dict) or "error" in carte:
         return {
-            "error": "Dossier introuvable",
+            "error": NOT_FOUND,
             "message": "Le numéro de dossier ou la juridiction est invalide",
             "carte": carte if isinstance(carte, dict) else {}
         }
     
     # ÉTAPE 2: Extraire les IDs nécessaires (civil ou pénal)
-    # Dossiers civils utilisent "idDossierCivil", pénaux utilisent "id"
-    id_dossier_interne = carte.get("idDossierCivil") or carte.get("id")
+    ref = dossier_ref(carte)
     
-    if not id_dossier_interne:
+    if not ref:
         return {
-            "error": "Dossier introuvable",
+            "error": NOT_FOUND,
             "message": "Impossible d'extraire l'ID du dossier",
             "carte": carte
         }
     
-    id_dossier_interne = str(id_dossier_interne)
-    type_affaire = carte.get("affaire", "DC")
+    # ÉTAPE 3: Exécuter les autres requêtes en parallèle (indépendantes entre elles)
+    fetched, errors = await fetch_sections(ref, sections, csrf)
     
-    # Chiffrer les nouveaux paramètres
-    id_dossier_enc = encrypt(id_dossier_interne)
-    type_affaire_enc = encrypt(type_affaire)
+    results = {"carte": carte}
+    for name in sections:
+        # Section en échec: liste vide, l'échec n'est signalé que par partial/errors
+        results[name] = fetched.get(name, [])
     
-    # ÉTAPE 3: Préparer les 3 autres requêtes
-    params_decisions = {
-        "idDossiers": id_dossier_enc,
-        "typeaffaire": type_affaire_enc,
-        "csrt": csrf
-    }
+    if errors:
+        results["partial"] = True
+        results["errors"] = errors
+    results["timestamp"] = datetime.now().isoformat()
+    return results
+
+def stale_sections(entry: PackedEntry, now: float) -> dict:
+    """
+    Sections dont le TTL est dépassé -> depuis combien de secondes. Une entrée
+    récupérée avec une autre clé est entièrement périmée depuis l'activation de la clé.
+    """
+    rotated_since = None
+    if entry.key_version is not None and entry.key_version != crypto.fingerprint:
+        rotated_since = now - crypto.current.activated_at
+    stale = {}
+    for name, ttl in SECTION_TTLS.items():
+        overdue = now - entry.fetched_at.get(name, 0) - ttl
+        if rotated_since is not None:
+            overdue = max(overdue, rotated_since)
+        if overdue > 0:
+            stale[name] = overdue
+    return stale
+
+async def fetch_and_cache(cache_key: str, id_juridiction: str, id_dossier: str,
+                          entry: PackedEntry = None, stale: list = None) -> dict:
+    """
+    Interroge Mahakim pour un dossier et met le résultat en cache.
+    Seules les sections de `stale` sont récupérées (toutes par défaut).
+    """
+    csrf = secrets.token_hex(16)
+    stale = list(SECTION_TTLS) if stale is None else stale
+    secondary = [name for name in stale if name in SECONDARY_SECTIONS]
     
-    params_parties = {
-        "idDoss": id_dossier_enc,
-        "typeaffaire": type_affaire_enc,
-        "csrt": csrf
-    }
+    if "carte" in stale:
+        # Chiffrer les paramètres
+        juridiction_enc = encrypt(id_juridiction)
+        dossier_enc = encrypt(id_dossier)
+        results = await process_dossier(juridiction_enc, dossier_enc, csrf, secondary)
+        if "error" in results:
+            if entry is None and is_not_found(results):
+                await cache_backend.set(f"missing:{cache_key}", {
+                    "error": results["error"], "message": results["message"]
+                }, NEGATIVE_TTL)
+                negative_stats["stored"] += 1
+            return results
+        errors = results.pop("errors", {})
+        results.pop("partial", None)
+    else:
+        # La carte est encore valide: ses IDs suffisent pour les appels secondaires
+        results, errors = await fetch_sections(dossier_ref(entry.data["carte"]), secondary, csrf)
     
-    params_expertises = {
-        "idDossiers": id_dossier_enc,
-        "typeaffaire": type_affaire_enc,
-        "csrt": csrf
-    }
+    # Fusionner avec l'entrée précédente: une section en échec garde son ancienne valeur
+    now = time.time()
+    previous_data = entry.data if entry else {}
+    previous_fetched_at = entry.fetched_at if entry else {}
+    data = {}
+    fetched_at = {}
+    for name in SECTION_TTLS:
+        if name in results and name not in errors:
+            data[name] = results[name]
+            fetched_at[name] = now
+        else:
+            value = previous_data.get(name)
+            # Jamais récupérée: liste vide plutôt que None (les clients itèrent sur les sections)
+            data[name] = [] if value is None and name in SECONDARY_SECTIONS else value
+            fetched_at[name] = previous_fetched_at.get(name, 0)
+    data["timestamp"] = datetime.now().isoformat()
     
-    # Exécuter les 3 autres requêtes
-    decisions = await fetch_url(f"{base_url}/ListeDicisions", params_decisions)
-    parties = await fetch_url(f"{base_url}/ListeParties", params_parties)
-    expertises = await fetch_url(f"{base_url}/ListeExpertisesJudiciaire", params_expertises)
+    with timing.span("compress"):
+        packed_entry = PackedEntry.build(data, fetched_at, crypto.fingerprint)
+    await set_cache(cache_key, packed_entry)
     
-    return {
-        "carte": carte,
-        "decisions": decisions,
-        "parties": parties,
-        "expertises": expertises,
-        "timestamp": datetime.now().isoformat()
-    }
+    if errors:
+        return {**data, "partial": True, "errors": errors}
+    # Historique comparé seulement entre versions complètes (pas après une projection à froid)
+    if all(fetched_at.values()):
+        await record_changes(cache_key, packed_entry)
+    return packed_entry
 
-@app.get("/dossier/{id_juridiction}/{id_dossier}")
-async def get_dossier_get(id_juridiction: str, id_dossier: str):
+async def load_history(cache_key: str) -> changes.History | None:
+    blob = await cache_backend.get(f"changes:{cache_key}", count=False)
+    # Historique au format antérieur (dict non compressé): repart d'une nouvelle référence
+    if not isinstance(blob, bytes):
+        return None
+    try:
+        return changes.History.unpack(blob)
+    except (KeyError, ValueError, zlib.error):
+        return None
+
+async def record_changes(cache_key: str, entry: PackedEntry, track: bool = False):
     """
-    Récupère les 4 endpoints Mahakim pour un dossier (GET)
-    Cache: 24h
+    Compare la version récupérée à la précédente et garde le diff s'il y a du
+    nouveau. L'historique n'est ouvert que pour un dossier suivi ou consulté via
+    /changes (`track`); les autres dossiers n'en ont pas.
+    """
+    history = await load_history(cache_key)
+    if history is None and not (track or cache_key in watchlist.watches):
+        return
+    updated = changes.record_version(history, entry, CHANGES_MAX)
+    if updated is not history:
+        await cache_backend.set(f"changes:{cache_key}", updated.pack(), CHANGES_TTL)
+
+def is_not_found(results: dict) -> bool:
+    """Dossier inconnu de Mahakim (et non réponse illisible ou clés périmées)"""
+    carte = results.get("carte") or {}
+    return results["error"] == NOT_FOUND and not ("error" in carte or "decrypt_error" in carte)
+
+def validate_dossier(id_juridiction: str, id_dossier: str):
+    """Rejette les identifiants mal formés sans solliciter Mahakim"""
+    if not JURIDICTION_PATTERN.fullmatch(id_juridiction):
+        negative_stats["invalid_rejected"] += 1
+        raise HTTPException(status_code=400, detail=f"ID juridiction invalide: {id_juridiction!r}")
+    if not DOSSIER_PATTERN.fullmatch(id_dossier):
+        negative_stats["invalid_rejected"] += 1
+        raise HTTPException(status_code=400, detail=f"Numéro de dossier invalide: {id_dossier!r}")
+
+def flight_key(cache_key: str, stale: list | None) -> str:
+    """Une récupération partielle ne peut servir qu'aux demandes portant sur les mêmes sections"""
+    if stale is None:
+        return cache_key
+    return f"{cache_key}|{','.join(sorted(stale))}"
+
+async def refresh_in_background(cache_key: str, id_juridiction: str, id_dossier: str,
+                                entry: PackedEntry, stale: list):
+    """Rafraîchit les sections périmées sans bloquer l'appelant"""
+    swr_stats["refreshes"] += 1
+    try:
+        await dossier_flights.run(
+            flight_key(cache_key, stale), fetch_and_cache, cache_key, id_juridiction, id_dossier, entry, stale
+        )
+    except Exception as e:
+        swr_stats["refresh_errors"] += 1
+        _logger.warning("Rafraîchissement de %s en échec: %s", cache_key, e)
+
+async def lookup_dossier(id_juridiction: str, id_dossier: str, max_stale: float = None,
+                         sections: list = None) -> tuple:
+    """
+    Consulte le cache sans appeler Mahakim -> (réponse, entrée, sections à récupérer).
+    La réponse est None si l'appelant doit attendre une récupération.
+    Une section périmée depuis moins de max_stale secondes est servie
+    immédiatement et rafraîchie en arrière-plan. Avec `sections`, seules
+    celles-ci sont prises en compte (la carte est toujours récupérée à froid).
     """
     cache_key = f"{id_juridiction}:{id_dossier}"
+    max_stale = CACHE_MAX_STALE if max_stale is None else max_stale
     
-    # Vérifier le cache
-    cached = get_cache(cache_key)
-    if cached:
-        return {"source": "cache", "data": cached}
-    
-    # Chiffrer les paramètres
-    juridiction_enc = encrypt(id_juridiction)
-    dossier_enc = encrypt(id_dossier)
-    csrf = secrets.token_hex(16)
+    entry = await get_cache(cache_key)
+    if not entry:
+        # Dossier récemment introuvable: inutile de réinterroger Mahakim (sauf max-stale=0)
+        if max_stale > 0:
+            missing = await cache_backend.get(f"missing:{cache_key}", count=False)
+            if missing is not None:
+                negative_stats["hits"] += 1
+                return {"source": "cache", **missing, "data": {}}, None, None
+        if sections is None:
+            return None, None, None
+        return None, None, [name for name in SECTION_TTLS if name == "carte" or name in sections]
     
-    base_url = "https://www.mahakim.ma/middleware/api/SuiviDossiers"
+    stale = {
+        name: overdue for name, overdue in stale_sections(entry, time.time()).items()
+        if sections is None or name in sections
+    }
+    if not stale:
+        return {"source": "cache", "data": entry}, entry, None
+    if max(stale.values()) <= max_stale:
+        swr_stats["stale_served"] += 1
+        if flight_key(cache_key, list(stale)) not in dossier_flights.inflight:
+            task = asyncio.create_task(
+                refresh_in_background(cache_key, id_juridiction, id_dossier, entry, list(stale))
+            )
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+        return {"source": "cache", "stale": list(stale), "data": entry}, entry, None
+    if upstream.breaker.is_open:
+        # Disjoncteur ouvert: inutile de faire attendre l'appelant sur Mahakim
+        return degraded_response(entry, list(stale)), entry, None
+    return None, entry, list(stale)
+
+def degraded_response(entry: PackedEntry, stale: list) -> dict:
+    """Entrée périmée servie faute de pouvoir joindre Mahakim"""
+    swr_stats["degraded_served"] += 1
+    return {"source": "cache", "stale": stale, "degraded": True, "data": entry}
+
+async def load_dossier(id_juridiction: str, id_dossier: str, max_stale: float = None,
+                       sections: list = None) -> dict:
+    """Cache puis Mahakim, avec une seule récupération en vol par dossier"""
+    validate_dossier(id_juridiction, id_dossier)
+    cached, entry, stale = await lookup_dossier(id_juridiction, id_dossier, max_stale, sections)
+    if cached:
+        return cached
+    return await fetch_dossier(id_juridiction, id_dossier, entry, stale)
+
+async def fetch_dossier(id_juridiction: str, id_dossier: str,
+                        entry: PackedEntry = None, stale: list = None) -> dict:
+    """Récupère le dossier (ou ses sections périmées) auprès de Mahakim"""
+    cache_key = f"{id_juridiction}:{id_dossier}"
     
     try:
-        results = await process_dossier(juridiction_enc, dossier_enc, csrf)
-        
-        # Vérifier si erreur
-        if "error" in results:
-            return {
-                "source": "api",
-                "error": results["error"],
-                "message": results["message"],
-                "data": results.get("carte", {})
-            }
-        
-        # Mettre en cache
-        set_cache(cache_key, results)
-        
-        return {"source": "api", "data": results}
-        
-    except httpx.HTTPError as e:
+        # Les appels concurrents sur le même dossier attendent la même récupération
+        results = await dossier_flights.run(
+            flight_key(cache_key, stale), fetch_and_cache, cache_key, id_juridiction, id_dossier, entry, stale
+        )
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        # Mahakim en panne: une version périmée vaut mieux qu'une erreur
+        if entry:
+            return degraded_response(entry, stale)
+        if isinstance(e, CircuitOpenError):
+            raise HTTPException(status_code=503, detail=str(e))
         raise HTTPException(status_code=502, detail=f"Erreur API Mahakim: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
+    
+    if isinstance(results, PackedEntry):
+        return {"source": "api", "data": results}
+    
+    # Mahakim injoignable ou réponse indéchiffrable: l'entrée en cache reste valable
+    if "error" in results and entry and not is_not_found(results):
+        return degraded_response(entry, stale)
+    
+    # Vérifier si erreur
+    if "error" in results:
+        return {
+            "source": "api",
+            "error": results["error"],
+            "message": results["message"],
+            "data": results.get("carte", {})
+        }
+    
+    return {"source": "api", "data": results}
+
+def render(payload: dict) -> bytes:
+    """Sérialise une réponse; le dossier d'une entrée de cache est repris sans ré-encodage"""
+    data = payload.get("data")
+    if not isinstance(data, PackedEntry):
+        return jsoncodec.dumps(payload)
+    head = {name: value for name, value in payload.items() if name != "data"}
+    return jsoncodec.dumps_with(head, "data", data.data_json())
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """
+    Le client annonce-t-il ce Content-Encoding (sans q=0) ? Le codage nommé
+    l'emporte sur * où qu'il soit dans l'en-tête ("*, gzip;q=0" refuse gzip).
+    """
+    qualities = {}
+    for part in accept_encoding.lower().split(","):
+        name, *params = (item.strip() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if name:
+            qualities[name] = quality
+    quality = qualities.get(encoding, qualities.get("*", 0.0))
+    return quality > 0
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparaison faible (RFC 9110): W/ ignoré, liste ou * acceptés"""
+    tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") in (tag, tag.strip('"')):
+            return True
+    return False
+
+def timed_response(payload: dict, request: Request, timings: timing.Timings,
+                   include_timings: bool, projection: Projection = None) -> Response:
+    """
+    Sérialise la réponse et ajoute l'en-tête Server-Timing (et le bloc timings si demandé).
+    Un hit frais est renvoyé tel que stocké: compressé si le client accepte le codage.
+    Un dossier inchangé depuis l'ETag envoyé dans If-None-Match donne un 304 sans corps.
+    """
+    headers = {}
+    entry = payload.get("data")
+    if isinstance(entry, PackedEntry):
+        headers["ETag"] = entry.etag
+        if etag_matches(request.headers.get("if-none-match", ""), entry.etag):
+            headers["Server-Timing"] = timings.header()
+            return Response(status_code=304, headers=headers)
+    if projection is not None and "error" not in payload:
+        data = entry.data if isinstance(entry, PackedEntry) else entry
+        payload = {**payload, "data": projection.apply(data)}
+        entry = None
+    with timings.span("serialize"):
+        if isinstance(entry, PackedEntry) and payload == {"source": "cache", "data": entry} and not include_timings:
+            headers["Vary"] = "Accept-Encoding"
+            if accepts_encoding(request.headers.get("accept-encoding", ""), entry.content_encoding):
+                headers["Content-Encoding"] = entry.content_encoding
+                body = entry.body
+            else:
+                body = entry.raw()
+        else:
+            if include_timings:
+                payload = {**payload, "timings": timings.as_dict()}
+            body = render(payload)
+    headers["Server-Timing"] = timings.header()
+    return Response(body, media_type="application/json", headers=headers)
+
+def parse_projection(sections: str | None, fields: str | None) -> Projection | None:
+    """?sections= et ?fields= -> projection (400 si invalide)"""
+    try:
+        return Projection.parse(sections, fields, SECTION_TTLS)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/dossier/{id_juridiction}/{id_dossier}")
+async def get_dossier_get(id_juridiction: str, id_dossier: str, request: Request,
+                          max_stale: float = Query(None, alias="max-stale", ge=0),
+                          timings: bool = False, sections: str = None, fields: str = None):
+    """
+    Récupère les 4 endpoints Mahakim pour un dossier (GET)
+    Cache: TTL par section, max-stale = retard toléré (secondes) avant de bloquer sur Mahakim
+    timings=true ajoute la décomposition du temps au corps (toujours dans Server-Timing)
+    sections=carte,decisions ne récupère que ces sections; fields=carte.lastJugement allège la réponse
+    """
+    measure = timing.start()
+    projection = parse_projection(sections, fields)
+    result = await load_dossier(id_juridiction, id_dossier, max_stale, projection and projection.sections)
+    return timed_response(result, request, measure, timings, projection)
 
 @app.post("/dossier")
-async def get_dossier(req: DossierRequest):
+async def get_dossier(req: DossierRequest, request: Request,
+                      max_stale: float = Query(None, alias="max-stale", ge=0),
+                      timings: bool = False, sections: str = None, fields: str = None):
     """
     Récupère les 4 endpoints Mahakim pour un dossier (POST)
-    Cache: 24h
+    Cache: TTL par section, max-stale = retard toléré (secondes) avant de bloquer sur Mahakim
+    timings=true ajoute la décomposition du temps au corps (toujours dans Server-Timing)
+    sections=carte,decisions ne récupère que ces sections; fields=carte.lastJugement allège la réponse
     """
-    cache_key = f"{req.id_juridiction}:{req.id_dossier}"
-    
-    # Vérifier le cache
-    cached = get_cache(cache_key)
-    if cached:
-        return {"source": "cache", "data": cached}
+    measure = timing.start()
+    projection = parse_projection(sections, fields)
+    result = await load_dossier(req.id_juridiction, req.id_dossier, max_stale, projection and projection.sections)
+    return timed_response(result, request, measure, timings, projection)
+
+@app.get("/dossier/{id_juridiction}/{id_dossier}/changes")
+async def get_dossier_changes(id_juridiction: str, id_dossier: str, since: str = None,
+                              max_stale: float = Query(None, alias="max-stale", ge=0)):
+    """
+    Changements du dossier depuis `since` (ETag déjà connu ou date ISO), en diff
+    structurel par section: éléments ajoutés, modifiés (champs) ou retirés.
+    Le dossier est d'abord actualisé selon les mêmes règles de cache que /dossier.
+    """
+    if since is not None and not since.startswith(("W/", '"')):
+        try:
+            since = datetime.fromisoformat(since).isoformat()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="since: ETag ou date ISO attendu")
+    result = await load_dossier(id_juridiction, id_dossier, max_stale)
+    if "error" in result:
+        return result
+    history = await load_history(f"{id_juridiction}:{id_dossier}")
+    entry = result["data"]
+    if history is None:
+        # Premier appel (ou historique perdu): la version actuelle sert de référence
+        if isinstance(entry, PackedEntry):
+            await record_changes(f"{id_juridiction}:{id_dossier}", entry, track=True)
+        return {"etag": getattr(entry, "etag", None), "complete": False, "changes": []}
+    return {"etag": history.etag, "since": history.since, **changes.changes_since(history, since)}
+
+def batch_line(index: int, item: BatchItem, result: dict) -> dict:
+    """Ligne NDJSON d'un lot, sans le dossier si l'appelant a déjà la même version"""
+    line = {"index": index, **item.model_dump(exclude={"etag"}), **result}
+    entry = result.get("data")
+    if isinstance(entry, PackedEntry):
+        line["etag"] = entry.etag
+        if item.etag and etag_matches(item.etag, entry.etag):
+            del line["data"]
+            line["not_modified"] = True
+    return line
+
+async def batch_results(dossiers: List[BatchItem], concurrency: int, max_stale: float):
+    """Résultats d'un lot, dans l'ordre où ils sont prêts (cache d'abord)"""
+    async def fetch_item(index: int, item: BatchItem, entry: PackedEntry, stale: list) -> dict:
+        async with semaphore:
+            try:
+                result = await fetch_dossier(item.id_juridiction, item.id_dossier, entry, stale)
+            except HTTPException as e:
+                result = {"source": "api", "error": e.detail, "status": e.status_code}
+        return batch_line(index, item, result)
     
-    # Chiffrer les paramètres
-    juridiction_enc = encrypt(req.id_juridiction)
-    dossier_enc = encrypt(req.id_dossier)
-    csrf = secrets.token_hex(16)
+    semaphore = asyncio.Semaphore(concurrency)
+    tasks = []
+    try:
+        # Les hits de cache partent immédiatement, les misses sont lancés en parallèle bornée
+        for index, item in enumerate(dossiers):
+            try:
+                validate_dossier(item.id_juridiction, item.id_dossier)
+            except HTTPException as e:
+                yield batch_line(index, item, {"error": e.detail, "status": e.status_code})
+                continue
+            cached, entry, stale = await lookup_dossier(item.id_juridiction, item.id_dossier, max_stale)
+            if cached:
+                yield batch_line(index, item, cached)
+            else:
+                tasks.append(asyncio.create_task(fetch_item(index, item, entry, stale)))
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Client déconnecté: abandonner les récupérations restantes
+        for task in tasks:
+            task.cancel()
+
+@app.post("/dossiers/batch")
+async def get_dossiers_batch(req: BatchRequest,
+                             max_stale: float = Query(None, alias="max-stale", ge=0)):
+    """
+    Récupère un lot de dossiers, un résultat JSON par ligne (NDJSON) dès qu'il est prêt
+    """
+    if len(req.dossiers) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Lot limité à {BATCH_MAX_ITEMS} dossiers")
+    concurrency = min(max(req.concurrency or BATCH_CONCURRENCY, 1), BATCH_MAX_CONCURRENCY)
     
-    base_url = "https://www.mahakim.ma/middleware/api/SuiviDossiers"
+    async def ndjson():
+        async for result in batch_results(req.dossiers, concurrency, max_stale):
+            yield render(result) + b"\n"
     
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+async def run_watch_scheduler():
+    """Consulte les dossiers suivis selon leur urgence, au plus WATCH_RATE par minute"""
+    global watch_leader
+    semaphore = asyncio.Semaphore(WATCH_CONCURRENCY)
+    renew_at = 0.0
+    async with httpx.AsyncClient(timeout=WATCH_CALLBACK_TIMEOUT) as notifier:
+        while True:
+            try:
+                if time.monotonic() >= renew_at:
+                    leader = await cache_backend.acquire_lease("watchlist", WORKER_ID, WATCH_LEASE_TTL)
+                    if leader:
+                        # Inscriptions faites sur les autres workers (sans événement en local partagé)
+                        watchlist.load(await cache_backend.load_state("watchlist"))
+                    watch_leader = leader
+                    renew_at = time.monotonic() + WATCH_LEASE_TTL / 3
+                watch = watchlist.next_due(time.time()) if watch_leader else None
+                if watch is None:
+                    await asyncio.sleep(1)
+                    continue
+                await semaphore.acquire()
+                watch.polling = True
+                task = asyncio.create_task(poll_watch(watch, notifier))
+                background_tasks.add(task)
+                task.add_done_callback(background_tasks.discard)
+                task.add_done_callback(lambda _: semaphore.release())
+                await asyncio.sleep(60 / WATCH_RATE)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _logger.warning("Planificateur de suivi en échec: %s", e)
+                await asyncio.sleep(5)
+
+async def poll_watch(watch: Watch, notifier: httpx.AsyncClient):
+    """Récupère un dossier suivi auprès de Mahakim et notifie ses changements"""
     try:
-        results = await process_dossier(juridiction_enc, dossier_enc, csrf)
-        
-        # Vérifier si erreur
-        if "error" in results:
-            return {
-                "source": "api",
-                "error": results["error"],
-                "message": results["message"],
-                "data": results.get("carte", {})
-            }
-        
-        # Mettre en cache
-        set_cache(cache_key, results)
-        
-        return {"source": "api", "data": results}
-        
-    except httpx.HTTPError as e:
-        raise HTTPException(status_code=502, detail=f"Erreur API Mahakim: {str(e)}")
-    except HTTPException:
-        raise
+        history = await load_history(watch.key)
+        entry = await get_cache(watch.key)
+        result = await fetch_dossier(watch.id_juridiction, watch.id_dossier, entry, list(SECTION_TTLS))
+        current = result.get("data")
+        if not isinstance(current, PackedEntry) or result.get("degraded"):
+            # Dossier introuvable, Mahakim injoignable ou récupération partielle
+            _logger.info("Suivi de %s: %s", watch.key, result.get("error") or "récupération incomplète")
+            watchlist.schedule_retry(watch, time.time())
+            return
+        watchlist.schedule(watch, current.data.get("carte"), time.time())
+        if history is not None and history.etag != current.etag:
+            watchlist.changes_detected += 1
+            watch.last_change = current.data["timestamp"]
+            delta = changes.changes_since(await load_history(watch.key), history.etag)
+            await notify_watch(watch, notifier, {
+                "event": "dossier.changed",
+                "id_juridiction": watch.id_juridiction,
+                "id_dossier": watch.id_dossier,
+                "etag": current.etag,
+                "previous_etag": history.etag,
+                **delta
+            })
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
+        _logger.warning("Suivi de %s en échec: %s", watch.key, e)
+        watchlist.schedule_retry(watch, time.time())
+    finally:
+        watch.polling = False
+
+def callback_allowed(url: str) -> bool:
+    """
+    Les diffs de dossiers ne partent que vers WATCH_CALLBACK_URL ou un hôte de
+    WATCH_CALLBACK_HOSTS: une URL quelconque ferait du service un relais (SSRF)
+    """
+    if url == WATCH_CALLBACK_URL:
+        return True
+    parts = urlsplit(url)
+    return parts.scheme in ("http", "https") and (parts.hostname or "") in WATCH_CALLBACK_HOSTS
+
+async def notify_watch(watch: Watch, notifier: httpx.AsyncClient, payload: dict):
+    """POST des changements vers l'URL de rappel, avec quelques nouveaux essais"""
+    url = watch.callback_url or WATCH_CALLBACK_URL
+    if not url:
+        return
+    if not callback_allowed(url):
+        # Inscription antérieure à la liste d'hôtes autorisés
+        _logger.warning("Suivi de %s: URL de rappel non autorisée (%s)", watch.key, url)
+        return
+    body = jsoncodec.dumps(payload)
+    for attempt in range(1, 4):
+        try:
+            response = await notifier.post(url, content=body, headers={"Content-Type": "application/json"})
+            response.raise_for_status()
+            watchlist.notifications += 1
+            return
+        except httpx.HTTPError as e:
+            error = e
+            await asyncio.sleep(backoff_delay(attempt, 1, 30))
+    watchlist.notification_errors += 1
+    _logger.warning("Notification de %s vers %s en échec: %s", watch.key, url, error)
+
+async def save_watchlist():
+    """Persiste les inscriptions et prévient les autres workers"""
+    await cache_backend.save_state("watchlist", watchlist.state())
+    await cache_backend.publish({"type": "watchlist", "origin": WORKER_ID})
+
+@app.post("/watchlist")
+async def watch_dossiers(req: WatchRequest):
+    """
+    Inscrit des dossiers au suivi: consultés plus souvent à l'approche d'une audience,
+    rarement une fois jugés; chaque changement est envoyé en POST à callback_url
+    (ou WATCH_CALLBACK_URL)
+    """
+    if not watch_enabled:
+        raise HTTPException(status_code=503, detail="Suivi désactivé: plusieurs workers sans état partagé "
+                                                    "(CACHE_BACKEND=redis ou CACHE_DISK_PATH requis)")
+    if req.callback_url and not callback_allowed(req.callback_url):
+        raise HTTPException(status_code=422, detail="callback_url non autorisée: WATCH_CALLBACK_URL ou un hôte "
+                                                    "de WATCH_CALLBACK_HOSTS")
+    for item in req.dossiers:
+        validate_dossier(item.id_juridiction, item.id_dossier)
+    # Repartir de l'état partagé pour ne pas écraser les inscriptions d'un autre worker
+    watchlist.load(await cache_backend.load_state("watchlist"))
+    added = sum(watchlist.add(item.id_juridiction, item.id_dossier, req.callback_url) for item in req.dossiers)
+    await save_watchlist()
+    return {"added": added, "watched": len(watchlist)}
+
+@app.get("/watchlist")
+async def get_watchlist():
+    """Dossiers suivis avec leur planification (sur le worker planificateur)"""
+    return {"enabled": watch_enabled, "leader": watch_leader, **watchlist.stats(), "watches": watchlist.listing()}
+
+@app.delete("/watchlist/{id_juridiction}/{id_dossier}")
+async def unwatch_dossier(id_juridiction: str, id_dossier: str):
+    """Retire un dossier du suivi"""
+    watchlist.load(await cache_backend.load_state("watchlist"))
+    if not watchlist.remove(f"{id_juridiction}:{id_dossier}"):
+        raise HTTPException(status_code=404, detail="Dossier non suivi")
+    await save_watchlist()
+    return {"message": "Dossier retiré du suivi", "watched": len(watchlist)}
 
 @app.put("/keys")
 async def update_keys(keys: KeysUpdate):
     """Met à jour les clés de chiffrement dynamiquement"""
     try:
-        # Valider les clés
-        key = base64.b64decode(keys.key)
-        iv = base64.b64decode(keys.iv)
-        
-        if len(key) != 32:
-            raise ValueError("La clé doit faire 32 bytes (256 bits)")
-        if len(iv) != 16:
-            raise ValueError("L'IV doit faire 16 bytes (128 bits)")
-        
-        crypto_keys["key"] = keys.key
-        crypto_keys["iv"] = keys.iv
-        
-        # Vider le cache après changement de clés
-        cache.clear()
-        
-        return {"message": "Clés mises à jour avec succès"}
-    except Exception as e:
+        # Valider et activer les clés, puis prévenir les autres workers
+        await apply_keys(keys.key, keys.iv)
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Clés invalides: {str(e)}")
+    
+    return {"message": "Clés mises à jour avec succès", "fingerprint": crypto.fingerprint}
 
 @app.get("/keys")
 async def get_keys():
     """Récupère les clés actuelles"""
-    return crypto_keys
+    return crypto.keys()
+
+@app.get("/crypto/stats")
+async def crypto_stats():
+    """Version de clé active, taux d'échec du déchiffrement, récupération automatique et mémo"""
+    return {**crypto.stats(), "recovery": {
+        "enabled": KEY_RECOVERY, **key_recovery.stats(), "discovery": key_discovery.last_report
+    }}
 
 @app.get("/cache/stats")
-async def cache_stats():
-    """Statistiques du cache"""
-    valid = sum(1 for e in cache.values() if datetime.fromisoformat(e["expires"]) > datetime.now())
+async def cache_stats(top: int = Query(0, ge=0, le=100)):
+    """Statistiques du cache (compteurs, sans parcours); top=N liste les N plus grosses entrées"""
     return {
-        "total": len(cache),
-        "valid": valid,
-        "expired": len(cache) - valid
+        **await cache_backend.stats(top), **dossier_flights.stats(), **swr_stats,
+        "negative": negative_stats,
+        "json_codec": jsoncodec.name,
+        "compression": {"method": packed.CACHE_COMPRESSION, "level": packed.CACHE_COMPRESSION_LEVEL}
     }
 
+async def prefetch_one(job: PrefetchJob, id_juridiction: str, id_dossier: str) -> str:
+    """Met un dossier en cache s'il n'y est pas à jour -> "cached" ou "fetched" """
+    validate_dossier(id_juridiction, id_dossier)
+    cached, entry, stale = await lookup_dossier(id_juridiction, id_dossier, 0)
+    if cached:
+        if cached.get("degraded"):
+            raise RuntimeError("Mahakim indisponible")
+        return "cached"
+    await job.pacer.wait()
+    result = await fetch_dossier(id_juridiction, id_dossier, entry, stale)
+    if "error" in result:
+        raise RuntimeError(f"{result['error']}: {result['message']}")
+    if result.get("degraded") or not isinstance(result["data"], PackedEntry):
+        errors = result["data"].get("errors", {}) if isinstance(result["data"], dict) else {}
+        raise RuntimeError(f"Récupération incomplète: {', '.join(errors) or 'Mahakim indisponible'}")
+    return "fetched"
+
+async def run_prefetch(job: PrefetchJob):
+    """
+    Exécute la tâche en publiant sa progression dans l'état partagé; une demande
+    d'interruption faite sur un autre worker (prefetch-cancel:<id>) y est relevée.
+    """
+    job.task = asyncio.create_task(job.run(prefetch_one))
+    try:
+        while not job.task.done():
+            await cache_backend.save_state(f"prefetch:{job.id}", job.as_dict())
+            if await cache_backend.load_state(f"prefetch-cancel:{job.id}"):
+                job.task.cancel()
+            await asyncio.wait([job.task], timeout=PREFETCH_REPORT_INTERVAL)
+    finally:
+        job.task.cancel()
+    await cache_backend.save_state(f"prefetch:{job.id}", job.as_dict())
+
+async def register_prefetch(job: PrefetchJob):
+    """Ajoute la tâche à l'index partagé et oublie les plus anciennes"""
+    index = await cache_backend.load_state("prefetch") or {"jobs": []}
+    jobs = index["jobs"] + [job.id]
+    for old in jobs[:-PREFETCH_MAX_JOBS]:
+        prefetch_jobs.pop(old, None)
+        await cache_backend.delete_state(f"prefetch:{old}")
+        await cache_backend.delete_state(f"prefetch-cancel:{old}")
+    await cache_backend.save_state("prefetch", {"jobs": jobs[-PREFETCH_MAX_JOBS:]})
+
+async def prefetch_state(job_id: str) -> dict | None:
+    """État d'une tâche: en direct si ce worker l'exécute, sinon tel que publié"""
+    job = prefetch_jobs.get(job_id)
+    if job is not None:
+        return job.as_dict()
+    return await cache_backend.load_state(f"prefetch:{job_id}")
+
+@app.post("/cache/prefetch", status_code=202)
+async def prefetch(request: Request, rate: float = Query(None, gt=0), concurrency: int = Query(None, ge=1, le=16)):
+    """
+    Précharge en arrière-plan une liste de dossiers envoyée en CSV (id_juridiction,id_dossier)
+    ou en NDJSON; les dossiers déjà à jour en cache ne coûtent aucun appel Mahakim
+    """
+    try:
+        dossiers = parse_dossiers((await request.body()).decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Liste illisible: {e}")
+    if not dossiers:
+        raise HTTPException(status_code=400, detail="Aucun dossier à précharger")
+    if len(dossiers) > PREFETCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Préchargement limité à {PREFETCH_MAX_ITEMS} dossiers")
+    
+    job = PrefetchJob(dossiers, rate or PREFETCH_RATE, concurrency or PREFETCH_CONCURRENCY)
+    prefetch_jobs[job.id] = job
+    await cache_backend.save_state(f"prefetch:{job.id}", job.as_dict())
+    await register_prefetch(job)
+    reporter = asyncio.create_task(run_prefetch(job))
+    background_tasks.add(reporter)
+    reporter.add_done_callback(background_tasks.discard)
+    return job.as_dict()
+
+@app.get("/cache/prefetch")
+async def prefetch_list():
+    """Tâches de préchargement récentes, tous workers confondus (sans le détail des échecs)"""
+    index = await cache_backend.load_state("prefetch") or {"jobs": []}
+    states = [await prefetch_state(job_id) for job_id in index["jobs"]]
+    return [{**state, "failures": None} for state in states if state]
+
+@app.get("/cache/prefetch/{job_id}")
+async def prefetch_status(job_id: str):
+    """Progression et échecs d'une tâche de préchargement"""
+    state = await prefetch_state(job_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Tâche inconnue")
+    return state
+
+@app.delete("/cache/prefetch/{job_id}")
+async def prefetch_cancel(job_id: str):
+    """Interrompt une tâche de préchargement, quel que soit le worker qui l'exécute"""
+    if await prefetch_state(job_id) is None:
+        raise HTTPException(status_code=404, detail="Tâche inconnue")
+    job = prefetch_jobs.get(job_id)
+    if job is not None and job.task is not None:
+        job.task.cancel()
+    else:
+        await cache_backend.save_state(f"prefetch-cancel:{job_id}", {"requested_at": time.time()})
+    return {"message": "Préchargement interrompu"}
+
 @app.delete("/cache")
 async def clear_cache():
-    """Vide le cache"""
-    cache.clear()
+    """Vide le cache (pour tous les workers avec un backend partagé)"""
+    await cache_backend.clear()
     return {"message": "Cache vidé"}
 
+@app.get("/http/stats")
+async def http_stats():
+    """État du pool de connexions et limites courantes du régulateur de ce worker vers Mahakim"""
+    return {**upstream.pool_stats(), "workers": upstream.WEB_CONCURRENCY, "limiter": upstream.limiter.stats()}
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Métriques au format Prometheus (par worker)"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @app.get("/health")
 async def health():
-    """Health check"""
-    return {"status": "ok", "timestamp": datetime.now().isoformat()}
+    """Health check (l'API répond même si Mahakim est indisponible)"""
+    resilience = upstream.resilience_stats()
+    return {
+        "status": "degraded" if resilience["circuit"]["state"] != "closed" else "ok",
+        "timestamp": datetime.now().isoformat(),
+        "upstream": resilience
+    }
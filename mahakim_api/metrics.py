@@ -0,0 +1,97 @@
+"""
+Métriques Prometheus du proxy Mahakim (exposées sur /metrics)
+"""
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+# Latences: de quelques ms (cache, chiffrement) à plusieurs dizaines de secondes (Mahakim lent)
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30)
+CRYPTO_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UPSTREAM_LATENCY = Histogram(
+    "mahakim_upstream_request_duration_seconds",
+    "Durée d'un appel Mahakim (par essai)",
+    ["endpoint"],
+    buckets=LATENCY_BUCKETS
+)
+UPSTREAM_ERRORS = Counter(
+    "mahakim_upstream_errors_total",
+    "Erreurs des appels Mahakim par type",
+    ["endpoint", "kind"]
+)
+UPSTREAM_PAYLOAD = Histogram(
+    "mahakim_upstream_payload_bytes",
+    "Taille des réponses Mahakim",
+    ["endpoint"],
+    buckets=SIZE_BUCKETS
+)
+UPSTREAM_INFLIGHT = Gauge(
+    "mahakim_upstream_requests_inflight",
+    "Appels Mahakim en cours"
+)
+CRYPTO_DURATION = Histogram(
+    "mahakim_crypto_duration_seconds",
+    "Durée du chiffrement / déchiffrement AES",
+    ["operation"],
+    buckets=CRYPTO_BUCKETS
+)
+CRYPTO_KEY_SUSPECT = Gauge(
+    "mahakim_crypto_key_suspect",
+    "1 si le taux d'échec du déchiffrement laisse penser que Mahakim a changé de clé"
+)
+API_INFLIGHT = Gauge(
+    "mahakim_api_requests_inflight",
+    "Requêtes en cours sur l'API"
+)
+API_LATENCY = Histogram(
+    "mahakim_api_request_duration_seconds",
+    "Durée des requêtes sur l'API",
+    ["route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+
+
+def endpoint_name(url: str) -> str:
+    """CarteDossier, ListeDicisions... à partir de l'URL Mahakim"""
+    return url.rsplit("/", 1)[-1].split("?", 1)[0]
+
+
+class CacheCollector:
+    """
+    Compteurs du cache lus à chaque collecte: le moteur de cache les tient
+    déjà à jour, inutile de les dupliquer sur le chemin critique.
+    """
+
+    def __init__(self, backend, flights):
+        self.backend = backend
+        self.flights = flights
+
+    def collect(self):
+        backend = self.backend
+        memory = getattr(backend, "memory", None)
+        source = memory if memory is not None else backend
+        for name, help_text in (
+            ("hits", "Lectures du cache servies"),
+            ("misses", "Lectures du cache manquées"),
+            ("evictions", "Entrées évincées (LRU ou budget mémoire)"),
+            ("expirations", "Entrées expirées")
+        ):
+            if hasattr(source, name):
+                family = CounterMetricFamily(f"mahakim_cache_{name}", help_text, labels=["backend"])
+                family.add_metric([backend.name], getattr(source, name))
+                yield family
+        if memory is not None:
+            entries = GaugeMetricFamily("mahakim_cache_entries", "Entrées en cache mémoire", labels=["backend"])
+            entries.add_metric([backend.name], len(memory))
+            yield entries
+            size = GaugeMetricFamily("mahakim_cache_bytes", "Octets occupés par le cache mémoire", labels=["backend"])
+            size.add_metric([backend.name], memory.bytes)
+            yield size
+        coalesced = CounterMetricFamily("mahakim_coalesced_requests", "Requêtes ayant rejoint une récupération en cours")
+        coalesced.add_metric([], self.flights.coalesced)
+        yield coalesced
+
+
+def register_cache_collector(backend, flights):
+    REGISTRY.register(CacheCollector(backend, flights))
@@ -0,0 +1,113 @@
+"""
+Entrées de dossier compressées: corps de réponse déjà sérialisé (zlib ou zstd)
+"""
+import hashlib
+import json
+import os
+import zlib
+from typing import Dict
+
+import jsoncodec
+
+try:
+    import zstandard
+except ImportError:  # dépendance optionnelle
+    zstandard = None
+
+# "zlib" (servi en Content-Encoding: deflate) ou "zstd" (Content-Encoding: zstd)
+CACHE_COMPRESSION = os.getenv("CACHE_COMPRESSION", "zlib")
+CACHE_COMPRESSION_LEVEL = int(os.getenv("CACHE_COMPRESSION_LEVEL", "6"))
+
+if CACHE_COMPRESSION == "zstd" and zstandard is None:
+    raise RuntimeError("CACHE_COMPRESSION=zstd mais zstandard n'est pas installé")
+
+# Corps d'un hit de cache frais: c'est exactement ce qui est compressé et stocké
+HIT_PREFIX = b'{"source":"cache","data":'
+
+# Codage HTTP (Content-Encoding) de chaque format de compression
+ENCODINGS = {"zlib": "deflate", "zstd": "zstd"}
+
+
+def content_hash(data: dict) -> str:
+    """Empreinte stable du contenu d'un dossier (hors timestamp de récupération)"""
+    sections = {name: value for name, value in data.items() if name != "timestamp"}
+    # Clés triées: même empreinte quel que soit l'ordre des champs renvoyés par Mahakim
+    return hashlib.sha256(jsoncodec.dumps_sorted(sections)).hexdigest()[:20]
+
+
+def compress(raw: bytes, method: str = CACHE_COMPRESSION, level: int = CACHE_COMPRESSION_LEVEL) -> bytes:
+    if method == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(raw)
+    return zlib.compress(raw, level)
+
+
+def decompress(blob: bytes, method: str) -> bytes:
+    if method == "zstd":
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return zlib.decompress(blob)
+
+
+class PackedEntry:
+    """
+    Entrée de cache d'un dossier: date de récupération de chaque section (en
+    clair, pour juger de la fraîcheur), empreinte de la clé de chiffrement en
+    vigueur et corps JSON compressé. Un hit est servi sans décoder le dossier;
+    `data` n'est décodé que pour fusionner un rafraîchissement.
+    """
+
+    __slots__ = ("fetched_at", "method", "body", "digest", "key_version", "_raw", "_data")
+
+    def __init__(self, fetched_at: Dict[str, float], method: str, body: bytes, digest: str,
+                 key_version: str | None = None):
+        self.fetched_at = fetched_at
+        self.method = method
+        self.body = body
+        self.digest = digest
+        self.key_version = key_version
+        self._raw = None
+        self._data = None
+
+    @classmethod
+    def build(cls, data: dict, fetched_at: Dict[str, float], key_version: str | None = None) -> "PackedEntry":
+        raw = HIT_PREFIX + jsoncodec.dumps(data) + b"}"
+        entry = cls(fetched_at, CACHE_COMPRESSION, compress(raw), content_hash(data), key_version)
+        entry._raw = raw
+        entry._data = data
+        return entry
+
+    @property
+    def etag(self) -> str:
+        """ETag faible: le contenu est identique, le timestamp peut différer"""
+        return f'W/"{self.digest}"'
+
+    @property
+    def content_encoding(self) -> str:
+        return ENCODINGS[self.method]
+
+    def raw(self) -> bytes:
+        """Corps complet du hit, décompressé"""
+        if self._raw is None:
+            self._raw = decompress(self.body, self.method)
+        return self._raw
+
+    def data_json(self) -> bytes:
+        """JSON du dossier seul, à insérer dans une autre réponse"""
+        return self.raw()[len(HIT_PREFIX):-1]
+
+    @property
+    def data(self) -> dict:
+        if self._data is None:
+            self._data = jsoncodec.loads(self.data_json())
+        return self._data
+
+    def pack(self) -> bytes:
+        """En-tête JSON (longueur sur 4 octets) suivi du corps compressé"""
+        header = json.dumps({"fetched_at": self.fetched_at, "method": self.method, "digest": self.digest,
+                             "key": self.key_version}).encode()
+        return len(header).to_bytes(4, "big") + header + self.body
+
+    @classmethod
+    def unpack(cls, blob: bytes) -> "PackedEntry":
+        size = int.from_bytes(blob[:4], "big")
+        header = json.loads(blob[4:4 + size])
+        return cls(header["fetched_at"], header["method"], blob[4 + size:], header["digest"], header.get("key"))
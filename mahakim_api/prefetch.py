@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Préchargement du cache à partir d'une liste de dossiers (CSV ou NDJSON)
+
+En ligne de commande, envoie la liste à POST /cache/prefetch et suit la progression:
+
+    python prefetch.py audiences_demain.csv --url http://localhost:8000 --rate 1
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import secrets
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List, Tuple
+
+# Échecs détaillés conservés par tâche (les suivants sont seulement comptés)
+MAX_FAILURES = 100
+
+
+def parse_dossiers(text: str) -> List[Tuple[str, str]]:
+    """
+    (id_juridiction, id_dossier) depuis du NDJSON (une ligne JSON par dossier)
+    ou du CSV (avec en-tête id_juridiction,id_dossier ou deux colonnes dans cet ordre).
+    ValueError si une ligne est illisible.
+    """
+    text = text.lstrip("﻿").strip()
+    if not text:
+        return []
+    dossiers = []
+    if text.startswith("{"):
+        for number, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                dossiers.append((str(item["id_juridiction"]).strip(), str(item["id_dossier"]).strip()))
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"ligne {number}: objet JSON avec id_juridiction et id_dossier attendu")
+        return dossiers
+    try:
+        dialect = csv.Sniffer().sniff(text.split("\n", 1)[0], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    rows = list(csv.reader(io.StringIO(text), dialect))
+    header = [cell.strip().lower() for cell in rows[0]]
+    if "id_juridiction" in header and "id_dossier" in header:
+        columns = header.index("id_juridiction"), header.index("id_dossier")
+        rows = rows[1:]
+    else:
+        columns = 0, 1
+    for number, row in enumerate(rows, 1):
+        if not any(cell.strip() for cell in row):
+            continue
+        try:
+            dossiers.append((row[columns[0]].strip(), row[columns[1]].strip()))
+        except IndexError:
+            raise ValueError(f"ligne {number}: id_juridiction et id_dossier attendus")
+    return dossiers
+
+
+class Pacer:
+    """Espace les départs d'au moins 1/rate seconde (rate par seconde)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self.interval
+
+
+class PrefetchJob:
+    """Une liste de dossiers à précharger, traitée en arrière-plan"""
+
+    def __init__(self, dossiers: List[Tuple[str, str]], rate: float, concurrency: int):
+        self.id = secrets.token_hex(6)
+        self.dossiers = dossiers
+        self.rate = rate
+        self.concurrency = concurrency
+        self.pacer = Pacer(rate)
+        self.status = "pending"
+        self.cached = 0
+        self.fetched = 0
+        self.failed = 0
+        self.failures: List[dict] = []
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.task: asyncio.Task | None = None
+
+    @property
+    def processed(self) -> int:
+        return self.cached + self.fetched + self.failed
+
+    async def run(self, process: Callable[["PrefetchJob", str, str], Awaitable[str]]):
+        """
+        process(job, id_juridiction, id_dossier) -> "cached" ou "fetched" (exception
+        en cas d'échec); c'est à lui d'attendre job.pacer avant d'appeler Mahakim.
+        """
+        self.status = "running"
+        self.started_at = time.time()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def one(id_juridiction: str, id_dossier: str):
+            async with semaphore:
+                try:
+                    outcome = await process(self, id_juridiction, id_dossier)
+                except Exception as e:
+                    self.failed += 1
+                    if len(self.failures) < MAX_FAILURES:
+                        self.failures.append({"id_juridiction": id_juridiction, "id_dossier": id_dossier,
+                                              "error": getattr(e, "detail", None) or str(e)})
+                    return
+                if outcome == "cached":
+                    self.cached += 1
+                else:
+                    self.fetched += 1
+
+        try:
+            await asyncio.gather(*(one(*dossier) for dossier in self.dossiers))
+            self.status = "done"
+        except asyncio.CancelledError:
+            self.status = "cancelled"
+            raise
+        finally:
+            self.finished_at = time.time()
+
+    def as_dict(self) -> dict:
+        total = len(self.dossiers)
+        elapsed = ((self.finished_at or time.time()) - self.started_at) if self.started_at else 0
+        remaining = total - self.processed
+        speed = self.processed / elapsed if elapsed else 0
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total": total,
+            "processed": self.processed,
+            "percent": round(100 * self.processed / total, 1) if total else 100.0,
+            "cached": self.cached,
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "rate": self.rate,
+            "concurrency": self.concurrency,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat() if self.started_at else None,
+            "finished_at": datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+            "elapsed": round(elapsed, 1),
+            "eta": round(remaining / speed, 1) if speed and self.status == "running" else None,
+            "failures": self.failures
+        }
+
+
+def main():
+    import httpx
+
+    parser = argparse.ArgumentParser(description="Précharge le cache de l'API Mahakim")
+    parser.add_argument("file", help="CSV ou NDJSON de (id_juridiction, id_dossier), '-' pour stdin")
+    parser.add_argument("--url", default="http://localhost:8000", help="URL de l'API")
+    parser.add_argument("--rate", type=float, help="Dossiers récupérés auprès de Mahakim par seconde")
+    parser.add_argument("--concurrency", type=int, help="Récupérations simultanées")
+    parser.add_argument("--interval", type=float, default=2, help="Période d'affichage de la progression")
+    args = parser.parse_args()
+
+    text = sys.stdin.read() if args.file == "-" else open(args.file, encoding="utf-8-sig").read()
+    params = {name: value for name, value in (("rate", args.rate), ("concurrency", args.concurrency)) if value}
+    with httpx.Client(base_url=args.url, timeout=30) as client:
+        response = client.post("/cache/prefetch", params=params, content=text.encode(),
+                               headers={"Content-Type": "text/plain; charset=utf-8"})
+        if response.status_code >= 400:
+            print(f"❌ {response.status_code}: {response.text}")
+            sys.exit(2)
+        job = response.json()
+        print(f"🚀 Tâche {job['id']}: {job['total']} dossiers")
+        while job["status"] in ("pending", "running"):
+            time.sleep(args.interval)
+            response = client.get(f"/cache/prefetch/{job['id']}")
+            if response.status_code >= 400:
+                print(f"❌ Suivi de la tâche {job['id']} impossible ({response.status_code}): {response.text}")
+                sys.exit(2)
+            job = response.json()
+            eta = f", reste ~{job['eta']:.0f}s" if job["eta"] else ""
+            print(f"⏳ {job['processed']}/{job['total']} ({job['percent']}%) - "
+                  f"en cache {job['cached']}, récupérés {job['fetched']}, échecs {job['failed']}{eta}")
+    for failure in job["failures"]:
+        print(f"❌ {failure['id_juridiction']}/{failure['id_dossier']}: {failure['error']}")
+    print(f"✅ Terminé ({job['status']}) en {job['elapsed']}s")
+    sys.exit(1 if job["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Projection des réponses: sections demandées (?sections=) et champs conservés (?fields=)
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Clés de la réponse conservées quelle que soit la projection
+META_KEYS = ("timestamp", "partial", "errors")
+
+
+def trim(value: Any, paths: List[Tuple[str, ...]]) -> Any:
+    """Ne garde que les chemins demandés; une liste est projetée élément par élément"""
+    if isinstance(value, list):
+        return [trim(item, paths) for item in value]
+    if not isinstance(value, dict):
+        return value
+    result = {}
+    for name in dict.fromkeys(path[0] for path in paths):
+        if name not in value:
+            continue
+        rest = [path[1:] for path in paths if path[0] == name]
+        # "lastJugement" seul garde tout l'objet, "lastJugement.contenu" seulement ce champ
+        result[name] = value[name] if any(not path for path in rest) else trim(value[name], rest)
+    return result
+
+
+class Projection:
+    """
+    sections: sections à renvoyer (et à récupérer), None pour toutes.
+    fields: section -> chemins pointés à conserver (sections absentes: intactes).
+    """
+
+    def __init__(self, sections: List[str] | None, fields: Dict[str, List[Tuple[str, ...]]]):
+        self.sections = sections
+        self.fields = fields
+
+    @classmethod
+    def parse(cls, sections: str | None, fields: str | None, known: Iterable[str]) -> "Projection | None":
+        """ValueError si une section est inconnue; None sans projection"""
+        if not sections and not fields:
+            return None
+        known = list(known)
+        selected = None
+        if sections:
+            selected = [name.strip() for name in sections.split(",") if name.strip()]
+            unknown = [name for name in selected if name not in known]
+            if unknown or not selected:
+                raise ValueError(f"sections inconnues: {', '.join(unknown) or '(vide)'} (parmi {', '.join(known)})")
+            selected = [name for name in known if name in selected]
+        paths: Dict[str, List[Tuple[str, ...]]] = {}
+        for field in (fields or "").split(","):
+            parts = tuple(part for part in field.strip().split(".") if part)
+            if not parts:
+                continue
+            if parts[0] not in known or len(parts) < 2:
+                raise ValueError(f"champ invalide: {field.strip()!r} (attendu section.champ)")
+            paths.setdefault(parts[0], []).append(parts[1:])
+        return cls(selected, paths)
+
+    def apply(self, data: dict) -> dict:
+        result = {}
+        for name, value in data.items():
+            if name in META_KEYS:
+                result[name] = value
+            elif self.sections is None or name in self.sections:
+                result[name] = trim(value, self.fields[name]) if name in self.fields else value
+        return result
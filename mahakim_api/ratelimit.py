@@ -0,0 +1,151 @@
+"""
+Régulateur adaptatif des appels Mahakim: seau à jetons + AIMD
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Callable
+
+# Réponses signalant une surcharge de Mahakim (ou de son frontal)
+CONGESTION_STATUSES = {429, 502, 503, 504}
+
+
+class Slot:
+    """Retour d'un appel: statut HTTP ou timeout, à renseigner par l'appelant"""
+
+    __slots__ = ("observed", "congested")
+
+    def __init__(self):
+        self.observed = False
+        self.congested = False
+
+    def observe(self, status: int | None):
+        """status=None pour un timeout"""
+        self.observed = True
+        self.congested = status is None or status in CONGESTION_STATUSES
+
+
+class AdaptiveLimiter:
+    """
+    Limite de débit (requêtes/s) et de concurrence d'un worker vers Mahakim.
+    Baisse multiplicative sur 429/5xx de surcharge, timeout ou latence en hausse;
+    hausse additive tant que Mahakim répond normalement.
+    """
+
+    def __init__(self, rate: float = 10, min_rate: float = 1, max_rate: float = 20,
+                 concurrency: int = 8, min_concurrency: int = 1, max_concurrency: int = 20,
+                 burst: float | None = None, decrease_factor: float = 0.5, rate_step: float = 0.1,
+                 latency_factor: float = 3.0, cooldown: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.burst = burst if burst is not None else max(rate, 1)
+        self.decrease_factor = decrease_factor
+        self.rate_step = rate_step
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.clock = clock
+
+        self.tokens = self.burst
+        self._last_refill = clock()
+        self._last_decrease = float("-inf")
+        self._cond = asyncio.Condition()
+        self.inflight = 0
+        self.waiting = 0
+        self.latency_ewma: float | None = None
+        self.latency_baseline: float | None = None
+        self.decreases = 0
+        self.congestion_signals = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Réserve une place et un jeton; libère et ajuste les limites à la sortie"""
+        await self._acquire()
+        slot = Slot()
+        start = self.clock()
+        try:
+            yield slot
+        finally:
+            await self._release(slot, self.clock() - start)
+
+    async def _acquire(self):
+        self.waiting += 1
+        try:
+            async with self._cond:
+                await self._cond.wait_for(lambda: self.inflight < int(self.concurrency))
+                self.inflight += 1
+        finally:
+            self.waiting -= 1
+        try:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+        except BaseException:
+            await self._release(Slot(), 0)
+            raise
+
+    async def _release(self, slot: Slot, latency: float):
+        if slot.observed:
+            if slot.congested or self._latency_rising(latency):
+                self.congestion_signals += 1
+                self._decrease()
+            else:
+                self._increase()
+        async with self._cond:
+            self.inflight -= 1
+            self._cond.notify_all()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _latency_rising(self, latency: float) -> bool:
+        if self.latency_ewma is None:
+            self.latency_ewma = self.latency_baseline = latency
+            return False
+        self.latency_ewma += 0.2 * (latency - self.latency_ewma)
+        # La référence suit les meilleures latences et remonte lentement
+        if self.latency_ewma < self.latency_baseline:
+            self.latency_baseline = self.latency_ewma
+        else:
+            self.latency_baseline += 0.01 * (self.latency_ewma - self.latency_baseline)
+        return self.latency_ewma > self.latency_factor * self.latency_baseline
+
+    def _decrease(self):
+        now = self.clock()
+        # Une rafale d'échecs ne compte que pour une seule baisse
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease_factor)
+        self.tokens = min(self.tokens, self.burst)
+
+    def _increase(self):
+        self.rate = min(self.max_rate, self.rate + self.rate_step)
+        # +1 place environ toutes les `concurrency` réponses saines
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+
+    def stats(self) -> dict:
+        return {
+            "rate": round(self.rate, 2),
+            "rate_bounds": [self.min_rate, self.max_rate],
+            "concurrency": int(self.concurrency),
+            "concurrency_bounds": [self.min_concurrency, self.max_concurrency],
+            "inflight": self.inflight,
+            "waiting": self.waiting,
+            "tokens": round(self.tokens, 2),
+            "latency_ewma": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+            "latency_baseline": round(self.latency_baseline, 3) if self.latency_baseline is not None else None,
+            "congestion_signals": self.congestion_signals,
+            "decreases": self.decreases
+        }
@@ -0,0 +1,112 @@
+"""
+Résilience des appels Mahakim: retries avec backoff, budget de retries, disjoncteur
+"""
+import random
+import time
+from typing import Callable
+
+# Réponses transitoires qui justifient un nouvel essai (GET idempotents)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Mahakim est considéré indisponible: l'appel échoue sans être tenté"""
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Backoff exponentiel avec jitter complet (attempt commence à 1)"""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+
+
+class RetryBudget:
+    """
+    Limite les retries à une fraction du trafic: chaque appel crédite `ratio`
+    jeton, chaque retry en consomme un. Évite d'amplifier une panne de Mahakim.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.retries = 0
+        self.exhausted = 0
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            self.exhausted += 1
+            return False
+        self.tokens -= 1
+        self.retries += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self.tokens, 2),
+            "retries": self.retries,
+            "exhausted": self.exhausted
+        }
+
+
+class CircuitBreaker:
+    """
+    closed: appels normaux; open après `threshold` échecs consécutifs, pendant
+    `reset_timeout` secondes; half_open: un seul appel d'essai décide de la suite.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.opens = 0
+        self._trial_inflight = False
+
+    def before_call(self):
+        """Lève CircuitOpenError si l'appel ne doit pas partir"""
+        if self.state == "open":
+            if self.clock() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError("Mahakim indisponible (disjoncteur ouvert)")
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self._trial_inflight:
+                raise CircuitOpenError("Mahakim indisponible (essai en cours)")
+            self._trial_inflight = True
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+        self._trial_inflight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_inflight = False
+        if self.state == "half_open" or self.failures >= self.threshold:
+            if self.state != "open":
+                self.opens += 1
+            self.state = "open"
+            self.opened_at = self.clock()
+
+    def release(self):
+        """Appel abandonné (annulation) sans verdict"""
+        self._trial_inflight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open" and self.clock() - self.opened_at < self.reset_timeout
+
+    def stats(self) -> dict:
+        stats = {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "threshold": self.threshold,
+            "opens": self.opens
+        }
+        if self.state == "open":
+            stats["retry_in"] = round(max(0, self.reset_timeout - (self.clock() - self.opened_at)), 1)
+        return stats
@@ -0,0 +1,34 @@
+"""
+Déduplication des récupérations concurrentes (single-flight)
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Une seule exécution en vol par clé, partagée par tous les appelants concurrents"""
+
+    def __init__(self):
+        self.inflight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+
+    async def run(self, key: str, func: Callable[..., Awaitable[Any]], *args) -> Any:
+        task = self.inflight.get(key)
+        if task is None:
+            # La tâche survit à l'annulation d'un appelant: les autres l'attendent encore
+            task = asyncio.create_task(func(*args))
+            self.inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Task):
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        # Marquer l'exception comme lue si tous les appelants ont abandonné
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {"inflight": len(self.inflight), "coalesced": self.coalesced}
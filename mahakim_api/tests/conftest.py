@@ -0,0 +1,91 @@
+"""
+Configuration commune des tests: modules de l'API importables, environnement
+de test fixé avant l'import de main, faux Mahakim (bench/mock_mahakim.py)
+branché à la place du vrai site
+"""
+import os
+import sys
+
+import httpx
+import pytest
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, API_DIR)
+sys.path.insert(0, os.path.join(API_DIR, "bench"))
+
+# Lu à l'import de main et d'upstream: cache mémoire seul, pas de récupération de clés,
+# régulateur relevé (le faux Mahakim répond sans latence)
+os.environ.update({
+    "CACHE_BACKEND": "local",
+    "CACHE_DISK_PATH": "",
+    "KEY_RECOVERY": "false",
+    "UPSTREAM_RATE": "1000",
+    "UPSTREAM_MAX_RATE": "1000",
+    "RETRY_BASE_DELAY": "0.01",
+    "RETRY_MAX_DELAY": "0.02",
+    "WEB_CONCURRENCY": "1",
+})
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class Clock:
+    """Horloge réglable pour les composants à expiration (clock=...)"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def mahakim():
+    """Faux Mahakim sans latence ni erreur; CONFIG et stats rétablis après le test"""
+    import mock_mahakim
+
+    config = dict(mock_mahakim.CONFIG)
+    mock_mahakim.CONFIG.update(latency=0, jitter=0, error_rate=0)
+    mock_mahakim.stats.update(requests=0, errors=0)
+    yield mock_mahakim
+    mock_mahakim.CONFIG.clear()
+    mock_mahakim.CONFIG.update(config)
+
+
+@pytest.fixture
+async def api(mahakim):
+    """
+    Client de l'API sur un état neuf (cache, disjoncteur, régulateur), dont les
+    appels à Mahakim sont servis par le faux Mahakim via ASGITransport
+    """
+    import main
+    import upstream
+    from cache import TTLCache
+    from cache_backends import LocalBackend
+    from resilience import CircuitBreaker, RetryBudget
+    from singleflight import SingleFlight
+
+    main.cache_backend = LocalBackend(TTLCache(max_entries=1000, default_ttl=main.CACHE_TTL))
+    main.dossier_flights = SingleFlight()
+    main.prefetch_jobs.clear()
+    for counters in (main.swr_stats, main.negative_stats):
+        counters.update(dict.fromkeys(counters, 0))
+    upstream.limiter = upstream.new_limiter()
+    upstream.breaker = CircuitBreaker(threshold=upstream.BREAKER_THRESHOLD,
+                                      reset_timeout=upstream.BREAKER_RESET_TIMEOUT)
+    upstream.retry_budget = RetryBudget(ratio=upstream.RETRY_BUDGET_RATIO)
+    upstream._client = httpx.AsyncClient(transport=httpx.ASGITransport(app=mahakim.app))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://api") as client:
+        yield client
+    await upstream.close_client()
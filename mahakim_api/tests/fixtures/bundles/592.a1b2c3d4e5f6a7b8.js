@@ -0,0 +1 @@
+"use strict";(self.webpackChunkmahakim=self.webpackChunkmahakim||[]).push([[592],{function ec_0(t,n){return t&&t.__esModule?t:{default:t,id:0}}var r0=ec_0(n("0"),0);function ec_1(t,n){return t&&t.__esModule?t:{default:t,id:7919}}var r1=ec_1(n("1"),1);function ec_2(t,n){return t&&t.__esModule?t:{default:t,id:5831}}var r2=ec_2(n("2"),2);function ec_3(t,n){return t&&t.__esModule?t:{default:t,id:3743}}var r3=ec_3(n("3"),3);function ec_4(t,n){return t&&t.__esModule?t:{default:t,id:1655}}var r4=ec_4(n("4"),4);function ec_5(t,n){return t&&t.__esModule?t:{default:t,id:9574}}var r5=ec_5(n("5"),5);function ec_6(t,n){return t&&t.__esModule?t:{default:t,id:7486}}var r6=ec_6(n("6"),6);function ec_7(t,n){return t&&t.__esModule?t:{default:t,id:5398}}var r7=ec_7(n("7"),7);function ec_8(t,n){return t&&t.__esModule?t:{default:t,id:3310}}var r8=ec_8(n("8"),8);function ec_9(t,n){return t&&t.__esModule?t:{default:t,id:1222}}var r9=ec_9(n("9"),9);function ec_10(t,n){return t&&t.__esModule?t:{default:t,id:9141}}var r10=ec_10(n("10"),10);function ec_11(t,n){return t&&t.__esModule?t:{default:t,id:7053}}var r11=ec_11(n("11"),11);function ec_12(t,n){return t&&t.__esModule?t:{default:t,id:4965}}var r12=ec_12(n("12"),12);function ec_13(t,n){return t&&t.__esModule?t:{default:t,id:2877}}var r13=ec_13(n("13"),13);function ec_14(t,n){return t&&t.__esModule?t:{default:t,id:789}}var r14=ec_14(n("14"),14);function ec_15(t,n){return t&&t.__esModule?t:{default:t,id:8708}}var r15=ec_15(n("15"),15);function ec_16(t,n){return t&&t.__esModule?t:{default:t,id:6620}}var r16=ec_16(n("16"),16);function ec_17(t,n){return t&&t.__esModule?t:{default:t,id:4532}}var r17=ec_17(n("17"),17);function ec_18(t,n){return t&&t.__esModule?t:{default:t,id:2444}}var r18=ec_18(n("18"),18);function ec_19(t,n){return t&&t.__esModule?t:{default:t,id:356}}var r19=ec_19(n("19"),19);function ec_20(t,n){return t&&t.__esModule?t:{default:t,id:8275}}var r20=ec_20(n("20"),20);function ec_21(t,n){return t&&t.__esModule?t:{default:t,id:6187}}var r21=ec_21(n("21"),21);function ec_22(t,n){return t&&t.__esModule?t:{default:t,id:4099}}var r22=ec_22(n("22"),22);function ec_23(t,n){return t&&t.__esModule?t:{default:t,id:2011}}var r23=ec_23(n("23"),23);function ec_24(t,n){return t&&t.__esModule?t:{default:t,id:9930}}var r24=ec_24(n("24"),24);function ec_25(t,n){return t&&t.__esModule?t:{default:t,id:7842}}var r25=ec_25(n("25"),25);function ec_26(t,n){return t&&t.__esModule?t:{default:t,id:5754}}var r26=ec_26(n("26"),26);function ec_27(t,n){return t&&t.__esModule?t:{default:t,id:3666}}var r27=ec_27(n("27"),27);function ec_28(t,n){return t&&t.__esModule?t:{default:t,id:1578}}var r28=ec_28(n("28"),28);function ec_29(t,n){return t&&t.__esModule?t:{default:t,id:9497}}var r29=ec_29(n("29"),29);function ec_30(t,n){return t&&t.__esModule?t:{default:t,id:7409}}var r30=ec_30(n("30"),30);function ec_31(t,n){return t&&t.__esModule?t:{default:t,id:5321}}var r31=ec_31(n("31"),31);function ec_32(t,n){return t&&t.__esModule?t:{default:t,id:3233}}var r32=ec_32(n("32"),32);function ec_33(t,n){return t&&t.__esModule?t:{defaul8592:(e,t,n)=>{n.d(t,{iv:()=>"k3vi7ZFUB8/XSID2AXEwug=="})}}]);
\ No newline at end of file
@@ -0,0 +1 @@
+"use strict";(self.webpackChunkmahakim=self.webpackChunkmahakim||[]).push([["common"],{function ex_0(t,n){return t&&t.__esModule?t:{default:t,id:0}}var r0=ex_0(n("0"),0);function ex_1(t,n){return t&&t.__esModule?t:{default:t,id:7919}}var r1=ex_1(n("1"),1);function ex_2(t,n){return t&&t.__esModule?t:{default:t,id:5831}}var r2=ex_2(n("2"),2);function ex_3(t,n){return t&&t.__esModule?t:{default:t,id:3743}}var r3=ex_3(n("3"),3);function ex_4(t,n){return t&&t.__esModule?t:{default:t,id:1655}}var r4=ex_4(n("4"),4);function ex_5(t,n){return t&&t.__esModule?t:{default:t,id:9574}}var r5=ex_5(n("5"),5);function ex_6(t,n){return t&&t.__esModule?t:{default:t,id:7486}}var r6=ex_6(n("6"),6);function ex_7(t,n){return t&&t.__esModule?t:{default:t,id:5398}}var r7=ex_7(n("7"),7);function ex_8(t,n){return t&&t.__esModule?t:{default:t,id:3310}}var r8=ex_8(n("8"),8);function ex_9(t,n){return t&&t.__esModule?t:{default:t,id:1222}}var r9=ex_9(n("9"),9);function ex_10(t,n){return t&&t.__esModule?t:{default:t,id:9141}}var r10=ex_10(n("10"),10);function ex_11(t,n){return t&&t.__esModule?t:{default:t,id:7053}}var r11=ex_11(n("11"),11);function ex_12(t,n){return t&&t.__esModule?t:{default:t,id:4965}}var r12=ex_12(n("12"),12);function ex_13(t,n){return t&&t.__esModule?t:{default:t,id:2877}}var r13=ex_13(n("13"),13);function ex_14(t,n){return t&&t.__esModule?t:{default:t,id:789}}var r14=ex_14(n("14"),14);function ex_15(t,n){return t&&t.__esModule?t:{default:t,id:8708}}var r15=ex_15(n("15"),15);function ex_16(t,n){return t&&t.__esModule?t:{default:t,id:6620}}var r16=ex_16(n("16"),16);function ex_17(t,n){return t&&t.__esModule?t:{default:t,id:4532}}var r17=ex_17(n("17"),17);function ex_18(t,n){return t&&t.__esModule?t:{default:t,id:2444}}var r18=ex_18(n("18"),18);function ex_19(t,n){return t&&t.__esModule?t:{default:t,id:356}}var r19=ex_19(n("19"),19);function ex_20(t,n){return t&&t.__esModule?t:{default:t,id:8275}}var r20=ex_20(n("20"),20);function ex_21(t,n){return t&&t.__esModule?t:{default:t,id:6187}}var r21=ex_21(n("21"),21);function ex_22(t,n){return t&&t.__esModule?t:{default}]);
\ No newline at end of file
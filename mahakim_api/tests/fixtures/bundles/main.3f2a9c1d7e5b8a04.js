@@ -0,0 +1 @@
+"use strict";(self.webpackChunkmahakim=self.webpackChunkmahakim||[]).push([[179],{function em_0(t,n){return t&&t.__esModule?t:{default:t,id:0}}var r0=em_0(n("0"),0);function em_1(t,n){return t&&t.__esModule?t:{default:t,id:7919}}var r1=em_1(n("1"),1);function em_2(t,n){return t&&t.__esModule?t:{default:t,id:5831}}var r2=em_2(n("2"),2);function em_3(t,n){return t&&t.__esModule?t:{default:t,id:3743}}var r3=em_3(n("3"),3);function em_4(t,n){return t&&t.__esModule?t:{default:t,id:1655}}var r4=em_4(n("4"),4);function em_5(t,n){return t&&t.__esModule?t:{default:t,id:9574}}var r5=em_5(n("5"),5);function em_6(t,n){return t&&t.__esModule?t:{default:t,id:7486}}var r6=em_6(n("6"),6);function em_7(t,n){return t&&t.__esModule?t:{default:t,id:5398}}var r7=em_7(n("7"),7);function em_8(t,n){return t&&t.__esModule?t:{default:t,id:3310}}var r8=em_8(n("8"),8);function em_9(t,n){return t&&t.__esModule?t:{default:t,id:1222}}var r9=em_9(n("9"),9);function em_10(t,n){return t&&t.__esModule?t:{default:t,id:9141}}var r10=em_10(n("10"),10);function em_11(t,n){return t&&t.__esModule?t:{default:t,id:7053}}var r11=em_11(n("11"),11);function em_12(t,n){return t&&t.__esModule?t:{default:t,id:4965}}var r12=em_12(n("12"),12);function em_13(t,n){return t&&t.__esModule?t:{default:t,id:2877}}var r13=em_13(n("13"),13);function em_14(t,n){return t&&t.__esModule?t:{default:t,id:789}}var r14=em_14(n("14"),14);function em_15(t,n){return t&&t.__esModule?t:{default:t,id:8708}}var r15=em_15(n("15"),15);function em_16(t,n){return t&&t.__esModule?t:{default:t,id:6620}}var r16=em_16(n("16"),16);function em_17(t,n){return t&&t.__esModule?t:{default:t,id:4532}}var r17=em_17(n("17"),17);function em_18(t,n){return t&&t.__esModule?t:{default:t,id:2444}}var r18=em_18(n("18"),18);function em_19(t,n){return t&&t.__esModule?t:{default:t,id:356}}var r19=em_19(n("19"),19);function em_20(t,n){return t&&t.__esModule?t:{default:t,id:8275}}var r20=em_20(n("20"),20);function em_21(t,n){return t&&t.__esModule?t:{default:t,id:6187}}var r21=em_21(n("21"),21);function em_22(t,n){return t&&t.__esModule?t:{default:t,id:4099}}var r22=em_22(n("22"),22);function em_23(t,n){return t&&t.__esModule?t:{default:t,id:2011}}var r23=em_23(n("23"),23);function em_24(t,n){return t&&t.__esModule?t:{default:t,id:9930}}var r24=em_24(n("24"),24);function em_25(t,n){return t&&t.__esModule?t:{default:t,id:7842}}var r25=em_25(n("25"),25);function em_26(t,n){return t&&t.__esModule?t:{default:t,id:5754}}var r26=em_26(n("26"),26);function em_27(t,n){return t&&t.__esModule?t:{default:t,id:3666}}var r27=em_27(n("27"),27);function em_28(t,n){return t&&t.__esModule?t:{default:t,id:1578}}var r28=em_28(n("28"),28);function em_29(t,n){return t&&t.__esModule?t:{default:t,id:9497}}var r29=em_29(n("29"),29);function em_30(t,n){return t&&t.__esModule?t:{default:t,id:7409}}var r30=em_30(n("30"),30);function em_31(t,n){return t&&t.__esModule?t:{default:t,id:5321}}var r31=em_31(n("31"),31);function em_32(t,n){return t&&t.__esModule?t:{default:t,id:3233}}var r32=em_32(n("32"),32);function em_33(t,n){return t&&t.__esModule?t:{default:t,id:1145}}var r33=em_33(n("33"),33);function em_34(t,n){return t&&t.__esModule?t:{default:t,id:9064}}var r34=em_34(n("34"),34);function em_35(t,n){return t&&t.__esModule?t:{default:t,id:6976}}var r35=em_35(n("35"),35);function em_36(t,n){return t&&t.__esModule?t:{default:t,id:4888}}var r36=em_36(n("36"),36);function em_37(t,n){return t&&t.__esModule?t:{default:t,id:2800}}var r37=em_37(n("37"),37);function em_38(t,n){return t&&t.__esModule?t:{default:t,id:712}}var r38=em_38(n("38"),38);function em_39(t,n){return t&&t.__esModule?t:{default:t,id:8631}}var r39=em_39(n("39"),39);function em_40(t,n){return t&&t.__esModule?t:{default:t,id:6543}}var r40=em_40(n("40"),40);function em_41(t,n){return t&&t.__esModule?t:{default:t,id:4455}}var r41=em_41(n("41"),41);function em_42(t,n){return t&&t.__esModule?t:{default:t,id:2367}}var r42=em_42(n("42"),42);function em_43(t,n){return t&&t.__esModule?t:{default:t,id:279}}var r43=em_43(n("43"),43);function em_44(t,n){return t&&t.__esModule?t:{default:t,id:8198}}var r44=em_44(n("44"),44);function em_45(t,n){return t&&t.__esModule?t:{default:t,id:6110}}var r45=em_45(n("45"),45);function em_46(t,n){return t&&t.__esModule?t:{default:t,id:4022}}var r46=em_46(n("46"),46);function em_47(t,n){return t&&t.__esModule?t:{default:t,id:1934}}var r47=em_47(n("47"),47);function em_48(t,n){return t&&t.__esModule?t:{default:t,id:9853}}var r48=em_48(n("48"),48);function em_49(t,n){return t&&t.__esModule?t:{default:t,id:7765}}var r49=em_49(n("49"),49);function em_50(t,n){return t&&t.__esModule?t:{default:t,id:5677}}var r50=em_50(n("50"),50);function em_51(t,n){return t&&t.__esModule?t:{default:t,id:3589}}var r51=em_51(n("51"),51);function em_52(t,n){return t&&t.__esModule?t:{default:t,id:1501}}var r52=em_52(n("52"),52);function em_53(t,n){return t&&t.__esModule?t:{default:t,id:9420}}var r53=em_53(n("53"),53);function em_54(t,n){return t&&t.__esModule?t:{default:t,id:7332}}var r54=em_54(n("54"),54);function em_55(t,n){return t&&t.__esModule?t:{default:t,id:5244}}var r55=em_55(n("55"),55);function em_56(t,n){return t&&t.__esModule?t:{default:t,id:3156}}var r56=em_56(n("56"),56);function em_57(t,n){return t&&t.__esModule?t:{default:t,id:1068}}var r57=em_57(n("57"),57);function em_58(t,n){return t&&t.__esModule?t:{default:t,id:8987}}var r58=em_58(n("58"),58);function em_59(t,n){return t&&t.__esModule?t:{default:t,id:6899}}var r59=em_59(n("59"),59);function em_60(t,n){return t&&t.__esModule?t:{default:t,id:4811}}var r60=em_60(n("60"),60);function em_61(t,n){return t&&t.__esModule?t:{default:t,id:2723}}var r61=em_61(n("61"),61);function em_62(t,n){return t&&t.__esModule?t:{default:t,id:635}}var r62=em_62(n("62"),62);function em_63(t,n){return t&&t.__esModule?t:{default:t,id:8554}}var r63=em_63(n("63"),63);function em_64(t,n){return t&&t.__esModule?t:{default:t,id:6466}}var r64=em_64(n("64"),64);function em_65(t,n){return t&&t.__esModule?t:{default:t,id:4378}}var r65=em_65(n("65"),65);function em_66(t,n){return t&&t.__esModule?t:{default:t,id:2290}}var r66=em_66(n("66"),66);function em_67(t,n){return t&&t.__esModule?t:{default:t,id:202}}var r67=em_67(n("67"),67);function em_68(t,n){return t&&t.__esModule?t:{default:t,id:8121}}var r68=em_68(n("68"),68);function em_69(t,n){return t&&t.__esModule?t:{default:t,id:6033}}var r69=em_69(n("69"),69);function em_70(t,n){return t&&t.__esModule?t:{default:t,id:3945}}var r70=em_70(n("70"),70);function em_71(t,n){return t&&t.__esModule?t:{default:t,id:1857}}var r71=em_71(n("71"),71);function em_72(t,n){return t&&t.__esModule?t:{default:t,id:9776}}var r72=em_72(n("72"),72);function em_73(t,n){return t&&t.__esModule?t:{default:t,id:7688}}var r73=em_73(n("73"),73);function em_74(t,n){return t&&t.__esModule?t:{default:t,id:5600}}var r74=em_74(n("74"),74);function em_75(t,n){return t&&t.__esModule?t:{default:t,id:3512}}var r75=em_75(n("75"),75);function em_76(t,n){return t&&t.__esModule?t:{default:t,id:1424}}var r76=em_76(n("76"),76);function em_77(t,n){return t&&t.__esModule?t:{default:t,id:9343}}var r77=em_77(n("77"),77);function em_78(t,n){return t&&t.__esModule?t:{default:t,id:7255}}var r78=em_78(n("78"),78);function em_79(t,n){return t&&t.__esModule?t:{default:t,id:5167}}var r79=em_79(n("79"),79);function em_80(t,n){return t&&t.__esModule?t:{default:t,id:3079}}var r80=em_80(n("80"),80);function em_81(t,n){return t&&t.__esModule?t:{default:t,id:991}}var r81=em_81(n("81"),81);function em_82(t,n){return t&&t.__esModule?t:{default:t,id:8910}}var r82=em_82(n("82"),82);function em_83(t,n){return t&&t.__esModule?t:{default:t,id:6822}}var r83=em_83(n("83"),83);function em_84(t,n){return t&&t.__esModule?t:{default:t,id:4734}}var r84=em_84(n("84"),84);function em_85(t,n){return t&&t.__esModule?t:{default:t,id:2646}}var r85=em_85(n("85"),85);function em_86(t,n){return t&&t.__esModule?t:{default:t,id:558}}var r86=em_86(n("86"),86);function em_87(t,n){return t&&t.__esModule?t:{default:t,id:8477}}var r87=em_87(n("87"),87);function em_88(t,n){return t&&t.__esModule?t:{default:t,id:6389}}var r88=em_88(n("88"),88);function em_89(t,n){return t&&t.__esModule?t:{default:t,id:4301}}var r89=em_89(n("89"),89);function em_90(t,n){return t&&t.__esModule?t:{default:t,id:2213}}var r90=em_90(n("90"),90);function em_91(t,n){return t&&t.__esModule?t:{default:t,id:125}}var r91=em_91(n("91"),91);function em_92(t,n){return t&&t.__esModule?t:{default:t,id:8044}}var r92=em_92(n("92"),92);function em_93(t,n){return t&&t.__esModule?t:{default:t,id:5956}}var r93=em_93(n("93"),93);function em_94(t,n){return t&&t.__esModule?t:{default:t,id:3868}}var r94=em_94(n("94"),94);function em_95(t,n){return t&&t.__esModule?t:{default:t,id:1780}}var r95=em_95(n("95"),95);function em_96(t,n){return t&&t.__esModule?t:{default:t,id:9699}}var r96=em_96(n("96"),96);function em_97(t,n){return t&&t.__esModule?t:{default:t,id:7611}}var r97=em_97(n("0"),97);function em_98(t,n){return t&&t.__esModule?t:{default:t,id:5523}}var r98=em_98(n("1"),98);function em_99(t,n){return t&&t.__esModule?t:{default:t,id:3435}}var r99=em_99(n("2"),99);function em_100(t,n){return t&&t.__esModule?t:{default:t,id:1347}}var r100=em_100(n("3"),100);function em_101(t,n){return t&&t.__esModule?t:{default:t,id:9266}}var r101=em_101(n("4"),101);function em_102(t,n){return t&&t.__esModule?t:{default:t,id:7178}}var r102=em_102(n("5"),102);function em_103(t,n){return t&&t.__esModule?t:{default:t,id:5090}}var r103=em_103(n("6"),103);function em_104(t,n){return t&&t.__esModule?t:{default:t,id:3002}}var r104=em_104(n("7"),104);function em_105(t,n){return t&&t.__esModule?t:{default:t,id:914}}var r105=em_105(n("8"),105);function em_106(t,n){return t&&t.__esModule?t:{default:t,id:8833}}var r106=em_106(n("9"),106);function em_107(t,n){return t&&t.__esModule?t:{default:t,id:6745}}var r107=em_107(n("10"),107);function em_108(t,n){return t&&t.__esModule?t:{default:t,id:4657}}var r108=em_108(n("11"),108);function em_109(t,n){return t&&t.__esModule?t:{default:t,id:2569}}var r109=em_109(n("12"),109);function em_110(t,n){return t&&t.__esModule?t:{default:t,id:481}}var r110=em_110(n("13"),110);function em_111(t,n){return t&&t.__esModule?t:{default:t,id:8400}}var r111=em_111(n("14"),111);function em_112(t,n){return t&&t.__esModule?t:{default:t,id:6312}}var r112=em_112(n("15"),112);function em_113(t,n){return t&&t.__esModule?t:{default:t,id:4224}}var r113=em_113(n("16"),113);function em_114(t,n){return t&&t.__esModule?t:{default:t,id:2136}}var r114=em_114(n("17"),114);function em_115(t,n){return t&&t.__esModule?t:{default:t,id:48}}var r115=em_115(n("18"),115);function em_116(t,n){return t&&t.__esModule?t:{default:t,id:7967}}var r116=em_116(n("19"),116);function em_117(t,n){return t&&t.__esModule?t:{default:t,id:5879}}var r117=em_117(n("20"),117);function em_118(t,n){return t&&t.__esModule?t:{default:t,id:3791}}var r118=em_118(n("21"),118);function em_119(t,n){return t&&t.__esModule?t:{default:t,id:1703}}var r119=em_119(n("22"),119);function em_120(t,n){return t&&t.__esModule?t:{default:t,id:9622}}var r120=em_120(n("23"),120);function em_121(t,n){return t&&t.__esModule?t:{default:t,id:7534}}var r121=em_121(n("24"),121);function em_122(t,n){return t&&t.__esModule?t:{default:t,id:5446}}var r122=em_122(n("25"),122);function em_123(t,n){return t&&t.__esModule?t:{default:t,id:3358}}var r123=em_123(n("26"),123);function em_124(t,n){return t&&t.__esModule?t:{default:t,id:1270}}var r124=em_124(n("27"),124);function em_125(t,n){return t&&t.__esModule?t:{default:t,id:9189}}var r125=em_125(n("28"),125);function em_126(t,n){return t&&t.__esModule?t:{default:t,id:7101}}var r126=em_126(n("29"),126);function em_127(t,n){return t&&t.__esModule?t:{default:t,id:5013}}var r127=em_127(n("30"),127);function em_128(t,n){return t&&t.__esModule?t:{default:t,id:2925}}var r128=em_128(n("31"),128);function em_129(t,n){return t&&t.__esModule?t:{default:t,id:837}}var r129=em_129(n("32"),129);function em_130(t,n){return t&&t.__esModule?t:{default:t,id:8756}}var r130=em_130(n("33"),130);function em_131(t,n){return t&&t.__esModule?t:{default:t,id:6668}}var r131=em_131(n("34"),131);function em_132(t,n){return t&&t.__esModule?t:{default:t,id:4580}}var r132=em_132(n("35"),132);function em_133(t,n){return t&&t.__esModule?t:{default:t,id:2492}}var r133=em_133(n("36"),133);function em_134(t,n){return t&&t.__esModule?t:{default:t,id:404}}var r134=em_134(n("37"),134);function em_135(t,n){return t&&t.__esModule?t:{default:t,id:8323}}var r135=em_135(n("38"),135);function em_136(t,n){return t&&t.__esModule?t:{default:t,id:6235}}var r136=em_136(n("39"),136);function em_137(t,n){return t&&t.__esModule?t:{default:t,id:4147}}var r137=em_137(n("40"),137);function em_138(t,n){return t&&t.__esModule?t:{default:t,id:2059}}var r138=em_138(n("41"),138);function em_139(t,n){return t&&t.__esModule?t:{default:t,id:9978}}var r139=em_139(n("42"),139);function em_140(t,n){return t&&t.__esModule?t:{default:t,id:7890}}var r140=em_140(n("43"),140);function em_141(t,n){return t&&t.__esModule?t:{default:t,id:5802}}var r141=em_141(n("44"),141);function em_142(t,n){return t&&t.__esModule?t:{default:t,id:3714}}var r142=em_142(n("45"),142);function em_143(t,n){return t&&t.__esModule?t:{default:t,id:1626}}var r143=em_143(n("46"),143);function em_144(t,n){return t&&t.__esModule?t:{default:t,id:9545}}var r144=em_144(n("47"),144);function em_145(t,n){return t&&t.__esModule?t:{default:t,id:7457}}var r145=em_145(n("48"),145);function em_146(t,n){return t&&t.__esModule?t:{default:t,id:5369}}var r146=em_146(n("49"),146);function em_147(t,n){return t&&t.__esModule?t:{default:t,id:3281}}var r147=em_147(n("50"),147);function em_148(t,n){return t&&t.__esModule?t:{default:t,id:1193}}var r148=em_148(n("51"),148);function em_149(t,n){return t&&t.__esModule?t:{default:t,id:9112}}var r149=em_149(n("52"),149);function em_150(t,n){return t&&t.__esModule?t:{default:t,id:7024}}var r150=em_150(n("53"),150);function em_151(t,n){return t&&t.__esModule?t:{default:t,id:4936}}var r151=em_151(n("54"),151);function em_152(t,n){return t&&t.__esModule?t:{default:t,id:2848}}var r152=em_152(n("55"),152);function em_153(t,n){return t&&t.__esModule?t:{default:t,id:760}}var r153=em_153(n("56"),153);function em_154(t,n){return t&&t.__esModule?t:{default:t,id:8679}}var r154=em_154(n("57"),154);function em_155(t,n){return t&&t.__esModule?t:{default:t,id:6591}}var r155=em_155(n("58"),155);function em_156(t,n){return t&&t.__esModule?t:{default:t,id:4503}}var r156=em_156(n("59"),156);function em_157(t,n){return t&&t.__esModule?t:{default:t,id:2415}}var r157=em_157(n("60"),157);function em_158(t,n){return t&&t.__esModule?t:{default:t,id:327}}var r158=em_158(n("61"),158);function em_159(t,n){return t&&t.__esModule?t:{default:t,id:8246}}var r159=em_159(n("62"),159);function em_160(t,n){return t&&t.__esModule?t:{default:t,id:6158}}var r160=em_160(n("63"),160);function em_161(t,n){return t&&t.__esModule?t:{default:t,id:4070}}var r161=em_161(n("64"),161);function em_162(t,n){return t&&t.__esModule?t:{default:t,id:1982}}var r162=em_162(n("65"),162);function em_163(t,n){return t&&t.__esModule?t:{default:t,id:9901}}var r163=em_163(n("66"),163);function em_164(t,n){return t&&t.__esModule?t:{default:t,id:7813}}var r164=em_164(n("67"),164);function em_165(t,n){return t&&t.__esModule?t:{default:t,id:5725}}var r165=em_165(n("68"),165);function em_166(t,n){return t&&t.__esModule?t:{default:t,id:3637}}var r166=em_166(n("69"),166);function em_167(t,n){return t&&t.__esModule?t:{default:t,id:1549}}var r167=em_167(n("70"),167);function em_168(t,n){return t&&t.__esModule?t:{default:t,id:9468}}var r168=em_168(n("71"),168);function em_169(t,n){return t&&t.__esModule?t:{default:t,id:7380}}var r169=em_169(n("72"),169);function em_170(t,n){return t&&t.__esModule?t:{default:t,id:5292}}var r170=em_170(n("73"),170);function em_171(t,n){return t&&t.__esModule?t:{default:t,id:3204}}var r171=em_171(n("74"),171);function em_172(t,n){return t&&t.__esModule?t:{default:t,id:1116}}var r172=em_172(n("75"),172);function em_173(t,n){return t&&t.__esModule?t:{default:t,id:9035}}var r173=em_173(n("76"),173);function em_174(t,n){return t&&t.__esModule?t:{default:t,id:6947}}var r174=em_174(n("77"),174);function em_175(t,n){return t&&t.__esModule?t:{default:t,id:4859}}var r175=em_175(n("78"),175);function em_176(t,n){return t&&t.__esModule?t:{default:t,id:2771}}var r176=em_176(n("79"),176);function em_177(t,n){return t&&t.__esModule?t:{default:t,id:683}}var r177=em_177(n("80"),177);function em_178(t,n){return t&&t.__esModule?t:{default:t,id:8602}}var r178=em_178(n("81"),178);function em_179(t,n){return t&&t.__esModule?t:{default:t,id:6514}}var r179=em_179(n("82"),179);function em_180(t,n){return t&&t.__esModule?t:{default:t,id:4426}}var r180=em_180(n("83"),180);function em_181(t,n){return t&&t.__esModule?t:{default:t,id:2338}}var r181=em_181(n("84"),181);function em_182(t,n){return t&&t.__esModule?t:{default:t,id:250}}var r182=em_182(n("85"),182);function em_183(t,n){return t&&t.__esModule?t:{default:t,id:8169}}var r183=em_183(n("86"),183);function em_184(t,n){return t&&t.__esModule?t:{default:t,id:6081}}var r184=em_184(n("87"),184);function em_185(t,n){return t&&t.__esModule?t:{default:t,id:3993}}var r185=em_185(n("88"),185);function em_186(t,n){return t&&t.__esModule?t:{default:t,id:1905}}var r186=em_186(n("89"),186);function em_187(t,n){return t&&t.__esModule?t:{default:t,id:9824}}var r187=em_187(n("90"),187);function em_188(t,n){return t&&t.__esModule?t:{default:t,id:7736}}var r188=em_188(n("91"),188);function em_189(t,n){return t&&t.__esModule?t:{default:t,id:5648}}var r189=em_189(n("92"),189);function em_190(t,n){return t&&t.__esModule?t:{default:t,id:3560}}var r190=em_190(n("93"),190);function em_191(t,n){return t&&t.__esModule?t:{default:t,id:1472}}var r191=em_191(n("94"),191);function em_192(t,n){return t&&t.__esModule?t:{default:t,id:9391}}var r192=em_192(n("95"),192);function em_193(t,n){return t&&t.__esModule?t:{default:t,id:7303}}var r193=em_193(n("96"),193);function em_194(t,n){return t&&t.__esModule?t:{default:t,id:5215}}var r194=em_194(n("0"),194);function em_195(t,n){return t&&t.__esModule?t:{default:t,id:3127}}var r195=em_195(n("1"),195);function em_196(t,n){return t&&t.__esModule?t:{default:t,id:1039}}var r196=em_196(n("2"),196);function em_197(t,n){return t&&t.__esModule?t:{default:t,id:8958}}var r197=em_197(n("3"),197);function em_198(t,n){return t&&t.__esModule?t:{default:t,id:6870}}var r198=em_198(n("4"),198);function em_199(t,n){return t&&t.__esModule?t:{default:t,id:4782}}var r199=em_199(n("5"),199);function em_200(t,n){return t&&t.__esModule?t:{default:t,id:2694}}var r200=em_200(n("6"),200);function em_201(t,n){return t&&t.__esModule?t:{default:t,id:606}}var r201=em_201(n("7"),201);function em_202(t,n){return t&&t.__esModule?t:{default:t,id:8525}}var r202=em_202(n("8"),202);function em_203(t,n){return t&&t.__esModule?t:{default:t,id:6437}}var r203=em_203(n("9"),203);function em_204(t,n){return t&&t.__esModule?t:{default:t,id:4349}}var r204=em_204(n("10"),204);function em_205(t,n){return t&&t.__esModule?t:{default:t,id:2261}}var r205=em_205(n("11"),205);function em_206(t,n){return t&&t.__esModule?t:{default:t,id:173}}var r206=em_206(n("12"),206);function em_207(t,n){return t&&t.__esModule?t:{default:t,id:8092}}var r207=em_207(n("13"),207);function em_208(t,n){return t&&t.__esModule?t:{default:t,id:6004}}var r208=em_208(n("14"),208);function em_209(t,n){return t&&t.__esModule?t:{default:t,id:3916}}var r209=em_209(n("15"),209);function em_210(t,n){return t&&t.__esModule?t:{default:t,id:1828}}var r210=em_210(n("16"),210);function em_211(t,n){return t&&t.__esModule?t:{default:t,id:9747}}var r211=em_211(n("17"),211);function em_212(t,n){return t&&t.__esModule?t:{default:t,id:7659}}var r212=em_212(n("18"),212);function em_213(t,n){return t&&t.__esModule?t:{default:t,id:5571}}var r213=em_213(n("19"),213);function em_214(t,n){return t&&t.__esModule?t:{default:t,id:3483}}var r214=em_214(n("20"),214);function em_215(t,n){return t&&t.__esModule?t:{default:t,id:1395}}var r215=em_215(n("21"),215);function em_216(t,n){return t&&t.__esModule?t:{default:t,id:9314}}var r216=em_216(n("22"),216);function em_217(t,n){return t&&t.__esModule?t:{default:t,id:7226}}var r217=em_217(n("23"),217);function em_218(t,n){return t&&t.__esModule?t:{default:t,id:5138}}var r218=em_218(n("24"),218);function em_219(t,n){return t&&t.__esModule?t:{default:t,id:3050}}var r219=em_219(n("25"),219);function em_220(t,n){return t&&t.__esModule?t:{default:t,id:962}}var r220=em_220(n("26"),220);function em_221(t,n){return t&&t.__esModule?t:{default:t,id:8881}}var r221=em_221(n("27"),221);function em_222(t,n){return t&&t.__esModule?t:{default:t,id:6793}}var r222=em_222(n("28"),222);function em_223(t,n){return t&&t.__esModule?t:{default:t,id:4705}}var r223=em_223(n("29"),223);function em_224(t,n){return t&&t.__esModule?t:{default:t,id:2617}}var r224=em_224(n("30"),224);function em_225(t,n){return t&&t.__esModule?t:{default:t,id:529}}var r225=em_225(n("31"),225);function em_226(t,n){return t&&t.__esModule?t:{default:t,id:8448}}var r226=em_226(n("32"),226);function em_227(t,n){return t&&t.__esModule?t:{default:t,id:6360}}var r227=em_227(n("33"),227);function em_228(t,n){return t&&t.__esModule?t:{default:t,id:4272}}var r228=em_228(n("34"),228);function em_229(t,n){return t&&t.__esModule?t:{default:t,id:2184}}var r229=em_229(n("35"),229);function em_230(t,n){return t&&t.__esModule?t:{default:t,id:96}}var r230=em_230(n("36"),230);function em_231(t,n){return t&&t.__esModule?t:{default:t,id:8015}}var r231=em_231(n("37"),231);function em_232(t,n){return t&&t.__esModule?t:{default:t,id:5927}}var r232=em_232(n("38"),232);function em_233(t,n){return t&&t.__esModule?t:{default:t,id:3839}}var r233=em_233(n("39"),233);function em_234(t,n){return t&&t.__esModule?t:{default:t,id:1751}}var r234=em_234(n("40"),234);function em_235(t,n){return t&&t.__esModule?t:{default:t,id:9670}}var r235=em_235(n("41"),235);function em_236(t,n){return t&&t.__esModule?t:{default:t,id:7582}}var r236=em_236(n("42"),236);function em_237(t,n){return t&&t.__esModule?t:{default:t,id:5494}}var r237=em_237(n("43"),237);function em_238(t,n){return t&&t.__esModule?t:{default:t,id:3406}}var r238=em_238(n("44"),238);function em_239(t,n){return t&&t.__esModule?t:{default:t,id:1318}}var r239=em_239(n("45"),239);function em_240(t,n){return t&&t.__esModule?t:{default:t,id:9237}}var r240=em_240(n("46"),240);function em_241(t,n){return t&&t.__esModule?t:{default:t,id:7149}}var r241=em_241(n("47"),241);function em_242(t,n){return t&&t.__esModule?t:{default:t,id:5061}}var r242=em_242(n("48"),242);function em_243(t,n){return t&&t.__esModule?t:{default:t,id:2973}}var r243=em_243(n("49"),243);function em_244(t,n){return t&&t.__esModule?t:{default:t,id:885}}var r244=em_244(n("50"),244);function em_245(t,n){return t&&t.__esModule?t:{default:t,id:8804}}var r245=em_245(n("51"),245);function em_246(t,n){return t&&t.__esModule?t:{default:t,id:6716}}var r246=em_246(n("52"),246);function em_247(t,n){return t&&t.__esModule?t:{default:t,id:4628}}var r247=em_247(n("53"),247);function em_248(t,n){return t&&t.__esModule?t:{default:t,id:2540}}var r248=em_248(n("54"),248);function em_249(t,n){return t&&t.__esModule?t:{default:t,id:452}}var r249=em_249(n("55"),249);function em_250(t,n){return t&&t.__esModule?t:{default:t,id:8371}}var r250=em_250(n("56"),250);function em_251(t,n){return t&&t.__esModule?t:{default:t,id:6283}}var r251=em_251(n("57"),251);function em_252(t,n){return t&&t.__esModule?t:{default:t,id:4195}}var r252=em_252(n("58"),252);function em_253(t,n){return t&&t.__esModule?t:{default:t,id:2107}}var r253=em_253(n("59"),253);function em_254(t,n){return t&&t.__esModule?t:{default:t,id:19}}var r254=em_254(n("60"),254);function em_255(t,n){return t&&t.__esModule?t:{default:t,id:7938}}var r255=em_255(n("61"),255);function em_256(t,n){return t&&t.__esModule?t:{default:t,id:5850}}var r256=em_256(n("62"),256);function em_257(t,n){return t&&t.__esModule?t:{default:t,id:3762}}var r257=em_257(n("63"),257);function em_258(t,n){return t&&t.__esModule?t:{default:t,id:1674}}var r258=em_258(n("64"),258);function em_259(t,n){return t&&t.__esModule?t:{default:t,id:9593}}var r259=em_259(n("65"),259);function em_260(t,n){return t&&t.__esModule?t:{default:t,id:7505}}var r260=em_260(n("66"),260);function em_261(t,n){return t&&t.__esModule?t:{default:t,id:5417}}var r261=em_261(n("67"),261);function em_262(t,n){return t&&t.__esModule?t:{default:t,id:3329}}var r262=em_262(n("68"),262);function em_263(t,n){return t&&t.__esModule?t:{default:t,id:1241}}var r263=em_263(n("69"),263);function em_264(t,n){return t&&t.__esModule?t:{default:t,id:9160}}var r264=em_264(n("70"),264);function em_265(t,n){return t&&t.__esModule?t:{default:t,id:7072}}var r265=em_265(n("71"),265);function em_266(t,n){return t&&t.__esModule?t:{default:t,id:4984}}var r266=em_266(n("72"),266);function em_267(t,n){return t&&t.__esModule?t:{default:t,id:2896}}var r267=em_267(n("73"),267);function em_268(t,n){return t&&t.__esModule?t:{default:t,id:808}}var r268=em_268(n("74"),268);function em_269(t,n){return t&&t.__esModule?t:{default:t,id:8727}}var r269=em_269(n("75"),269);function em_270(t,n){return t&&t.__esModule?t:{default:t,id:6639}}var r270=em_270(n("76"),270);function em_271(t,n){return t&&t.__esModule?t:{default:t,id:4551}}var r271=em_271(n("77"),271);function em_272(t,n){return t&&t.__esModule?t:{default:t,id:2463}}var r272=em_272(n("78"),272);function em_273(t,n){return t&&t.__esModule?t:{default:t,id:375}}var r273=em_273(n("79"),273);function em_274(t,n){return t&&t.__esModule?t:{default:t,id:8294}}var r274=em_274(n("80"),274);function em_275(t,n){return t&&t.__esModule?t:{default:t,id:6206}}var r275=em_275(n("81"),275);function em_276(t,n){return t&&t.__esModule?t:{default:t,id:4118}}var r276=em_276(n("82"),276);function em_277(t,n){return t&&t.__esModule?t:{default:t,id:2030}}var r277=em_277(n("83"),277);function em_278(t,n){return t&&t.__esModule?t:{default:t,id:9949}}var r278=em_278(n("84"),278);function em_279(t,n){return t&&t.__esModule?t:{default:t,id:7861}}var r279=em_279(n("85"),279);function em_280(t,n){return t&&t.__esModule?t:{default:t,id:5773}}var r280=em_280(n("86"),280);function em_281(t,n){return t&&t.__esModule?t:{default:t,id:3685}}var r281=em_281(n("87"),281);function em_282(t,n){return t&&t.__esModule?t:{default:t,id:1597}}var r282=em_282(n("88"),282);function em_283(t,n){return t&&t.__esModule?t:{default:t,id:9516}}var r283=em_283(n("89"),283);function em_284(t,n){return t&&t.__esModule?t:{default:t,id:7428}}var r284=em_284(n("90"),284);function em_285(t,n){return t&&t.__esModule?t:{default:t,id:5340}}var r285=em_285(n("91"),285);function em_286(t,n){return t&&t.__esModule?t:{default:t,id:3252}}var r286=em_286(n("92"),286);function em_287(t,n){return t&&t.__esModule?t:{default:t,id:1164}}var r287=em_287(n("93"),287);function em_288(t,n){return t&&t.__esModule?t:{default:t,id:9083}}var r288=em_288(n("94"),288);function em_289(t,n){return t&&t.__esModule?t:{default:t,id:6995}}var r289=em_289(n("95"),289);function em_290(t,n){return t&&t.__esModule?t:{default:t,id:4907}}var r290=em_290(n("96"),290);function em_291(t,n){return t&&t.__esModule?t:{default:t,id:2819}}var r291=em_291(n("0"),291);function em_292(t,n){return t&&t.__esModule?t:{default:t,id:731}}var r292=em_292(n("1"),292);function em_293(t,n){return t&&t.__esModule?t:{default:t,id:8650}}var r293=em_293(n("2"),293);function em_294(t,n){return t&&t.__esModule?t:{default:t,id:6562}}var r294=em_294(n("3"),294);function em_295(t,n){return t&&t.__esModule?t:{default:t,id:4474}}var r295=em_295(n("4"),295);function em_296(t,n){return t&&t.__esModule?t:{default:t,id:2386}}var r296=em_296(n("5"),296);function em_297(t,n){return t&&t.__esModule?t:{default:t,id:298}}var r297=em_297(n("6"),297);function em_298(t,n){return t&&t.__esModule?t:{default:t,id:8217}}var r298=em_298(n("7"),298);function em_299(t,n){return t&&t.__esModule?t:{default:t,id:6129}}var r299=em_299(n("8"),299);function em_300(t,n){return t&&t.__esModule?t:{default:t,id:4041}}var r300=em_300(n("9"),300);function em_301(t,n){return t&&t.__esModule?t:{default:t,id:1953}}var r301=em_301(n("10"),301);function em_302(t,n){return t&&t.__esModule?t:{default:t,id:9872}}var r302=em_302(n("11"),302);function em_303(t,n){return t&&t.__esModule?t:{default:t,id:7784}}var r303=em_303(n("12"),303);function em_304(t,n){return t&&t.__esModule?t:{default:t,id:5696}}var r304=em_304(n("13"),304);function em_305(t,n){return t&&t.__esModule?t:{default:t,id:3608}}var r305=em_305(n("14"),305);function em_306(t,n){return t&&t.__esModule?t:{default:t,id:1520}}var r306=em_306(n("15"),306);function em_307(t,n){return t&&t.__esModule?t:{default:t,id:9439}}var r307=em_307(n("16"),307);function em_308(t,n){return t&&t.__esModule?t:{default:t,id:7351}}var r308=em_308(n("17"),308);function em_309(t,n){return t&&t.__esModule?t:{default:t,id:5263}}var r309=em_309(n("18"),309);function em_310(t,n){return t&&t.__esModule?t:{default:t,id:3175}}var r310=em_310(n("19"),310);function em_311(t,n){return t&&t.__esModule?t:{default:t,id:1087}}var r311=em_311(n("20"),311);function em_312(t,n){return t&&t.__esModule?t:{default:t,id:9006}}var r312=em_312(n("21"),312);function em_313(t,n){return t&&t.__esModule?t:{default:t,id:6918}}var r313=em_313(n("22"),313);function em_314(t,n){return t&&t.__esModule?t:{default:t,id:4830}}var r314=em_314(n("23"),314);function em_315(t,n){return t&&t.__esModule?t:{default:t,id:2742}}var r315=em_315(n("24"),315);function em_316(t,n){return t&&t.__esModule?t:{default:t,id:654}}var r316=em_316(n("25"),316);function em_317(t,n){return t&&t.__esModule?t:{default:t,id:8573}}var r317=em_317(n("26"),317);function em_318(t,n){return t&&t.__esModule?t:{default:t,id:6485}}var r318=em_318(n("27"),318);function em_319(t,n){return t&&t.__esModule?t:{default:t,id:4397}}var r319=em_319(n("28"),319);function em_320(t,n){return t&&t.__esModule?t:{default:t,id:2309}}var r320=em_320(n("29"),320);function em_321(t,n){return t&&t.__esModule?t:{default:t,id:221}}var r321=em_321(n("30"),321);function em_322(t,n){return t&&t.__esModule?t:{default:t,id:8140}}var r322=em_322(n("31"),322);function em_323(t,n){return t&&t.__esModule?t:{default:t,id:6052}}var r323=em_323(n("32"),323);function em_324(t,n){return t&&t.__esModule?t:{default:t,id:3964}}var r324=em_324(n("33"),324);function em_325(t,n){return t&&t.__esModule?t:{default:t,id:1876}}var r325=em_325(n("34"),325);function em_326(t,n){return t&&t.__esModule?t:{default:t,id:9795}}var r326=em_326(n("35"),326);function em_327(t,n){return t&&t.__esModule?t:{default:t,id:7707}}var r327=em_327(n("36"),327);function em_328(t,n){return t&&t.__esModule?t:{default:t,id:5619}}var r328=em_328(n("37"),328);function em_329(t,n){return t&&t.__esModule?t:{default:t,id:3531}}var r329=em_329(n("38"),329);function em_330(t,n){return t&&t.__esModule?t:{default:t,id:1443}}var r330=em_330(n("39"),330);function em_331(t,n){return t&&t.__esModule?t:{default:t,id:9362}}var r331=em_331(n("40"),331);function em_332(t,n){return t&&t.__esModule?t:{default:t,id:7274}}var r332=em_332(n("41"),332);function em_333(t,n){return t&&t.__esModule?t:{default:t,id:5186}}var r333=em_333(n("42"),333);function em_334(t,n){return t&&t.__esModule?t:{default:t,id:3098}}var r334=em_334(n("43"),334);function em_335(t,n){return t&&t.__esModule?t:{default:t,id:1010}}var r335=em_335(n("44"),335);function em_336(t,n){return t&&t.__esModule?t:{default:t,id:8929}}var r336=em_336(n("45"),336);function em_337(t,n){return t&&t.__esModule?t:{default:t,id:6841}}var r337=em_337(n("46"),337);function em_338(t,n){return t&&t.__esModule?t:{default:t,id:4753}}var r338=em_338(n("47"),338);function em_339(t,n){return t&&t.__esModule?t:{default:t,id:2665}}var r339=em_339(n("48"),339);function em_340(t,n){return t&&t.__esModule?t:{default:t,id:577}}var r340=em_340(n("49"),340);function em_341(t,n){return t&&t.__esModule?t:{default:t,id:8496}}var r341=em_341(n("50"),341);function em_342(t,n){return t&&t.__esModule?t:{default:t,id:6408}}var r342=em_342(n("51"),342);function em_343(t,n){return t&&t.__esModule?t:{default:t,id:4320}}var r343=em_343(n("52"),343);function em_344(t,n){return t&&t.__esModule?t:{default:t,id:2232}}var r344=em_344(n("53"),344);function em_345(t,n){return t&&t.__esModule?t:{default:t,id:144}}var r345=em_345(n("54"),345);function em_346(t,n){return t&&t.__esModule?t:{default:t,id:8063}}var r346=em_346(n("55"),346);function em_347(t,n){return t&&t.__esModule?t:{default:t,id:5975}}var r347=em_347(n("56"),347);function em_348(t,n){return t&&t.__esModule?t:{default:t,id:3887}}var r348=em_348(n("57"),348);function em_349(t,n){return t&&t.__esModule?t:{default:t,id:1799}}var r349=em_349(n("58"),349);function em_350(t,n){return t&&t.__esModule?t:{default:t,id:9718}}var r350=em_350(n("59"),350);function em_351(t,n){return t&&t.__esModule?t:{default:t,id:7630}}var r351=em_351(n("60"),351);function em_352(t,n){return t&&t.__esModule?t:{default:t,id:5542}}var r352=em_352(n("61"),352);function em_353(t,n){return t&&t.__esModule?t:{default:t,id:3454}}var r353=em_353(n("62"),353);function em_354(t,n){return t&&t.__esModule?t:{default:t,id:1366}}var r354=em_354(n("63"),354);function em_355(t,n){return t&&t.__esModule?t:{default:t,id:9285}}var r355=em_355(n("64"),355);function em_356(t,n){return t&&t.__esModule?t:{default:t,id:7197}}var r356=em_356(n("65"),356);function em_357(t,n){return t&&t.__esModule?t:{default:t,id:5109}}var r357=em_357(n("66"),357);function em_358(t,n){return t&&t.__esModule?t:{default:t,id:3021}}var r358=em_358(n("67"),358);function em_359(t,n){return t&&t.__esModule?t:{default:t,id:933}}var r359=em_359(n("68"),359);function em_360(t,n){return t&&t.__esModule?t:{default:t,id:8852}}var r360=em_360(n("69"),360);function em_361(t,n){return t&&t.__esModule?t:{default:t,id:6764}}var r361=em_361(n("70"),361);function em_362(t,n){return t&&t.__esModule?t:{default:t,id:4676}}var r362=em_362(n("71"),362);function em_363(t,n){return t&&t.__esModule?t:{default:t,id:2588}}var r363=em_363(n("72"),363);function em_364(t,n){return t&&t.__esModule?t:{default:t,id:500}}var r364=em_364(n("73"),364);function em_365(t,n){return t&&t.__esModule?t:{default:t,id:8419}}var r365=em_365(n("74"),365);function em_366(t,n){return t&&t.__esModule?t:{default:t,id:6331}}var r366=em_366(n("75"),366);function em_367(t,n){return t&&t.__esModule?t:{default:t,id:4243}}var r367=em_367(n("76"),367);function em_368(t,n){return t&&t.__esModule?t:{default:t,id:2155}}var r368=em_368(n("77"),368);function em_369(t,n){return t&&t.__esModule?t:{default:t,id:67}}var r369=em_369(n("78"),369);function em_370(t,n){return t&&t.__esModule?t:{default:t,id:7986}}var r370=em_370(n("79"),370);function em_371(t,n){return t&&t.__esModule?t:{default:t,id:5898}}var r371=em_371(n("80"),371);function em_372(t,n){return t&&t.__esModule?t:{default:t,id:3810}}var r372=em_372(n("81"),372);function em_373(t,n){return t&&t.__esModule?t:{default:t,id:1722}}var r373=em_373(n("82"),373);function em_374(t,n){return t&&t.__esModule?t:{default:t,id:9641}}var r374=em_374(n("83"),374);function em_375(t,n){return t&&t.__esModule?t:{default:t,id:7553}}var r375=em_375(n("84"),375);function em_376(t,n){return t&&t.__esModule?t:{default:t,id:5465}}var r376=em_376(n("85"),376);function em_377(t,n){return t&&t.__esModule?t:{default:t,id:3377}}var r377=em_377(n("86"),377);function em_378(t,n){return t&&t.__esModule?t:{default:t,id:1289}}var r378=em_378(n("87"),378);function em_379(t,n){return t&&t.__esModule?t:{default:t,id:9208}}var r379=em_379(n("88"),379);function em_380(t,n){return t&&t.__esModule?t:{default:t,id:7120}}var r380=em_380(n("89"),380);function em_381(t,n){return t&&t.__esModule?t:{default:t,id:5032}}var r381=em_381(n("90"),381);function em_382(t,n){return t&&t.__esModule?t:{default:t,id:2944}}var r382=em_382(n("91"),382);function em_383(t,n){return t&&t.__esModule?t:{default:t,id:856}}var r383=em_383(n("92"),383);function em_384(t,n){return t&&t.__esModule?t:{default:t,id:8775}}var r384=em_384(n("93"),384);function em_385(t,n){return t&&t.__esModule?t:{default:t,id:6687}}var r385=em_385(n("94"),385);function em_386(t,n){return t&&t.__esModule?t:{default:t,id:4599}}var r386=em_386(n("95"),386);function em_387(t,n){return t&&t.__esModule?t:{default:t,id:2511}}var r387=em_387(n("96"),387);function em_388(t,n){return t&&t.__esModule?t:{default:t,id:423}}var r388=em_388(n("0"),388);function em_389(t,n){return t&&t.__esModule?t:{default:t,id:8342}}var r389=em_389(n("1"),389);function em_390(t,n){return t&&t.__esModule?t:{default:t,id:6254}}var r390=em_390(n("2"),390);function em_391(t,n){return t&&t.__esModule?t:{default:t,id:4166}}var r391=em_391(n("3"),391);function em_392(t,n){return t&&t.__esModule?t:{default:t,id:2078}}var r392=em_392(n("4"),392);function em_393(t,n){return t&&t.__esModule?t:{default:t,id:9997}}var r393=em_393(n("5"),393);function em_394(t,n){return t&&t.__esModule?t:{default:t,id:7909}}var r394=em_394(n("6"),394);function em_395(t,n){return t&&t.__esModule?t:{default:t,id:5821}}var r395=em_395(n("7"),395);function em_396(t,n){return t&&t.__esModule?t:{default:t,id:3733}}var r396=em_396(n("8"),396);function em_397(t,n){return t&&t.__esModule?t:{default:t,id:1645}}var r397=em_397(n("9"),397);function em_398(t,n){return t&&t.__esModule?t:{default:t,id:9564}}var r398=em_398(n("10"),398);function em_399(t,n){return t&&t.__esModule?t:{default:t,id:7476}}var r399=em_399(n("11"),399);function em_400(t,n){return t&&t.__esModule?t:{default:t,id:5388}}var r400=em_400(n("12"),400);function em_401(t,n){return t&&t.__esModule?t:{default:t,id:3300}}var r401=em_401(n("13"),401);function em_402(t,n){return t&&t.__esModule?t:{default:t,id:1212}}var r402=em_402(n("14"),402);function em_403(t,n){return t&&t.__esModule?t:{default:t,id:9131}}var r403=em_403(n("15"),403);function em_404(t,n){return t&&t.__esModule?t:{default:t,id:7043}}var r404=em_404(n("16"),404);function em_405(t,n){return t&&t.__esModule?t:{default:t,id:4955}}var r405=em_405(n("17"),405);function em_406(t,n){return t&&t.__esModule?t:{default:t,id:2867}}var r406=em_406(n("18"),406);function em_407(t,n){return t&&t.__esModule?t:{default:t,id:779}}var r407=em_407(n("19"),407);function em_408(t,n){return t&&t.__esModule?t:{default:t,id:8698}}var r408=em_408(n("20"),408);function em_409(t,n){return t&&t.__esModule?t:{default:t,id:6610}}var r409=em_409(n("21"),409);function em_410(t,n){return t&&t.__esModule?t:{default:t,id:4522}}var r410=em_410(n("22"),410);function em_411(t,n){return t&&t.__esModule?t:{default:t,id:2434}}var r411=em_411(n("23"),411);function em_412(t,n){return t&&t.__esModule?t:{default:t,id:346}}var r412=em_412(n("24"),412);function em_413(t,n){return t&&t.__esModule?t:{default:t,id:8265}}var r413=em_413(n("25"),413);function em_414(t,n){return t&&t.__esModule?t:{default:t,id:6177}}var r414=em_414(n("26"),414);function em_415(t,n){return t&&t.__esModule?t:{default:t,id:4089}}var r415=em_415(n("27"),415);function em_416(t,n){return t&&t.__esModule?t:{default:t,id:2001}}var r416=em_416(n("28"),416);function em_417(t,n){return t&&t.__esModule?t:{default:t,id:9920}}var r417=em_417(n("29"),417);function em_418(t,n){return t&&t.__esModule?t:{default:t,id:7832}}var r418=em_418(n("30"),418);function em_419(t,n){return t&&t.__esModule?t:{default:t,id:5744}}var r419=em_419(n("31"),419);function em_420(t,n){return t&&t.__esModule?t:{default:t,id:3656}}var r420=em_420(n("32"),420);function em_421(t,n){return t&&t.__esModule?t:{default:t,id:1568}}var r421=em_421(n("33"),421);function em_422(t,n){return t&&t.__esModule?t:{default:t,id:9487}}var r422=em_422(n("34"),422);function em_423(t,n){return t&&t.__esModule?t:{default:t,id:7399}}var r423=em_423(n("35"),423);function em_424(t,n){return t&&t.__esModule?t:{default:t,id:5311}}var r424=em_424(n("36"),424);function em_425(t,n){return t&&t.__esModule?t:{default:t,id:3223}}var r425=em_425(n("37"),425);function em_426(t,n){return t&&t.__esModule?t:{default:t,id:1135}}var r426=em_426(n("38"),426);function em_427(t,n){return t&&t.__esModule?t:{default:t,id:9054}}var r427=em_427(n("39"),427);function em_428(t,n){return t&&t.__esModule?t:{default:t,id:6966}}var r428=em_428(n("40"),428);function em_429(t,n){return t&&t.__esModule?t:{default:t,id:4878}}var r429=em_429(n("41"),429);function em_430(t,n){return t&&t.__esModule?t:{default:t,id:2790}}var r430=em_430(n("42"),430);function em_431(t,n){return t&&t.__esModule?t:{default:t,id:702}}var r431=em_431(n("43"),431);function em_432(t,n){return t&&t.__esModule?t:{default:t,id:8621}}var r432=em_432(n("44"),432);function em_433(t,n){return t&&t.__esModule?t:{default:t,id:6533}}var r433=em_433(n("45"),433);function em_434(t,n){return t&&t.__esModule?t:{default:t,id:4445}}var r434=em_434(n("46"),434);function em_435(t,n){return t&&t.__esModule?t:{default:t,id:2357}}var r435=em_435(n("47"),435);function em_436(t,n){return t&&t.__esModule?t:{default:t,id:269}}var r436=em_436(n("48"),436);function em_437(t,n){return t&&t.__esModule?t:{default:t,id:8188}}var r437=em_437(n("49"),437);function em_438(t,n){return t&&t.__esModule?t:{default:t,id:6100}}var r438=em_438(n("50"),438);function em_439(t,n){return t&&t.__esModule?t:{default:t,id:4012}}var r439=em_439(n("51"),439);function em_440(t,n){return t&&t.__esModule?t:{default:t,id:1924}}var r440=em_440(n("52"),440);function em_441(t,n){return t&&t.__esModule?t:{default:t,id:9843}}var r441=em_441(n("53"),441);function em_442(t,n){return t&&t.__esModule?t:{default:t,id:7755}}var r442=em_442(n("54"),442);function em_443(t,n){return t&&t.__esModule?t:{default:t,id:5667}}var r443=em_443(n("55"),443);function em_444(t,n){return t&&t.__esModule?t:{default:t,id:3579}}var r444=em_444(n("56"),444);function em_445(t,n){return t&&t.__esModule?t:{default:t,id:1491}}var r445=em_445(n("57"),445);function em_446(t,n){return t&&t.__esModule?t:{default:t,id:9410}}var r446=em_446(n("58"),446);function em_447(t,n){return t&&t.__esModule?t:{default:t,id:7322}}var r447=em_447(n("59"),447);function em_448(t,n){return t&&t.__esModule?t:{default:t,id:5234}}var r448=em_448(n("60"),448);function em_449(t,n){return t&&t.__esModule?t:{default:t,id:3146}}var r449=em_449(n("61"),449);function em_450(t,n){return t&&t.__esModule?t:{default:t,id:1058}}var r450=em_450(n("62"),450);function em_451(t,n){return t&&t.__esModule?t:{default:t,id:8977}}var r451=em_451(n("63"),451);function em_452(t,n){return t&&t.__esModule?t:{default:t,id:6889}}var r452=em_452(n("64"),452);function em_453(t,n){return t&&t.__esModule?t:{default:t,id:4801}}var r453=em_453(n("65"),453);function em_454(t,n){return t&&t.__esModule?t:{default:t,id:2713}}var r454=em_454(n("66"),454);function em_455(t,n){return t&&t.__esModule?t:{default:t,id:625}}var r455=em_455(n("67"),455);function em_456(t,n){return t&&t.__esModule?t:{default:t,id:8544}}var r456=em_456(n("68"),456);function em_457(t,n){return t&&t.__esModule?t:{default:t,id:6456}}var r457=em_457(n("69"),457);function em_458(t,n){return t&&t.__esModule?t:{default:t,id:4368}}var r458=em_458(n("70"),458);function em_459(t,n){return t&&t.__esModule?t:{default:t,id:2280}}var r459=em_459(n("71"),459);function em_460(t,n){return t&&t.__esModule?t:{default:t,id:192}}var r460=em_460(n("72"),460);function em_461(t,n){return t&&t.__esModule?t:{default:t,id:8111}}var r461=em_461(n("73"),461);function em_462(t,n){return t&&t.__esModule?t:{default:t,id:6023}}var r462=em_462(n("74"),462);function em_463(t,n){return t&&t.__esModule?t:{default:t,id:3935}}var r463=em_463(n("75"),463);function em_464(t,n){return t&&t.__esModule?t:{default:t,id:1847}}var r464=em_464(n("76"),464);function em_465(t,n){return t&&t.__esModule?t:{default:t,id:9766}}var r465=em_465(n("77"),465);function em_466(t,n){return t&&t.__esModule?t:{default:t,id:7678}}var r466=em_466(n("78"),466);function em_467(t,n){return t&&t.__esModule?t:{default:t,id:5590}}var r467=em_467(n("79"),467);function em_468(t,n){return t&&t.__esModule?t:{default:t,id:3502}}var r468=em_468(n("80"),468);function em_469(t,n){return t&&t.__esModule?t:{default:t,id:1414}}var r469=em_469(n("81"),469);function em_470(t,n){return t&&t.__esModule?t:{default:t,id:9333}}var r470=em_470(n("82"),470);function em_471(t,n){return t&&t.__esModule?t:{default:t,id:7245}}var r471=em_471(n("83"),471);function em_472(t,n){return t&&t.__esModule?t:{default:t,id:5157}}var r472=em_472(n("84"),472);function em_473(t,n){return t&&t.__esModule?t:{default:t,id:3069}}var r473=em_473(n("85"),473);function em_474(t,n){return t&&t.__esModule?t:{default:t,id:981}}var r474=em_474(n("86"),474);function em_475(t,n){return t&&t.__esModule?t:{default:t,id:8900}}var r475=em_475(n("87"),475);function em_476(t,n){return t&&t.__esModule?t:{default:t,id:6812}}var r476=em_476(n("88"),476);function em_477(t,n){return t&&t.__esModule?t:{default:t,id:4724}}var r477=em_477(n("89"),477);function em_478(t,n){return t&&t.__esModule?t:{default:t,id:2636}}var r478=em_478(n("90"),478);function em_479(t,n){return t&&t.__esModule?t:{default:t,id:548}}var r479=em_479(n("91"),479);function em_480(t,n){return t&&t.__esModule?t:{default:t,id:8467}}var r480=em_480(n("92"),480);function em_481(t,n){return t&&t.__esModule?t:{default:t,id:6379}}var r481=em_481(n("93"),481);function em_482(t,n){return t&&t.__esModule?t:{default:t,id:4291}}var r482=em_482(n("94"),482);function em_483(t,n){return t&&t.__esModule?t:{default:t,id:2203}}var r483=em_483(n("95"),483);function em_484(t,n){return t&&t.__esModule?t:{default:t,id:115}}var r484=em_484(n("96"),484);function em_485(t,n){return t&&t.__esModule?t:{default:t,id:8034}}var r485=em_485(n("0"),485);function em_486(t,n){return t&&t.__esModule?t:{default:t,id:5946}}var r486=em_486(n("1"),486);function em_487(t,n){return t&&t.__esModule?t:{default:t,id:3858}}var r487=em_487(n("2"),487);function em_488(t,n){return t&&t.__esModule?t:{default:t,id:1770}}var r488=em_488(n("3"),488);function em_489(t,n){return t&&t.__esModule?t:{default:t,id:9689}}var r489=em_489(n("4"),489);function em_490(t,n){return t&&t.__esModule?t:{default:t,id:7601}}var r490=em_490(n("5"),490);function em_491(t,n){return t&&t.__esModule?t:{default:t,id:5513}}var r491=em_491(n("6"),491);function em_492(t,n){return t&&t.__esModule?t:{default:t,id:3425}}var r492=em_492(n("7"),492);function em_493(t,n){return t&&t.__esModule?t:{default:t,id:1337}}var r493=em_493(n("8"),493);function em_494(t,n){return t&&t.__esModule?t:{default:t,id:9256}}var r494=em_494(n("9"),494);function em_495(t,n){return t&&t.__esModule?t:{default:t,id:7168}}var r495=em_495(n("10"),495);function em_496(t,n){return t&&t.__esModule?t:{default:t,id:5080}}var r496=em_496(n("11"),496);function em_497(t,n){return t&&t.__esModule?t:{default:t,id:2992}}var r497=em_497(n("12"),497);function em_498(t,n){return t&&t.__esModule?t:{default:t,id:904}}var r498=em_498(n("13"),498);function em_499(t,n){return t&&t.__esModule?t:{default:t,id:8823}}var r499=em_499(n("14"),499);function em_500(t,n){return t&&t.__esModule?t:{default:t,id:6735}}var r500=em_500(n("15"),500);function em_501(t,n){return t&&t.__esModule?t:{default:t,id:4647}}var r501=em_501(n("16"),501);function em_502(t,n){return t&&t.__esModule?t:{default:t,id:2559}}var r502=em_502(n("17"),502);function em_503(t,n){return t&&t.__esModule?t:{default:t,id:471}}var r503=em_503(n("18"),503);function em_504(t,n){return t&&t.__esModule?t:{default:t,id:8390}}var r504=em_504(n("19"),504);function em_505(t,n){return t&&t.__esModule?t:{default:t,id:6302}}var r505=em_505(n("20"),505);function em_506(t,n){return t&&t.__esModule?t:{default:t,id:4214}}var r506=em_506(n("21"),506);function em_507(t,n){return t&&t.__esModule?t:{default:t,id:2126}}var r507=em_507(n("22"),507);function em_508(t,n){return t&&t.__esModule?t:{default:t,id:38}}var r508=em_508(n("23"),508);function em_509(t,n){return t&&t.__esModule?t:{default:t,id:7957}}var r509=em_509(n("24"),509);function em_510(t,n){return t&&t.__esModule?t:{default:t,id:5869}}var r510=em_510(n("25"),510);function em_511(t,n){return t&&t.__esModule?t:{default:t,id:3781}}var r511=em_511(n("26"),511);function em_512(t,n){return t&&t.__esModule?t:{default:t,id:1693}}var r512=em_512(n("27"),512);function em_513(t,n){return t&&t.__esModule?t:{default:t,id:9612}}var r513=em_513(n("28"),513);function em_514(t,n){return t&&t.__esModule?t:{default:t,id:7524}}var r514=em_514(n("29"),514);function em_515(t,n){return t&&t.__esModule?t:{default:t,id:5436}}var r515=em_515(n("30"),515);function em_516(t,n){return t&&t.__esModule?t:{default:t,id:3348}}var r516=em_516(n("31"),516);function em_517(t,n){return t&&t.__esModule?t:{default:t,id:1260}}var r517=em_517(n("32"),517);function em_518(t,n){return t&&t.__esModule?t:{default:t,id:9179}}var r518=em_518(n("33"),518);function em_519(t,n){return t&&t.__esModule?t:{default:t,id:7091}}var r519=em_519(n("34"),519);function em_520(t,n){return t&&t.__esModule?t:{default:t,id:5003}}var r520=em_520(n("35"),520);function em_521(t,n){return t&&t.__esModule?t:{default:t,id:2915}}var r521=em_521(n("36"),521);function em_522(t,n){return t&&t.__esModule?t:{default:t,id:827}}var r522=em_522(n("37"),522);function em_523(t,n){return t&&t.__esModule?t:{default:t,id:8746}}var r523=em_523(n("38"),523);function em_524(t,n){return t&&t.__esModule?t:{default:t,id:6658}}var r524=em_524(n("39"),524);function em_525(t,n){return t&&t.__esModule?t:{default:t,id:4570}}var r525=em_525(n("40"),525);function em_526(t,n){return t&&t.__esModule?t:{default:t,id:2482}}var r526=em_526(n("41"),526);function em_527(t,n){return t&&t.__esModule?t:{default:t,id:394}}var r527=em_527(n("42"),527);function em_528(t,n){return t&&t.__esModule?t:{default:t,id:8313}}var r528=em_528(n("43"),528);function em_529(t,n){return t&&t.__esModule?t:{default:t,id:6225}}var r529=em_529(n("44"),529);function em_530(t,n){return t&&t.__esModule?t:{default:t,id:4137}}var r530=em_530(n("45"),530);function em_531(t,n){return t&&t.__esModule?t:{default:t,id:2049}}var r531=em_531(n("46"),531);function em_532(t,n){return t&&t.__esModule?t:{default:t,id:9968}}var r532=em_532(n("47"),532);function em_533(t,n){return t&&t.__esModule?t:{default:t,id:7880}}var r533=em_533(n("48"),533);function em_534(t,n){return t&&t.__esModule?t:{default:t,id:5792}}var r534=em_534(n("49"),534);function em_535(t,n){return t&&t.__esModule?t:{default:t,id:3704}}var r535=em_535(n("50"),535);function em_536(t,n){return t&&t.__esModule?t:{default:t,id:1616}}var r536=em_536(n("51"),536);function em_537(t,n){return t&&t.__esModule?t:{default:t,id:9535}}var r537=em_537(n("52"),537);function em_538(t,n){return t&&t.__esModule?t:{default:t,id:7447}}var r538=em_538(n("53"),538);function em_539(t,n){return t&&t.__esModule?t:{default:t,id:5359}}var r539=em_539(n("54"),539);function em_540(t,n){return t&&t.__esModule?t:{default:t,id:3271}}var r540=em_540(n("55"),540);function em_541(t,n){return t&&t.__esModule?t:{default:t,id:1183}}var r541=em_541(n("56"),541);function em_542(t,n){return t&&t.__esModule?t:{default:t,id:9102}}var r542=em_542(n("57"),542);function em_543(t,n){return t&&t.__esModule?t:{default:t,id:7014}}var r543=em_543(n("58"),543);function em_544(t,n){return t&&t.__esModule?t:{default:t,id:4926}}var r544=em_544(n("59"),544);function em_545(t,n){return t&&t.__esModule?t:{default:t,id:2838}}var r545=em_545(n("60"),545);function em_546(t,n){return t&&t.__esModule?t:{default:t,id:750}}var r546=em_546(n("61"),546);function em_547(t,n){return t&&t.__esModule?t:{default:t,id:8669}}var r547=em_547(n("62"),547);function em_548(t,n){return t&&t.__esModule?t:{default:t,id:6581}}var r548=em_548(n("63"),548);function em_549(t,n){return t&&t.__esModule?t:{default:t,id:4493}}var r549=em_549(n("64"),549);function em_550(t,n){return t&&t.__esModule?t:{default:t,id:2405}}var r550=em_550(n("65"),550);function em_551(t,n){return t&&t.__esModule?t:{default:t,id:317}}var r551=em_551(n("66"),551);function em_552(t,n){return t&&t.__esModule?t:{default:t,id:8236}}var r552=em_552(n("67"),552);function em_553(t,n){return t&&t.__esModule?t:{default:t,id:6148}}var r553=em_553(n("68"),553);function em_554(t,n){return t&&t.__esModule?t:{default:t,id:4060}}var r554=em_554(n("69"),554);function em_555(t,n){return t&&t.__esModule?t:{default:t,id:1972}}var r555=em_555(n("70"),555);function em_556(t,n){return t&&t.__esModule?t:{default:t,id:9891}}var r556=em_556(n("71"),556);function em_557(t,n){return t&&t.__esModule?t:{default:t,id:7803}}var r557=em_557(n("72"),557);function em_558(t,n){return t&&t.__esModule?t:{default:t,id:5715}}var r558=em_558(n("73"),558);function em_559(t,n){return t&&t.__esModule?t:{default:t,id:3627}}var r559=em_559(n("74"),559);function em_560(t,n){return t&&t.__esModule?t:{default:t,id:1539}}var r560=em_560(n("75"),560);function em_561(t,n){return t&&t.__esModule?t:{default:t,id:9458}}var r561=em_561(n("76"),561);function em_562(t,n){return t&&t.__esModule?t:{default:t,id:7370}}var r562=em_562(n("77"),562);function em_563(t,n){return t&&t.__esModule?t:{default:t,id:5282}}var r563=em_563(n("78"),563);function em_564(t,n){return t&&t.__esModule?t:{default:t,id:3194}}var r564=em_564(n("79"),564);function em_565(t,n){return t&&t.__esModule?t:{default:t,id:1106}}var r565=em_565(n("80"),565);function em_566(t,n){return t&&t.__esModule?t:{default:t,id:9025}}var r566=em_566(n("81"),566);function em_567(t,n){return t&&t.__esModule?t:{default:t,id:6937}}var r567=em_567(n("82"),567);function em_568(t,n){return t&&t.__esModule?t:{default:t,id:4849}}var r568=em_568(n("83"),568);function em_569(t,n){return t&&t.__esModule?t:{default:t,id:2761}}var r569=em_569(n("84"),569);function em_570(t,n){return t&&t.__esModule?t:{default:t,id:673}}var r570=em_570(n("85"),570);function em_571(t,n){return t&&t.__esModule?t:{default:t,id:8592}}var r571=em_571(n("86"),571);function em_572(t,n){return t&&t.__esModule?t:{default:t,id:6504}}var r572=em_572(n("87"),572);function em_573(t,n){return t&&t.__esModule?t:{default:t,id:4416}}var r573=em_573(n("88"),573);function em_574(t,n){return t&&t.__esModule?t:{default:t,id:2328}}var r574=em_574(n("89"),574);function em_575(t,n){return t&&t.__esModule?t:{default:t,id:240}}var r575=em_575(n("90"),575);function em_576(t,n){return t&&t.__esModule?t:{default:t,id:8159}}var r576=em_576(n("91"),576);function em_577(t,n){return t&&t.__esModule?t:{default:t,id:6071}}var r577=em_577(n("92"),577);function em_578(t,n){return t&&t.__esModule?t:{default:t,id:3983}}var r578=em_578(n("93"),578);function em_579(t,n){return t&&t.__esModule?t:{default:t,id:1895}}var r579=em_579(n("94"),579);function em_580(t,n){return t&&t.__esModule?t:{default:t,id:9814}}var r580=em_580(n("95"),580);function em_581(t,n){return t&&t.__esModule?t:{default:t,id:7726}}var r581=em_581(n("96"),581);function em_582(t,n){return t&&t.__esModule?t:{default:t,id:5638}}var r582=em_582(n("0"),582);function em_583(t,n){return t&&t.__esModule?t:{default:t,id:3550}}var r583=em_583(n("1"),583);function em_584(t,n){return t&&t.__esModule?t:{default:t,id:1462}}var r584=em_584(n("2"),584);function em_585(t,n){return t&&t.__esModule?t:{default:t,id:9381}}var r585=em_585(n("3"),585);function em_586(t,n){return t&&t.__esModule?t:{default:t,id:7293}}var r586=em_586(n("4"),586);function em_587(t,n){return t&&t.__esModule?t:{default:t,id:5205}}var r587=em_587(n("5"),587);function em_588(t,n){return t&&t.__esModule?t:{default:t,id:3117}}var r588=em_588(n("6"),588);function em_589(t,n){return t&&t.__esModule?t:{default:t,id:1029}}var r589=em_589(n("7"),589);function em_590(t,n){return t&&t.__esModule?t:{default:t,id:8948}}var r590=em_590(n("8"),590);function em_591(t,n){return t&&t.__esModule?t:{default:t,id:6860}}var r591=em_591(n("9"),591);function em_592(t,n){return t&&t.__esModule?t:{default:t,id:4772}}var r592=em_592(n("10"),592);function em_593(t,n){return t&&t.__esModule?t:{default:t,id:2684}}var r593=em_593(n("11"),593);function em_594(t,n){return t&&t.__esModule?t:{default:t,id:596}}var r594=em_594(n("12"),594);function em_595(t,n){return t&&t.__esModule?t:{default:t,id:8515}}var r595=em_595(n("13"),595);function em_596(t,n){return t&&t.__esModule?t:{default:t,id:6427}}var r596=em_596(n("14"),596);function em_597(t,n){return t&&t.__esModule?t:{default:t,id:4339}}var r597=em_597(n("15"),597);function em_598(t,n){return t&&t.__esModule?t:{default:t,id:2251}}var r598=em_598(n("16"),598);function em_599(t,n){return t&&t.__esModule?t:{default:t,id:163}}var r599=em_599(n("17"),599);function em_600(t,n){return t&&t.__esModule?t:{default:t,id:8082}}var r600=em_600(n("18"),600);function em_601(t,n){return t&&t.__esModule?t:{default:t,id:5994}}var r601=em_601(n("19"),601);function em_602(t,n){return t&&t.__esModule?t:{default:t,id:3906}}var r602=em_602(n("20"),602);function em_603(t,n){return t&&t.__esModule?t:{default:t,id:1818}}var r603=em_603(n("21"),603);function em_604(t,n){return t&&t.__esModule?t:{default:t,id:9737}}var r604=em_604(n("22"),604);function em_605(t,n){return t&&t.__esModule?t:{default:t,id:7649}}var r605=em_605(n("23"),605);function em_606(t,n){return t&&t.__esModule?t:{default:t,id:5561}}var r606=em_606(n("24"),606);function em_607(t,n){return t&&t.__esModule?t:{default:t,id:3473}}var r607=em_607(n("25"),607);function em_608(t,n){return t&&t.__esModule?t:{default:t,id:1385}}var r608=em_608(n("26"),608);function em_609(t,n){return t&&t.__esModule?t:{default:t,id:9304}}var r609=em_609(n("27"),609);function em_610(t,n){return t&&t.__esModule?t:{default:t,id:7216}}var r610=em_610(n("28"),610);function em_611(t,n){return t&&t.__esModule?t:{default:t,id:5128}}var r611=em_611(n("29"),611);function em_612(t,n){return t&&t.__esModule?t:{default:t,id:3040}}var r612=em_612(n("30"),612);function em_613(t,n){return t&&t.__esModule?t:{default:t,id:952}}var r613=em_613(n("31"),613);function em_614(t,n){return t&&t.__esModule?t:{default:t,id:8871}}var r614=em_614(n("32"),614);function em_615(t,n){return t&&t.__esModule?t:{default:t,id:6783}}var r615=em_615(n("33"),615);function em_616(t,n){return t&&t.__esModule?t:{default:t,id:4695}}var r616=em_616(n("34"),616);function em_617(t,n){return t&&t.__esModule?t:{default:t,id:2607}}var r617=em_617(n("35"),617);function em_618(t,n){return t&&t.__esModule?t:{default:t,id:519}}var r618=em_618(n("36"),618);function em_619(t,n){return t&&t.__esModule?t:{default:t,id:8438}}var r619=em_619(n("37"),619);function em_620(t,n){return t&&t.__esModule?t:{default:t,id:6350}}var r620=em_620(n("38"),620);function em_621(t,n){return t&&t.__esModule?t:{default:t,id:4262}}var r621=em_621(n("39"),621);function em_622(t,n){return t&&t.__esModule?t:{default:t,id:2174}}var r622=em_622(n("40"),622);function em_623(t,n){return t&&t.__esModule?t:{default:t,id:86}}var r623=em_623(n("41"),623);function em_624(t,n){return t&&t.__esModule?t:{default:t,id:8005}}var r624=em_624(n("42"),624);function em_625(t,n){return t&&t.__esModule?t:{default:t,id:5917}}var r625=em_625(n("43"),625);function em_626(t,n){return t&&t.__esModule?t:{default:t,id:3829}}var r626=em_626(n("44"),626);function em_627(t,n){return t&&t.__esModule?t:{default:t,id:1741}}var r627=em_627(n("45"),627);function em_628(t,n){return t&&t.__esModule?t:{default:t,id:9660}}var r628=em_628(n("46"),628);function em_629(t,n){return t&&t.__esModule?t:{default:t,id:7572}}var r629=em_629(n("47"),629);function em_630(t,n){return t&&t.__esModule?t:{default:t,id:5484}}var r630=em_630(n("48"),630);function em_631(t,n){return t&&t.__esModule?t:{default:t,id:3396}}var r631=em_631(n("49"),631);function em_632(t,n){return t&&t.__esModule?t:{default:t,id:1308}}var r632=em_632(n("50"),632);function em_633(t,n){return t&&t.__esModule?t:{default:t,id:9227}}var r633=em_633(n("51"),633);function em_634(t,n){return t&&t.__esModule?t:{default:t,id:7139}}var r634=em_634(n("52"),634);function em_635(t,n){return t&&t.__esModule?t:{default:t,id:5051}}var r635=em_635(n("53"),635);function em_636(t,n){return t&&t.__esModule?t:{default:t,id:2963}}var r636=em_636(n("54"),636);function em_637(t,n){return t&&t.__esModule?t:{default:t,id:875}}var r637=em_637(n("55"),637);function em_638(t,n){return t&&t.__esModule?t:{default:t,id:8794}}var r638=em_638(n("56"),638);function em_639(t,n){return t&&t.__esModule?t:{default:t,id:6706}}var r639=em_639(n("57"),639);function em_640(t,n){return t&&t.__esModule?t:{default:t,id:4618}}var r640=em_640(n("58"),640);function em_641(t,n){return t&&t.__esModule?t:{default:t,id:2530}}var r641=em_641(n("59"),641);function em_642(t,n){return t&&t.__esModule?t:{default:t,id:442}}var r642=em_642(n("60"),642);function em_643(t,n){return t&&t.__esModule?t:{default:t,id:8361}}var r643=em_643(n("61"),643);function em_644(t,n){return t&&t.__esModule?t:{default:t,id:6273}}var r644=em_644(n("62"),644);function em_645(t,n){return t&&t.__esModule?t:{default:t,id:4185}}var r645=em_645(n("63"),645);function em_646(t,n){return t&&t.__esModule?t:{default:t,id:2097}}var r646=em_646(n("64"),646);function em_647(t,n){return t&&t.__esModule?t:{default:t,id:9}}var r647=em_647(n("65"),647);function em_648(t,n){return t&&t.__esModule?t:{default:t,id:7928}}var r648=em_648(n("66"),648);function em_649(t,n){return t&&t.__esModule?t:{default:t,id:5840}}var r649=em_649(n("67"),649);function em_650(t,n){return t&&t.__esModule?t:{default:t,id:3752}}var r650=em_650(n("68"),650);function em_651(t,n){return t&&t.__esModule?t:{default:t,id:1664}}var r651=em_651(n("69"),651);function em_652(t,n){return t&&t.__esModule?t:{default:t,id:9583}}var r652=em_652(n("70"),652);function em_653(t,n){return t&&t.__esModule?t:{default:t,id:7495}}var r653=em_653(n("71"),653);function em_654(t,n){return t&&t.__esModule?t:{default:t,id:5407}}var r654=em_654(n("72"),654);function em_655(t,n){return t&&t.__esModule?t:{default:t,id:3319}}var r655=em_655(n("73"),655);function em_656(t,n){return t&&t.__esModule?t:{default:t,id:1231}}var r656=em_656(n("74"),656);function em_657(t,n){return t&&t.__esModule?t:{default:t,id:9150}}var r657=em_657(n("75"),657);function em_658(t,n){return t&&t.__esModule?t:{default:t,id:7062}}var r658=em_658(n("76"),658);function em_659(t,n){return t&&t.__esModule?t:{default:t,id:4974}}var r659=em_659(n("77"),659);function em_660(t,n){return t&&t.__esModule?t:{default:t,id:2886}}var r660=em_660(n("78"),660);function em_661(t,n){return t&&t.__esModule?t:{default:t,id:798}}var r661=em_661(n("79"),661);function em_662(t,n){return t&&t.__esModule?t:{default:t,id:8717}}var r662=em_662(n("80"),662);function em_663(t,n){return t&&t.__esModule?t:{default:t,id:6629}}var r663=em_663(n("81"),663);function em_664(t,n){return t&&t.__esModule?t:{default:t,id:4541}}var r664=em_664(n("82"),664);function em_665(t,n){return t&&t.__esModule?t:{default:t,id:2453}}var r665=em_665(n("83"),665);function em_666(t,n){return t&&t.__esModule?t:{default:t,id:365}}var r666=em_666(n("84"),666);function em_667(t,n){return t&&t.__esModule?t:{default:t,id:8284}}var r667=em_667(n("85"),667);function em_668(t,n){return t&&t.__esModule?t:{default:t,id:6196}}var r668=em_668(n("86"),668);function em_669(t,n){return t&&t.__esModule?t:{default:t,id:4108}}var r669=em_669(n("87"),669);function em_670(t,n){return t&&t.__esModule?t:{default:t,id:2020}}var r670=em_670(n("88"),670);function em_671(t,n){return t&&t.__esModule?t:{default:t,id:9939}}var r671=em_671(n("89"),671);function em_672(t,n){return t&&t.__esModule?t:{default:t,id:7851}}var r672=em_672(n("90"),672);function em_673(t,n){return t&&t.__esModule?t:{default:t,id:5763}}var r673=em_673(n("91"),673);function em_674(t,n){return t&&t.__esModule?t:{default:t,id:3675}}var r674=em_674(n("92"),674);function em_675(t,n){return t&&t.__esModule?t:{default:t,id:1587}}var r675=em_675(n("93"),675);function em_676(t,n){return t&&t.__esModule?t:{default:t,id:9506}}var r676=em_676(n("94"),676);function em_677(t,n){return t&&t.__esModule?t:{default:t,id:7418}}var r677=em_677(n("95"),677);function em_678(t,n){return t&&t.__esModule?t:{default:t,id:5330}}var r678=em_678(n("96"),678);function em_679(t,n){return t&&t.__esModule?t:{default:t,id:3242}}var r679=em_679(n("0"),679);function em_680(t,n){return t&&t.__esModule?t:{default:t,id:1154}}var r680=em_680(n("1"),680);function em_681(t,n){return t&&t.__esModule?t:{default:t,id:9073}}var r681=em_681(n("2"),681);function em_682(t,n){return t&&t.__esModule?t:{default:t,id:6985}}var r682=em_682(n("3"),682);function em_683(t,n){return t&&t.__esModule?t:{default:t,id:4897}}var r683=em_683(n("4"),683);function em_684(t,n){return t&&t.__esModule?t:{default:t,id:2809}}var r684=em_684(n("5"),684);function em_685(t,n){return t&&t.__esModule?t:{default:t,id:721}}var r685=em_685(n("6"),685);function em_686(t,n){return t&&t.__esModule?t:{default:t,id:8640}}var r686=em_686(n("7"),686);function em_687(t,n){return t&&t.__esModule?t:{default:t,id:6552}}var r687=em_687(n("8"),687);function em_688(t,n){return t&&t.__esModule?t:{default:t,id:4464}}var r688=em_688(n("9"),688);function em_689(t,n){return t&&t.__esModule?t:{default:t,id:2376}}var r689=em_689(n("10"),689);function em_690(t,n){return t&&t.__esModule?t:{default:t,id:288}}var r690=em_690(n("11"),690);function em_691(t,n){return t&&t.__esModule?t:{default:t,id:8207}}var r691=em_691(n("12"),691);function em_692(t,n){return t&&t.__esModule?t:{default:t,id:6119}}var r692=em_692(n("13"),692);function em_693(t,n){return t&&t.__esModule?t:{default:t,id:4031}}var r693=em_693(n("14"),693);function em_694(t,n){return t&&t.__esModule?t:{default:t,id:1943}}var r694=em_694(n("15")const Wt={key:"qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ=",iv:"k3vi7ZFUB8/XSID2AXEwug=="};const integrity="Zm9vYmFyYmF6cXV4Zm9vYmFyYmF6cXV4Zm9vYmFyYmE=";function en_0(t,n){return t&&t.__esModule?t:{default:t,id:0}}var r0=en_0(n("0"),0);function en_1(t,n){return t&&t.__esModule?t:{default:t,id:7919}}var r1=en_1(n("1"),1);function en_2(t,n){return t&&t.__esModule?t:{default:t,id:5831}}var r2=en_2(n("2"),2);function en_3(t,n){return t&&t.__esModule?t:{default:t,id:3743}}var r3=en_3(n("3"),3);function en_4(t,n){return t&&t.__esModule?t:{default:t,id:1655}}var r4=en_4(n("4"),4);function en_5(t,n){return t&&t.__esModule?t:{default:t,id:9574}}var r5=en_5(n("5"),5);function en_6(t,n){return t&&t.__esModule?t:{default:t,id:7486}}var r6=en_6(n("6"),6);function en_7(t,n){return t&&t.__esModule?t:{default:t,id:5398}}var r7=en_7(n("7"),7);function en_8(t,n){return t&&t.__esModule?t:{default:t,id:3310}}var r8=en_8(n("8"),8);function en_9(t,n){return t&&t.__esModule?t:{default:t,id:1222}}var r9=en_9(n("9"),9);function en_10(t,n){return t&&t.__esModule?t:{default:t,id:9141}}var r10=en_10(n("10"),10);function en_11(t,n){return t&&t.__esModule?t:{default:t,id:7053}}var r11=en_11(n("11"),11);function en_12(t,n){return t&&t.__esModule?t:{default:t,id:4965}}var r12=en_12(n("12"),12);function en_13(t,n){return t&&t.__esModule?t:{default:t,id:2877}}var r13=en_13(n("13"),13);function en_14(t,n){return t&&t.__esModule?t:{default:t,id:789}}var r14=en_14(n("14"),14);function en_15(t,n){return t&&t.__esModule?t:{default:t,id:8708}}var r15=en_15(n("15"),15);function en_16(t,n){return t&&t.__esModule?t:{default:t,id:6620}}var r16=en_16(n("16"),16);function en_17(t,n){return t&&t.__esModule?t:{default:t,id:4532}}var r17=en_17(n("17"),17);function en_18(t,n){return t&&t.__esModule?t:{default:t,id:2444}}var r18=en_18(n("18"),18);function en_19(t,n){return t&&t.__esModule?t:{default:t,id:356}}var r19=en_19(n("19"),19);function en_20(t,n){return t&&t.__esModule?t:{default:t,id:8275}}var r20=en_20(n("20"),20);function en_21(t,n){return t&&t.__esModule?t:{default:t,id:6187}}var r21=en_21(n("21"),21);function en_22(t,n){return t&&t.__esModule?t:{default:t,id:4099}}var r22=en_22(n("22"),22);function en_23(t,n){return t&&t.__esModule?t:{default:t,id:2011}}var r23=en_23(n("23"),23);function en_24(t,n){return t&&t.__esModule?t:{default:t,id:9930}}var r24=en_24(n("24"),24);function en_25(t,n){return t&&t.__esModule?t:{default:t,id:7842}}var r25=en_25(n("25"),25);function en_26(t,n){return t&&t.__esModule?t:{default:t,id:5754}}var r26=en_26(n("26"),26);function en_27(t,n){return t&&t.__esModule?t:{default:t,id:3666}}var r27=en_27(n("27"),27);function en_28(t,n){return t&&t.__esModule?t:{default:t,id:1578}}var r28=en_28(n("28"),28);function en_29(t,n){return t&&t.__esModule?t:{default:t,id:9497}}var r29=en_29(n("29"),29);function en_30(t,n){return t&&t.__esModule?t:{default:t,id:7409}}var r30=en_30(n("30"),30);function en_31(t,n){return t&&t.__esModule?t:{default:t,id:5321}}var r31=en_31(n("31"),31);function en_32(t,n){return t&&t.__esModule?t:{default:t,id:3233}}var r32=en_32(n("32"),32);function en_33(t,n){return t&&t.__esModule?t:{default:t,id:1145}}var r33=en_33(n("33"),33);function en_34(t,n){return t&&t.__esModule?t:{default:t,id:9064}}var r34=en_34(n("34"),34);function en_35(t,n){return t&&t.__esModule?t:{default:t,id:6976}}var r35=en_35(n("35"),35);function en_36(t,n){return t&&t.__esModule?t:{default:t,id:4888}}var r36=en_36(n("36"),36);function en_37(t,n){return t&&t.__esModule?t:{default:t,id:2800}}var r37=en_37(n("37"),37);function en_38(t,n){return t&&t.__esModule?t:{default:t,id:712}}var r38=en_38(n("38"),38);function en_39(t,n){return t&&t.__esModule?t:{default:t,id:8631}}var r39=en_39(n("39"),39);function en_40(t,n){return t&&t.__esModule?t:{default:t,id:6543}}var r40=en_40(n("40"),40);function en_41(t,n){return t&&t.__esModule?t:{default:t,id:4455}}var r41=en_41(n("41"),41);function en_42(t,n){return t&&t.__esModule?t:{default:t,id:2367}}var r42=en_42(n("42"),42);function en_43(t,n){return t&&t.__esModule?t:{default:t,id:279}}var r43=en_43(n("43"),43);function en_44(t,n){return t&&t.__esModule?t:{default:t,id:8198}}var r44=en_44(n("44"),44);function en_45(t,n){return t&&t.__esModule?t:{default:t,id:6110}}var r45=en_45(n("45"),45);function en_46(t,n){return t&&t.__esModule?t:{default:t,id:4022}}var r46=en_46(n("46"),46);function en_47(t,n){return t&&t.__esModule?t:{default:t,id:1934}}var r47=en_47(n("47"),47);function en_48(t,n){return t&&t.__esModule?t:{default:t,id:9853}}var r48=en_48(n("48"),48);function en_49(t,n){return t&&t.__esModule?t:{default:t,id:7765}}var r49=en_49(n("49"),49);function en_50(t,n){return t&&t.__esModule?t:{default:t,id:5677}}var r50=en_50(n("50"),50);function en_51(t,n){return t&&t.__esModule?t:{default:t,id:3589}}var r51=en_51(n("51"),51);function en_52(t,n){return t&&t.__esModule?t:{default:t,id:1501}}var r52=en_52(n("52"),52);function en_53(t,n){return t&&t.__esModule?t:{default:t,id:9420}}var r53=en_53(n("53"),53);function en_54(t,n){return t&&t.__esModule?t:{default:t,id:7332}}var r54=en_54(n("54"),54);function en_55(t,n){return t&&t.__esModule?t:{default:t,id:5244}}var r55=en_55(n("55"),55);function en_56(t,n){return t&&t.__esModule?t:{default:t,id:3156}}var r56=en_56(n("56"),56);function en_57(t,n){return t&&t.__esModule?t:{default:t,id:1068}}var r57=en_57(n("57"),57);function en_58(t,n){return t&&t.__esModule?t:{default:t,id:8987}}var r58=en_58(n("58"),58);function en_59(t,n){return t&&t.__esModule?t:{default:t,id:6899}}var r59=en_59(n("59"),59);function en_60(t,n){return t&&t.__esModule?t:{default:t,id:4811}}var r60=en_60(n("60"),60);function en_61(t,n){return t&&t.__esModule?t:{default:t,id:2723}}var r61=en_61(n("61"),61);function en_62(t,n){return t&&t.__esModule?t:{default:t,id:635}}var r62=en_62(n("62"),62);function en_63(t,n){return t&&t.__esModule?t:{default:t,id:8554}}var r63=en_63(n("63"),63);function en_64(t,n){return t&&t.__esModule?t:{default:t,id:6466}}var r64=en_64(n("64"),64);function en_65(t,n){return t&&t.__esModule?t:{default:t,id:4378}}var r65=en_65(n("65"),65);function en_66(t,n){return t&&t.__esModule?t:{defaul}]);
\ No newline at end of file
@@ -0,0 +1 @@
+(()=>{"use strict";var e={},r={};function t(o){var n=r[o];if(void 0!==n)return n.exports;}t.u=e=>e+"."+{592:"a1b2c3d4e5f6a7b8","common":"0f1e2d3c4b5a6978"}[e]+".js";t.p="";})();
\ No newline at end of file
@@ -0,0 +1 @@
+/*! jQuery v3.7.1 */function es_0(t,n){return t&&t.__esModule?t:{default:t,id:0}}var r0=es_0(n("0"),0);function es_1(t,n){return t&&t.__esModule?t:{default:t,id:7919}}var r1=es_1(n("1"),1);function es_2(t,n){return t&&t.__esModule?t:{default:t,id:5831}}var r2=es_2(n("2"),2);function es_3(t,n){return t&&t.__esModule?t:{default:t,id:3743}}var r3=es_3(n("3"),3);function es_4(t,n){return t&&t.__esModule?t:{default:t,id:1655}}var r4=es_4(n("4"),4);function es_5(t,n){return t&&t.__esModule?t:{default:t,id:9574}}var r5=es_5(n("5"),5);function es_6(t,n){return t&&t.__esModule?t:{default:t,id:7486}}var r6=es_6(n("6"),6);function es_7(t,n){return t&&t.__esModule?t:{default:t,id:5398}}var r7=es_7(n("7"),7);function es_8(t,n){return t&&t.__esModule?t:{default:t,id:3310}}var r8=es_8(n("8"),8);function es_9(t,n){return t&&t.__esModule?t:{default:t,id:1222}}var r9=es_9(n("9"),9);function es_10(t,n){return t&&t.__esModule?t:{default:t,id:9141}}var r10=es_10(n("10"),10);function es_11(t,n){return t&&t.__esModule?t:{default:t,id:7053}}var r11=es_11(n("11"),11);function es_12(t,n){return t&&t.__esModule?t:{default:t,id:4965}}var r12=es_12(n("12"),12);function es_13(t,n){return t&&t.__esModule?t:{default:t,id:2877}}var r13=es_13(n("13"),13);function es_14(t,n){return t&&t.__esModule?t:{default:t,id:789}}var r14=es_14(n("14"),14);function es_15(t,n){return t&&t.__esModule?t:{default:t,id:8708}}var r15=es_15(n("15"),15);function es_16(t,n){return t&&t.__esModule?t:{default:t,id:6620}}var r16=es_16(n("16"),16);function es_17(t,n){return t&&t.__esModule?t:{default:t,id:4532}}var r17=es_17(n("17"),17);function es_18(t,n){return t&&t.__esModule?t:{default:t,id:2444}}var r18=es_18(n("18"),18);function es_19(t,n){return t&&t.__esModule?t:{default:t,id:356}}var r19=es_19(n("19"),19);function es_20(t,n){return t&&t.__esModule?t:{default:t,id:8275}}var r20=es_20(n("20"),20);function es_21(t,n){return t&&t.__esModule?t:{default:t,id:6187}}var r21=es_21(n("21"),21);function es_22(t,n){return t&&t.__esModule?t:{default:t,id:4099}}var r22=es_22(n("22"),22);function es_23(t,n){return t&&t.__esModule?t:{default:t,id:2011}}var r23=es_23(n("23"),23);function es_24(t,n){return t&&t.__esModule?t:{default:t,id:9930}}var r24=es_24(n("24"),24);function es_25(t,n){return t&&t.__esModule?t:{default:t,id:7842}}var r25=es_25(n("25"),25);function es_26(t,n){return t&&t.__esModule?t:{default:t,id:5754}}var r26=es_26(n("26"),26);function es_27(t,n){return t&&t.__esModule?t:{default:t,id:3666}}var r27=es_27(n("27"),27);function es_28(t,n){return t&&t.__esModule?t:{default:t,id:1578}}var r28=es_28(n("28"),28);function es_29(t,n){return t&&t.__esModule?t:{default:t,id:9497}}var r29=es_29(n("29"),29);function es_30(t,n){return t&&t.__esModule?t:{default:t,id:7409}}var r30=es_30(n("30"),30);function es_31(t,n){return t&&t.__esModule?t:{default:t,id:5321}}var r31=es_31(n("31"),31);function es_32(t,n){return t&&t.__esModule?t:{default:t,id:3233}}var r32=es_32(n("32"),32);function es_33(t,n){return t&&t.__esModule?t:{default:t,id:1145}}var r33=es_33(n("33"),33);function es_34(t,n){return t&&t.__esModule?t:{default:t,id:9064}}var r34=es_34(n("34"),34);function es_35(t,n){return t&&t.__esModule?t:{default:t,id:6976}}var r35=es_35(n("35"),35);function es_36(t,n){return t&&t.__esModule?t:{default:t,id:4888}}var r36=es_36(n("36"),36);function es_37(t,n){return t&&t.__esModule?t:{default:t,id:2800}}var r37=es_37(n("37"),37);function es_38(t,n){return t&&t.__esModule?t:{default:t,id:712}}var r38=es_38(n("38"),38);function es_39(t,n){return t&&t.__esModule?t:{default:t,id:8631}}var r39=es_39(n("39"),39);function es_40(t,n){return t&&t.__esModule?t:{default:t,id:6543}}var r40=es_40(n("40"),40);function es_41(t,n){return t&&t.__esModule?t:{default:t,id:4455}}var r41=es_41(n("41"),41);function es_42(t,n){return t&&t.__esModule?t:{default:t,id:2367}}var r42=es_42(n("42"),42);function es_43(t,n){return t&&t.__esModule?t:{default:t,id:279}}var r43=es_43(n("43"),43);function es_44(t,n){return t&&t.__esModule?t:{default
\ No newline at end of file
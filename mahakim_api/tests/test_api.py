@@ -0,0 +1,207 @@
+"""
+Bout en bout: l'API appelle le faux Mahakim (bench/mock_mahakim.py) par ASGITransport
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+import main
+
+pytestmark = pytest.mark.anyio
+
+DOSSIER = "/dossier/13/202512028569"
+
+
+async def test_miss_then_cache_hit(api, mahakim):
+    first = await api.get(DOSSIER)
+    assert first.status_code == 200
+    assert first.json()["source"] == "api"
+    assert first.json()["data"]["carte"]["numeroCompletDossier"] == "202512028569"
+    assert len(first.json()["data"]["decisions"]) == mahakim.CONFIG["decisions"]
+    assert mahakim.stats["requests"] == 4
+
+    second = await api.get(DOSSIER)
+    assert second.json()["source"] == "cache"
+    assert second.json()["data"] == {**first.json()["data"], "timestamp": second.json()["data"]["timestamp"]}
+    assert second.headers["etag"] == first.headers["etag"]
+    assert mahakim.stats["requests"] == 4
+
+    not_modified = await api.get(DOSSIER, headers={"If-None-Match": first.headers["etag"]})
+    assert not_modified.status_code == 304
+
+
+async def test_compressed_hit_served_as_is(api):
+    await api.get(DOSSIER)
+    response = await api.get(DOSSIER, headers={"Accept-Encoding": "deflate"})
+    assert response.headers["content-encoding"] == "deflate"
+    assert response.json()["source"] == "cache"
+
+
+async def test_concurrent_requests_share_one_fetch(api, mahakim):
+    mahakim.CONFIG["latency"] = 20
+    responses = await asyncio.gather(*(api.get(DOSSIER) for _ in range(5)))
+    assert all(response.status_code == 200 for response in responses)
+    assert mahakim.stats["requests"] == 4
+    assert main.dossier_flights.coalesced == 4
+
+
+async def test_projection(api):
+    response = await api.get(DOSSIER, params={"sections": "carte", "fields": "carte.affaire"})
+    data = response.json()["data"]
+    assert data["carte"] == {"affaire": "DC"}
+    assert "decisions" not in data
+    bad = await api.get(DOSSIER, params={"sections": "inconnue"})
+    assert bad.status_code == 400
+
+
+async def test_invalid_ids_never_reach_mahakim(api, mahakim):
+    assert (await api.get("/dossier/13/12")).status_code == 400
+    assert (await api.get("/dossier/abc/202512028569")).status_code == 400
+    assert mahakim.stats["requests"] == 0
+    assert main.negative_stats["invalid_rejected"] == 2
+
+
+async def test_cache_stats_and_clear(api):
+    await api.get(DOSSIER)
+    stats = (await api.get("/cache/stats")).json()
+    assert stats["backend"] == "local" and stats["entries"] == 1 and stats["bytes"] > 0
+    await api.delete("/cache")
+    assert (await api.get("/cache/stats")).json()["entries"] == 0
+
+
+async def test_changes_tracked_after_first_call(api, mahakim):
+    await api.get(DOSSIER)
+    # Sans appel à /changes ni suivi, aucun historique n'est tenu
+    assert await main.load_history("13:202512028569") is None
+
+    first = (await api.get(f"{DOSSIER}/changes")).json()
+    assert first["complete"] is False and first["changes"] == []
+
+    mahakim.CONFIG["decisions"] += 1
+    await main.cache_backend.delete("13:202512028569")
+    since = first["etag"]
+    response = (await api.get(f"{DOSSIER}/changes", params={"since": since})).json()
+    assert response["complete"] is True
+    [change] = response["changes"]
+    assert change["from"] == since and change["to"] == response["etag"]
+    assert len(change["diff"]["decisions"]["added"]) == 1
+
+
+async def test_upstream_failures_map_to_502_then_503(api, mahakim):
+    mahakim.CONFIG["error_rate"] = 1
+    first = await api.get(DOSSIER)
+    assert first.status_code == 502
+    statuses = [(await api.get(DOSSIER)).status_code for _ in range(3)]
+    # Disjoncteur ouvert: plus aucun appel à Mahakim
+    assert statuses[-1] == 503
+    calls = mahakim.stats["requests"]
+    assert (await api.get(DOSSIER)).status_code == 503
+    assert mahakim.stats["requests"] == calls
+
+
+async def test_prefetch_job_visible_from_shared_state(api, mahakim):
+    body = "id_juridiction,id_dossier\n13,202512028569\n13,202512028570\n13,202512028571\n"
+    job = (await api.post("/cache/prefetch", params={"rate": 100}, content=body)).json()
+    assert job["total"] == 3
+    for _ in range(100):
+        state = (await api.get(f"/cache/prefetch/{job['id']}")).json()
+        if state["status"] == "done":
+            break
+        await asyncio.sleep(0.02)
+    assert (state["fetched"], state["failed"]) == (3, 0)
+
+    # Autre worker: la tâche n'est connue que par l'état publié
+    await asyncio.sleep(0.05)
+    main.prefetch_jobs.clear()
+    published = (await api.get(f"/cache/prefetch/{job['id']}")).json()
+    assert published["status"] == "done" and published["fetched"] == 3
+    assert [item["id"] for item in (await api.get("/cache/prefetch")).json()][-1] == job["id"]
+    assert (await api.get("/cache/prefetch/inconnue")).status_code == 404
+
+    again = (await api.post("/cache/prefetch", content=body)).json()
+    for _ in range(100):
+        state = (await api.get(f"/cache/prefetch/{again['id']}")).json()
+        if state["status"] == "done":
+            break
+        await asyncio.sleep(0.02)
+    assert state["cached"] == 3
+
+
+async def test_watch_poll_notifies_changes(api, mahakim, monkeypatch):
+    monkeypatch.setattr(main, "WATCH_CALLBACK_HOSTS", {"odoo"})
+    notifications = []
+
+    def receive(request: httpx.Request) -> httpx.Response:
+        notifications.append(json.loads(request.content))
+        return httpx.Response(204)
+
+    main.watchlist.add("13", "202512028569", "http://odoo/mahakim/changes")
+    watch = main.watchlist.watches["13:202512028569"]
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(receive)) as notifier:
+            await main.poll_watch(watch, notifier)
+            assert notifications == [] and watch.next_poll > 0
+            mahakim.CONFIG["parties"] += 1
+            await main.poll_watch(watch, notifier)
+    finally:
+        main.watchlist.remove(watch.key)
+    [event] = notifications
+    assert event["event"] == "dossier.changed" and event["complete"] is True
+    assert len(event["changes"][0]["diff"]["parties"]["added"]) == 1
+
+
+async def test_failed_section_is_served_empty(api, mahakim, monkeypatch):
+    fetch_section = main.fetch_section
+
+    async def flaky(url, params):
+        if url.endswith("/ListeParties"):
+            raise httpx.ConnectError("Mahakim injoignable")
+        return await fetch_section(url, params)
+
+    monkeypatch.setattr(main, "fetch_section", flaky)
+    data = (await api.get(DOSSIER)).json()["data"]
+    assert data["partial"] is True and list(data["errors"]) == ["parties"]
+    # Liste vide et non null: le module Odoo itère sur chaque section
+    assert data["parties"] == []
+    assert len(data["decisions"]) == mahakim.CONFIG["decisions"]
+    assert data["carte"]["numeroCompletDossier"] == "202512028569"
+
+
+async def test_hit_rate_counts_only_dossier_lookups(api):
+    for _ in range(3):
+        await api.get(DOSSIER)
+    # Ni le marqueur "introuvable" ni l'historique ne comptent comme des échecs
+    stats = (await api.get("/cache/stats")).json()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (2, 1, 0.6667)
+
+
+async def test_watch_callback_restricted_to_allowed_hosts(api, monkeypatch):
+    monkeypatch.setattr(main, "WATCH_CALLBACK_HOSTS", {"odoo"})
+    dossiers = [{"id_juridiction": "13", "id_dossier": "202512028569"}]
+    for url in ("http://169.254.169.254/latest", "http://odoo.evil.example/", "file:///etc/passwd"):
+        response = await api.post("/watchlist", json={"dossiers": dossiers, "callback_url": url})
+        assert response.status_code == 422
+    assert len(main.watchlist) == 0
+    try:
+        response = await api.post("/watchlist", json={"dossiers": dossiers, "callback_url": "https://odoo/mahakim"})
+        assert response.status_code == 200 and response.json()["added"] == 1
+    finally:
+        main.watchlist.remove("13:202512028569")
+
+
+@pytest.mark.parametrize("header, accepted", [
+    ("deflate", True),
+    ("gzip, deflate;q=0.5", True),
+    ("*", True),
+    ("gzip", False),
+    ("", False),
+    ("deflate;q=0", False),
+    ("*, deflate;q=0", False),
+    ("deflate;q=0, *", False),
+    ("*;q=0, deflate", True),
+    ("deflate;q=abc", False),
+])
+def test_accepts_encoding(header, accepted):
+    assert main.accepts_encoding(header, "deflate") is accepted
@@ -0,0 +1,89 @@
+from cache import TTLCache, estimate_size
+
+
+def test_get_returns_value_until_expiry(clock):
+    cache = TTLCache(default_ttl=60, clock=clock)
+    cache.set("a", {"x": 1})
+    assert cache.get("a") == {"x": 1}
+    clock.advance(60)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction_on_max_entries(clock):
+    cache = TTLCache(max_entries=2, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" devient la moins récente
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_byte_budget_evicts_and_rejects(clock):
+    cache = TTLCache(max_bytes=100, clock=clock)
+    cache.set("a", b"x" * 40)
+    cache.set("b", b"x" * 40)
+    cache.set("c", b"x" * 40)
+    assert "a" not in cache
+    assert cache.bytes == 80
+    # Plus grosse que tout le budget: jamais conservée, l'ancienne valeur est retirée
+    cache.set("b", b"x" * 101)
+    assert "b" not in cache
+    assert cache.rejected == 1
+    assert cache.bytes == 40
+
+
+def test_replacement_updates_byte_count(clock):
+    cache = TTLCache(clock=clock)
+    cache.set("a", b"x" * 10)
+    cache.set("a", b"x" * 30)
+    assert cache.bytes == 30
+    assert len(cache) == 1
+    cache.delete("a")
+    assert cache.bytes == 0
+
+
+def test_sweep_removes_only_expired(clock):
+    cache = TTLCache(clock=clock)
+    cache.set("short", 1, ttl=10)
+    cache.set("long", 2, ttl=100)
+    cache.set("replaced", 3, ttl=10)
+    cache.set("replaced", 4, ttl=100)
+    clock.advance(50)
+    # L'élément périmé de "replaced" dans le tas ne supprime pas la nouvelle valeur
+    assert cache.sweep() == 1
+    assert "long" in cache and cache.get("replaced") == 4
+    assert cache.expirations == 1
+
+
+def test_heap_is_rebuilt_after_many_replacements(clock):
+    cache = TTLCache(clock=clock)
+    for i in range(500):
+        cache.set("a", i, ttl=10 + i)
+    assert len(cache._heap) <= 2 * len(cache) + 64
+    clock.advance(10_000)
+    assert cache.sweep() == 1
+
+
+def test_largest_lists_biggest_entries(clock):
+    cache = TTLCache(clock=clock)
+    for name, size in (("a", 10), ("b", 30), ("c", 20)):
+        cache.set(name, b"x" * size, ttl=60)
+    assert [item["key"] for item in cache.largest(2)] == ["b", "c"]
+    assert cache.largest(1)[0] == {"key": "b", "bytes": 30, "ttl": 60}
+
+
+def test_estimate_size():
+    assert estimate_size(b"abc") == 3
+    assert estimate_size({"a": "é"}) == len('{"a": "é"}'.encode())
+
+
+def test_uncounted_get(clock):
+    cache = TTLCache(clock=clock)
+    cache.set("a", 1)
+    assert cache.get("a", count=False) == 1
+    assert cache.get("b", count=False) is None
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,167 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from cache import TTLCache
+from cache_backends import LocalBackend, RedisBackend
+from disk_cache import DiskCache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def redis_backend(server, prefix="test:"):
+    backend = RedisBackend("redis://fake", prefix)
+    backend._redis = fakeredis.aioredis.FakeRedis(server=server)
+    return backend
+
+
+@pytest.fixture
+async def redis(server):
+    backend = redis_backend(server)
+    yield backend
+    await backend.close()
+
+
+async def test_redis_get_set_roundtrip(redis):
+    await redis.set("dossier", {"carte": {"affaire": "DC"}}, ttl=60)
+    await redis.set("blob", b"\x00\x01packed", ttl=60)
+    assert await redis.get("dossier") == {"carte": {"affaire": "DC"}}
+    assert await redis.get("blob") == b"\x00\x01packed"
+    assert await redis.get("absent") is None
+    assert (redis.hits, redis.misses, redis.errors) == (2, 1, 0)
+
+
+async def test_redis_ttl_and_delete(redis):
+    await redis.set("a", 1, ttl=0.05)
+    await redis.set("b", 2, ttl=60)
+    await asyncio.sleep(0.1)
+    assert await redis.get("a") is None
+    await redis.delete("b")
+    assert await redis.get("b") is None
+
+
+async def test_redis_clear_keeps_other_prefixes_and_state(server, redis):
+    other = redis_backend(server, "autre:")
+    for i in range(1200):
+        await redis.set(f"k{i}", i, ttl=60)
+    await other.set("k1", "x", ttl=60)
+    await redis.save_state("watchlist", {"watches": []})
+    await redis.clear()
+    assert await redis.get("k1") is None
+    assert await other.get("k1") == "x"
+    assert await redis.load_state("watchlist") == {"watches": []}
+    await other.close()
+
+
+async def test_redis_state(redis):
+    assert await redis.load_state("keys") is None
+    await redis.save_state("keys", {"key": "k", "iv": "i"})
+    assert await redis.load_state("keys") == {"key": "k", "iv": "i"}
+    await redis.delete_state("keys")
+    assert await redis.load_state("keys") is None
+
+
+async def test_redis_lease_is_exclusive_and_expires(server, redis):
+    other = redis_backend(server)
+    assert await redis.acquire_lease("watchlist", "A", ttl=0.1)
+    assert not await other.acquire_lease("watchlist", "B", ttl=0.1)
+    # Renouvelé par son détenteur
+    assert await redis.acquire_lease("watchlist", "A", ttl=0.1)
+    await asyncio.sleep(0.15)
+    assert await other.acquire_lease("watchlist", "B", ttl=0.1)
+    assert not await redis.acquire_lease("watchlist", "A", ttl=0.1)
+    await other.close()
+
+
+async def test_redis_publish_reaches_other_workers(server, redis):
+    other = redis_backend(server)
+    received = []
+
+    async def listen():
+        async for event in other.events():
+            received.append(event)
+            return
+
+    listener = asyncio.create_task(listen())
+    await asyncio.sleep(0.05)
+    await redis.publish({"type": "keys", "origin": "A", "key": "k", "iv": "i"})
+    await asyncio.wait_for(listener, 2)
+    assert received == [{"type": "keys", "origin": "A", "key": "k", "iv": "i"}]
+    await other.close()
+
+
+class Unreachable:
+    """Client Redis dont chaque commande échoue"""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise ConnectionError("Redis injoignable")
+        return fail
+
+
+async def test_redis_errors_are_misses():
+    backend = RedisBackend("redis://fake", "test:")
+    backend._redis = Unreachable()
+    assert await backend.get("a") is None
+    await backend.set("a", 1, ttl=60)
+    assert await backend.load_state("keys") is None
+    assert not await backend.acquire_lease("watchlist", "A", ttl=10)
+    assert backend.errors == 4
+    assert (await backend.stats())["used_memory"] is None
+
+
+async def test_local_backend_restores_from_disk(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    backend = LocalBackend(TTLCache(clock=clock), DiskCache(path, clock=clock))
+    await backend.set("a", b"packed", ttl=60)
+    await backend.close()
+
+    # Redémarrage: mémoire vide, entrée relue sur disque avec son expiration d'origine
+    clock.advance(20)
+    memory = TTLCache(clock=clock)
+    restarted = LocalBackend(memory, DiskCache(path, clock=clock))
+    assert await restarted.get("a") == b"packed"
+    assert memory.largest(1)[0]["ttl"] == 40
+    stats = await restarted.stats()
+    assert stats["disk"]["entries"] == 1 and stats["disk"]["hits"] == 1
+    await restarted.close()
+
+
+async def test_disk_counters_follow_writes(tmp_path, clock):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), clock=clock)
+    backend = LocalBackend(TTLCache(clock=clock), disk)
+    await backend.set("a", b"x" * 10, ttl=10)
+    await backend.set("a", b"x" * 20, ttl=10)
+    await backend.set("b", b"x" * 5, ttl=100)
+    assert (disk.entries, disk.bytes) == (2, 27)
+    clock.advance(50)
+    await backend.sweep()
+    assert (disk.entries, disk.bytes, disk.expirations) == (1, 6, 1)
+    await backend.delete("b")
+    assert (disk.entries, disk.bytes) == (0, 0)
+    await backend.close()
+
+
+async def test_local_state_and_lease_shared_through_disk(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite3")
+    first = LocalBackend(TTLCache(), DiskCache(path, clock=clock))
+    second = LocalBackend(TTLCache(), DiskCache(path, clock=clock))
+    assert first.shared and not LocalBackend(TTLCache()).shared
+
+    await first.save_state("watchlist", {"watches": [1]})
+    assert await second.load_state("watchlist") == {"watches": [1]}
+    await second.save_state("watchlist", {"watches": [1, 2]})
+    assert await first.load_state("watchlist") == {"watches": [1, 2]}
+
+    assert await first.acquire_lease("watchlist", "A", ttl=30)
+    assert not await second.acquire_lease("watchlist", "B", ttl=30)
+    clock.advance(30)
+    assert await second.acquire_lease("watchlist", "B", ttl=30)
+    await first.close()
+    await second.close()
@@ -0,0 +1,100 @@
+import changes
+from packed import PackedEntry
+
+
+def dossier(decisions, hearing="25/11/2025", timestamp="2025-11-01T10:00:00"):
+    return {
+        "carte": {"idDossierCivil": 1, "lastJugement": {"dateProchaineAudienceString": hearing}},
+        "decisions": decisions,
+        "parties": [{"idPartie": 7, "nomPrenomPartie": "A"}],
+        "expertises": [],
+        "timestamp": timestamp
+    }
+
+
+def test_diff_dossier_by_section():
+    old = dossier([{"idDecision": 1, "contenu": "a"}, {"idDecision": 2, "contenu": "b"}])
+    new = dossier([{"idDecision": 1, "contenu": "a2"}, {"idDecision": 3, "contenu": "c"}],
+                  hearing="02/12/2025", timestamp="2025-11-02T10:00:00")
+    diff = changes.diff_dossier(old, new)
+    assert set(diff) == {"carte", "decisions"}
+    assert diff["carte"] == {"lastJugement.dateProchaineAudienceString": {"old": "25/11/2025", "new": "02/12/2025"}}
+    assert diff["decisions"] == {
+        "added": [{"idDecision": 3, "contenu": "c"}],
+        "changed": [{"id": "1", "fields": {"contenu": {"old": "a", "new": "a2"}}}],
+        "removed": ["2"]
+    }
+
+
+def test_diff_ignores_timestamp_and_unchanged_sections():
+    old = dossier([])
+    assert changes.diff_dossier(old, {**old, "timestamp": "2026-01-01T00:00:00"}) == {}
+
+
+def test_items_without_id_are_keyed_by_content():
+    diff = changes.diff_list("expertises", [{"x": 1}], [{"x": 1}, {"x": 2}])
+    assert diff == {"added": [{"x": 2}]}
+
+
+def test_section_type_change():
+    assert changes.diff_dossier({"carte": None}, {"carte": {"a": 1}}) == {"carte": {"old": None, "new": {"a": 1}}}
+
+
+def entry(data):
+    return PackedEntry.build(data, {"carte": 1.0})
+
+
+def test_history_records_changes_and_keeps_compressed_reference():
+    first = entry(dossier([]))
+    history = changes.record_version(None, first, max_changes=5)
+    assert history.etag == first.etag and history.changes == []
+    assert history.body == first.body
+    assert changes.record_version(history, entry(dossier([], timestamp="2025-11-01T11:00:00")), 5) is history
+
+    second = entry(dossier([{"idDecision": 1}], timestamp="2025-11-02T10:00:00"))
+    history = changes.record_version(history, second, 5)
+    assert history.etag == second.etag
+    assert history.changes == [{"at": "2025-11-02T10:00:00", "from": first.etag, "to": second.etag,
+                                "diff": {"decisions": {"added": [{"idDecision": 1}]}}}]
+    assert history.snapshot == second.data
+
+
+def test_history_pack_roundtrip():
+    history = changes.record_version(None, entry(dossier([{"idDecision": 1}])), 5)
+    history.changes = [{"at": "2025-11-02T10:00:00", "from": "W/\"a\"", "to": "W/\"b\"", "diff": {"carte": {}}}]
+    restored = changes.History.unpack(history.pack())
+    assert (restored.etag, restored.since, restored.changes) == (history.etag, history.since, history.changes)
+    assert restored.snapshot["decisions"] == [{"idDecision": 1}]
+
+
+def build_history(count):
+    history = changes.record_version(None, entry(dossier([], timestamp="2025-11-01T00:00:00")), 3)
+    for day in range(2, 2 + count):
+        version = entry(dossier([{"idDecision": i} for i in range(day)], timestamp=f"2025-11-{day:02d}T00:00:00"))
+        history = changes.record_version(history, version, 3)
+    return history
+
+
+def test_history_keeps_max_changes():
+    history = build_history(5)
+    assert [change["at"][:10] for change in history.changes] == ["2025-11-04", "2025-11-05", "2025-11-06"]
+    # Complet seulement depuis le dernier changement oublié
+    assert history.since == "2025-11-03T00:00:00"
+
+
+def test_changes_since_etag():
+    history = build_history(3)
+    etags = [change["from"] for change in history.changes]
+    assert changes.changes_since(history, None) == {"complete": True, "changes": history.changes[-1:]}
+    assert changes.changes_since(history, etags[1]) == {"complete": True, "changes": history.changes[1:]}
+    # Même ETag sans le préfixe W/
+    assert changes.changes_since(history, etags[1].removeprefix("W/"))["changes"] == history.changes[1:]
+    assert changes.changes_since(history, history.etag) == {"complete": True, "changes": []}
+    assert changes.changes_since(history, '"inconnu"') == {"complete": False, "changes": history.changes}
+
+
+def test_changes_since_date():
+    history = build_history(3)
+    since = changes.changes_since(history, "2025-11-03T12:00:00")
+    assert since["complete"] and [change["at"][:10] for change in since["changes"]] == ["2025-11-04"]
+    assert not changes.changes_since(history, "2025-10-01T00:00:00")["complete"]
@@ -0,0 +1,147 @@
+"""
+Découverte des clés sur des bundles enregistrés (tests/fixtures/bundles): la clé
+du bundle principal est à cheval sur la limite des 64 Kio d'un morceau lu
+"""
+import hashlib
+import re
+from pathlib import Path
+
+import httpx
+import pytest
+
+from crypto import CryptoEngine, trial_decrypt
+from key_discovery import CHUNK_SIZE, KEY_PATTERN, BundleScan, KeyDiscovery, collect_candidates, scan_file
+
+BUNDLES = Path(__file__).parent / "fixtures" / "bundles"
+MAIN = BUNDLES / "main.3f2a9c1d7e5b8a04.js"
+KEY = "qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ="
+IV = "k3vi7ZFUB8/XSID2AXEwug=="
+DECOY = "Zm9vYmFyYmF6cXV4Zm9vYmFyYmF6cXV4Zm9vYmFyYmE="
+
+
+def test_fixture_key_straddles_chunk_boundary():
+    content = MAIN.read_bytes()
+    start = content.index(KEY.encode())
+    assert start < CHUNK_SIZE < start + len(KEY)
+    # Aucun des deux morceaux ne contient la clé entière: seul le recouvrement la retrouve
+    assert not KEY_PATTERN.search(content[:CHUNK_SIZE])
+    assert KEY.encode() not in content[CHUNK_SIZE:]
+
+
+def test_scan_file_finds_split_key():
+    scan = scan_file(MAIN)
+    assert list(scan.keys) == [KEY, DECOY]
+    assert list(scan.ivs) == [IV]
+    assert scan.size == MAIN.stat().st_size
+    assert scan.digest == hashlib.sha256(MAIN.read_bytes()).hexdigest()[:20]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 300, CHUNK_SIZE])
+def test_feed_is_independent_of_chunking(chunk_size):
+    content = MAIN.read_bytes()
+    scan = BundleScan()
+    for offset in range(0, len(content), chunk_size):
+        scan.feed(content[offset:offset + chunk_size])
+    assert list(scan.keys) == [KEY, DECOY] and list(scan.ivs) == [IV]
+
+
+def test_feed_collects_chunk_references():
+    scan = scan_file(BUNDLES / "runtime.8e1f0c2b4d6a9e37.js")
+    assert set(scan.refs) == {"592.a1b2c3d4e5f6a7b8.js", "common.0f1e2d3c4b5a6978.js"}
+    assert not scan.keys
+
+
+def test_collect_candidates_from_saved_bundles():
+    keys, ivs = collect_candidates(scan_file(path) for path in sorted(BUNDLES.glob("*.js")))
+    assert sorted(keys) == sorted([KEY, DECOY])
+    assert ivs == [IV]
+
+
+class Site:
+    """Copie du site servie par MockTransport, avec ETag et Last-Modified comme un serveur statique"""
+
+    def __init__(self):
+        self.files = {path.name: path.read_bytes() for path in BUNDLES.iterdir()}
+        self.requests = []
+
+    def etag(self, name: str) -> str:
+        return '"' + hashlib.md5(self.files[name]).hexdigest() + '"'
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        name = request.url.path.lstrip("/") or "index.html"
+        self.requests.append((name, request.headers.get("if-none-match")))
+        if name not in self.files:
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == self.etag(name):
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.files[name], headers={
+            "ETag": self.etag(name), "Last-Modified": "Sat, 18 Oct 2025 08:00:00 GMT"})
+
+    def fetched(self) -> list:
+        return [name for name, _ in self.requests if name != "index.html"]
+
+
+@pytest.fixture
+def site():
+    return Site()
+
+
+def discovery(site: Site) -> KeyDiscovery:
+    return KeyDiscovery("https://www.mahakim.ma/", transport=httpx.MockTransport(site.handler))
+
+
+@pytest.mark.anyio
+async def test_run_downloads_bundles_and_lazy_chunks(site):
+    keys, ivs = await discovery(site).run()
+    assert sorted(keys) == sorted([KEY, DECOY]) and ivs == [IV]
+    assert sorted(site.fetched()) == sorted(name for name in site.files if name.endswith(".js"))
+
+
+@pytest.mark.anyio
+async def test_second_run_skips_hashed_names_and_revalidates_others(site):
+    finder = discovery(site)
+    await finder.run()
+    assert finder.last_report["downloaded"] == 5
+
+    site.requests.clear()
+    keys, ivs = await finder.run()
+    report = finder.last_report
+    assert (report["downloaded"], report["not_modified"], report["skipped"], report["errors"]) == (0, 1, 4, 0)
+    # Seul le fichier sans empreinte dans son nom est redemandé, conditionnellement
+    assert site.requests[1:] == [("scripts.js", site.etag("scripts.js"))]
+    assert sorted(keys) == sorted([KEY, DECOY]) and ivs == [IV]
+
+
+@pytest.mark.anyio
+async def test_changed_bundle_is_downloaded_again(site):
+    finder = discovery(site)
+    await finder.run()
+    site.files["scripts.js"] += b';var k="' + KEY.replace("q", "Q").encode() + b'";'
+    keys, _ = await finder.run()
+    report = finder.last_report
+    assert (report["downloaded"], report["not_modified"], report["skipped"]) == (1, 0, 4)
+    assert KEY.replace("q", "Q") in keys
+
+
+@pytest.mark.anyio
+async def test_missing_bundle_is_counted_as_error(site):
+    del site.files["592.a1b2c3d4e5f6a7b8.js"]
+    finder = discovery(site)
+    keys, ivs = await finder.run()
+    # Les autres bundles sont analysés quand même
+    assert (finder.last_report["errors"], finder.last_report["bundles"]) == (1, 4)
+    assert KEY in keys and ivs == [IV]
+
+
+@pytest.mark.anyio
+async def test_discovered_pair_decrypts_a_sample(site):
+    sample = CryptoEngine(KEY, IV).current.encrypt('{"idDossierCivil": 1}')
+    keys, ivs = await discovery(site).run()
+    valid = [(key, iv) for key in keys for iv in ivs if trial_decrypt(key, iv, sample)]
+    assert valid == [(KEY, IV)]
+
+
+def test_fixture_names_carry_content_hash_or_not():
+    hashed = [name for name in Site().files if re.search(r"[.-][0-9a-f]{16,20}\.js$", name)]
+    assert sorted(hashed) == sorted(["main.3f2a9c1d7e5b8a04.js", "runtime.8e1f0c2b4d6a9e37.js",
+                                     "592.a1b2c3d4e5f6a7b8.js", "common.0f1e2d3c4b5a6978.js"])
@@ -0,0 +1,71 @@
+"""
+Deux workers sur le même cache disque (backend local, sans diffusion): les clés
+trouvées par l'un sont reprises par l'autre sans nouvelle découverte
+"""
+import base64
+
+import pytest
+
+import main
+from cache import TTLCache
+from cache_backends import LocalBackend
+from crypto import CryptoEngine, DecryptHealth
+from disk_cache import DiskCache
+
+pytestmark = pytest.mark.anyio
+
+OLD = ("qKG6nnv7VXVSA4pDotDyWNx8ca5mKxWkn0eL784GxKQ=", "k3vi7ZFUB8/XSID2AXEwug==")
+NEW = (base64.b64encode(b"n" * 32).decode(), base64.b64encode(b"v" * 16).decode())
+
+
+class NoDiscovery:
+    """Récupération qui ne doit pas être lancée"""
+
+    def due(self, now):
+        return True
+
+    async def attempt(self, sample, known):
+        raise AssertionError("découverte lancée alors que les clés sont partagées")
+
+
+def worker(path: str) -> tuple:
+    backend = LocalBackend(TTLCache(), DiskCache(path))
+    engine = CryptoEngine(*OLD, health=DecryptHealth(window=10, threshold=0.5, min_samples=3))
+    return backend, engine
+
+
+async def test_keys_found_by_one_worker_reach_the_other(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite3")
+    (backend_a, crypto_a), (backend_b, crypto_b) = worker(path), worker(path)
+    sample = CryptoEngine(*NEW).current.encrypt('{"idDossierCivil": 1}')
+    monkeypatch.setattr(main, "key_recovery", NoDiscovery())
+
+    # Worker A détient le bail et active la nouvelle clé
+    monkeypatch.setattr(main, "cache_backend", backend_a)
+    monkeypatch.setattr(main, "crypto", crypto_a)
+    await main.apply_keys(*NEW)
+
+    # Worker B échoue à déchiffrer avec l'ancienne clé
+    monkeypatch.setattr(main, "cache_backend", backend_b)
+    monkeypatch.setattr(main, "crypto", crypto_b)
+    await main.check_keys()
+    assert crypto_b.keys() == {"key": OLD[0], "iv": OLD[1]}
+    for _ in range(3):
+        crypto_b.health.record(False, sample)
+    await main.check_keys()
+    assert crypto_b.keys() == {"key": NEW[0], "iv": NEW[1]}
+    assert not crypto_b.health.suspect
+    await backend_a.close()
+    await backend_b.close()
+
+
+async def test_shared_keys_that_fail_the_sample_are_ignored(tmp_path, monkeypatch):
+    backend, engine = worker(str(tmp_path / "cache.sqlite3"))
+    await backend.save_state("keys", {"key": NEW[0], "iv": NEW[1]})
+    monkeypatch.setattr(main, "cache_backend", backend)
+    monkeypatch.setattr(main, "crypto", engine)
+    # Chiffré d'une troisième clé: les clés partagées ne le déchiffrent pas
+    sample = CryptoEngine(base64.b64encode(b"x" * 32).decode(), NEW[1]).current.encrypt('{"a": 1}')
+    assert not await main.adopt_shared_keys(sample)
+    assert engine.keys() == {"key": OLD[0], "iv": OLD[1]}
+    await backend.close()
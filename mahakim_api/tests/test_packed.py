@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+import packed
+from packed import HIT_PREFIX, PackedEntry
+
+DATA = {"carte": {"affaire": "DC", "objetDossier": "أداء"}, "decisions": [], "timestamp": "2025-11-01T10:00:00"}
+
+
+def test_build_serializes_hit_body():
+    entry = PackedEntry.build(DATA, {"carte": 10.0, "decisions": 0}, "k1")
+    assert entry.raw().startswith(HIT_PREFIX)
+    assert json.loads(entry.raw()) == {"source": "cache", "data": DATA}
+    assert json.loads(entry.data_json()) == DATA
+    assert entry.etag == f'W/"{entry.digest}"'
+
+
+def test_pack_unpack_roundtrip():
+    entry = PackedEntry.build(DATA, {"carte": 10.0, "decisions": 0}, "k1")
+    restored = PackedEntry.unpack(entry.pack())
+    assert restored.fetched_at == entry.fetched_at
+    assert (restored.method, restored.digest, restored.key_version) == (entry.method, entry.digest, "k1")
+    assert restored.body == entry.body
+    assert restored.data == DATA
+
+
+def test_unpack_without_key_version():
+    entry = PackedEntry.build(DATA, {})
+    assert PackedEntry.unpack(entry.pack()).key_version is None
+
+
+def test_digest_ignores_timestamp():
+    later = {**DATA, "timestamp": "2026-01-01T00:00:00"}
+    assert packed.content_hash(DATA) == packed.content_hash(later)
+    assert packed.content_hash(DATA) != packed.content_hash({**DATA, "decisions": [{"idDecision": 1}]})
+
+
+def test_compress_roundtrip():
+    raw = json.dumps(DATA, ensure_ascii=False).encode()
+    assert packed.decompress(packed.compress(raw, "zlib", 6), "zlib") == raw
+
+
+@pytest.mark.skipif(packed.zstandard is None, reason="zstandard non installé")
+def test_zstd_roundtrip():
+    raw = json.dumps(DATA, ensure_ascii=False).encode()
+    assert packed.decompress(packed.compress(raw, "zstd", 3), "zstd") == raw
+
+
+def test_digest_ignores_key_order():
+    reordered = {"timestamp": DATA["timestamp"], "decisions": [], "carte": {"objetDossier": "أداء", "affaire": "DC"}}
+    assert packed.content_hash(reordered) == packed.content_hash(DATA)
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from prefetch import PrefetchJob, parse_dossiers
+
+
+@pytest.mark.parametrize("text", [
+    "13,202512028569\n13,202512028570\n",
+    "id_juridiction;id_dossier\n13;202512028569\n13;202512028570",
+    "﻿id_dossier\tid_juridiction\n202512028569\t13\n202512028570\t13\n",
+    '{"id_juridiction": 13, "id_dossier": "202512028569"}\n\n{"id_juridiction": "13", "id_dossier": "202512028570"}',
+])
+def test_parse_dossiers_formats(text):
+    assert parse_dossiers(text) == [("13", "202512028569"), ("13", "202512028570")]
+
+
+def test_parse_dossiers_empty():
+    assert parse_dossiers("  \n") == []
+
+
+def test_parse_dossiers_skips_blank_rows():
+    assert parse_dossiers("13,1\n,\n13,2") == [("13", "1"), ("13", "2")]
+
+
+@pytest.mark.parametrize("text, line", [
+    ("13,1\n14", "ligne 2"),
+    ('{"id_juridiction": 13}', "ligne 1"),
+])
+def test_parse_dossiers_reports_bad_line(text, line):
+    with pytest.raises(ValueError, match=line):
+        parse_dossiers(text)
+
+
+@pytest.mark.anyio
+async def test_job_counts_outcomes():
+    async def process(job, id_juridiction, id_dossier):
+        if id_dossier == "bad":
+            raise RuntimeError("Dossier introuvable")
+        return "cached" if id_dossier == "1" else "fetched"
+
+    job = PrefetchJob([("13", "1"), ("13", "2"), ("13", "bad")], rate=100, concurrency=2)
+    await job.run(process)
+    state = job.as_dict()
+    assert (state["status"], state["cached"], state["fetched"], state["failed"]) == ("done", 1, 1, 1)
+    assert state["percent"] == 100.0
+    assert state["failures"] == [{"id_juridiction": "13", "id_dossier": "bad", "error": "Dossier introuvable"}]
+
+
+@pytest.mark.anyio
+async def test_cancelled_job():
+    async def process(job, id_juridiction, id_dossier):
+        await asyncio.sleep(10)
+
+    job = PrefetchJob([("13", "1")], rate=100, concurrency=1)
+    task = asyncio.create_task(job.run(process))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert job.status == "cancelled" and job.finished_at is not None
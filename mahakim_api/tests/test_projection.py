@@ -0,0 +1,52 @@
+import pytest
+
+from projection import Projection
+
+SECTIONS = ("carte", "decisions", "parties", "expertises")
+
+DATA = {
+    "carte": {"affaire": "DC", "lastJugement": {"dateProchaineAudienceString": "25/11/2025", "finalite": None}},
+    "decisions": [{"idDecision": 1, "typeDecision": "حكم", "contenuDecision": "..."}],
+    "parties": [{"idPartie": 7}],
+    "expertises": [],
+    "timestamp": "2025-11-01T10:00:00",
+    "partial": True
+}
+
+
+def test_no_projection():
+    assert Projection.parse(None, None, SECTIONS) is None
+    assert Projection.parse("", "", SECTIONS) is None
+
+
+def test_sections_in_canonical_order():
+    projection = Projection.parse("parties, carte", None, SECTIONS)
+    assert projection.sections == ["carte", "parties"]
+    assert projection.apply(DATA) == {"carte": DATA["carte"], "parties": DATA["parties"],
+                                      "timestamp": DATA["timestamp"], "partial": True}
+
+
+def test_fields_trim_objects_and_lists():
+    projection = Projection.parse(None, "carte.lastJugement.dateProchaineAudienceString,decisions.idDecision",
+                                  SECTIONS)
+    assert projection.sections is None
+    result = projection.apply(DATA)
+    assert result["carte"] == {"lastJugement": {"dateProchaineAudienceString": "25/11/2025"}}
+    assert result["decisions"] == [{"idDecision": 1}]
+    assert result["parties"] == DATA["parties"]
+
+
+def test_parent_field_keeps_whole_object():
+    projection = Projection.parse("carte", "carte.lastJugement,carte.lastJugement.finalite", SECTIONS)
+    assert projection.apply(DATA)["carte"] == {"lastJugement": DATA["carte"]["lastJugement"]}
+
+
+@pytest.mark.parametrize("sections, fields", [
+    ("carte,inconnue", None),
+    (" , ", None),
+    (None, "carte"),
+    (None, "inconnue.champ"),
+])
+def test_invalid_projection(sections, fields):
+    with pytest.raises(ValueError):
+        Projection.parse(sections, fields, SECTIONS)
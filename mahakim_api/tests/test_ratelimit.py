@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+import upstream
+from ratelimit import AdaptiveLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+async def call(limiter: AdaptiveLimiter, status: int | None):
+    async with limiter.slot() as slot:
+        slot.observe(status)
+
+
+async def test_congestion_halves_rate_and_concurrency(clock):
+    limiter = AdaptiveLimiter(rate=10, concurrency=8, cooldown=2, clock=clock)
+    await call(limiter, 503)
+    assert limiter.rate == 5 and int(limiter.concurrency) == 4
+    # Rafale d'échecs pendant le délai de grâce: une seule baisse
+    await call(limiter, 429)
+    assert limiter.decreases == 1 and limiter.congestion_signals == 2
+    clock.advance(2)
+    await call(limiter, None)
+    assert limiter.rate == 2.5 and limiter.decreases == 2
+
+
+async def test_healthy_responses_raise_limits_up_to_bounds(clock):
+    limiter = AdaptiveLimiter(rate=10, max_rate=10.25, concurrency=2, max_concurrency=3,
+                              rate_step=0.1, burst=100, clock=clock)
+    for _ in range(20):
+        await call(limiter, 200)
+    assert limiter.rate == 10.25
+    assert int(limiter.concurrency) == 3
+
+
+async def test_rate_never_drops_below_minimum(clock):
+    limiter = AdaptiveLimiter(rate=2, min_rate=1, concurrency=2, min_concurrency=1, burst=10, cooldown=0,
+                              clock=clock)
+    for _ in range(5):
+        await call(limiter, 503)
+    assert limiter.rate == 1 and int(limiter.concurrency) == 1
+
+
+async def test_client_errors_are_not_congestion(clock):
+    limiter = AdaptiveLimiter(rate=10, clock=clock)
+    await call(limiter, 404)
+    assert limiter.decreases == 0
+
+
+async def test_concurrency_limit_queues_callers():
+    limiter = AdaptiveLimiter(rate=1000, burst=1000, concurrency=2)
+    release = asyncio.Event()
+    peak = 0
+
+    async def hold():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.inflight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    assert limiter.inflight == 2 and limiter.waiting == 3
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2 and limiter.inflight == 0
+
+
+async def test_token_bucket_spaces_calls():
+    limiter = AdaptiveLimiter(rate=50, burst=1, concurrency=8)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(6):
+        async with limiter.slot():
+            pass
+    # 1 jeton initial, puis 5 à 50/s
+    assert loop.time() - start >= 0.09
+
+
+async def test_cancelled_waiter_releases_its_place():
+    limiter = AdaptiveLimiter(rate=0.001, burst=1, concurrency=4)
+    async with limiter.slot():
+        pass
+    waiter = asyncio.create_task(call(limiter, 200))
+    await asyncio.sleep(0.01)
+    assert limiter.inflight == 1
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.inflight == 0
+
+
+def test_instance_budget_is_split_between_workers(monkeypatch):
+    monkeypatch.setattr(upstream, "UPSTREAM_RATE", 10)
+    monkeypatch.setattr(upstream, "UPSTREAM_MAX_RATE", 20)
+    monkeypatch.setattr(upstream, "UPSTREAM_CONCURRENCY", 8)
+    monkeypatch.setattr(upstream, "WEB_CONCURRENCY", 4)
+    limiter = upstream.new_limiter()
+    assert (limiter.rate, limiter.max_rate, int(limiter.concurrency)) == (2.5, 5, 2)
@@ -0,0 +1,83 @@
+import pytest
+
+from resilience import CircuitBreaker, CircuitOpenError, RetryBudget, backoff_delay
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, reset_timeout=30, clock=clock)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open" and breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.stats()["retry_in"] == 30
+
+
+def test_success_resets_consecutive_failures(clock):
+    breaker = CircuitBreaker(threshold=2, clock=clock)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_a_single_trial(clock):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.advance(10)
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(threshold=5, reset_timeout=10, clock=clock)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.advance(10)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open" and breaker.opens == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_released_trial_frees_half_open(clock):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.advance(10)
+    breaker.before_call()
+    breaker.release()
+    breaker.before_call()
+
+
+def test_retry_budget_is_a_fraction_of_traffic():
+    budget = RetryBudget(ratio=0.5, max_tokens=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    assert budget.exhausted == 1
+    budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    assert budget.stats() == {"tokens": 0, "retries": 3, "exhausted": 2}
+
+
+def test_retry_budget_caps_tokens():
+    budget = RetryBudget(ratio=1, max_tokens=3)
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 3
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(1, 10):
+        assert 0 <= backoff_delay(attempt, 0.5, 5) <= min(5, 0.5 * 2 ** (attempt - 1))
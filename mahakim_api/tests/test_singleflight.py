@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from singleflight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_callers_share_one_execution():
+    flights = SingleFlight()
+    calls = 0
+
+    async def fetch(value):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(*(flights.run("k", fetch, 42) for _ in range(5)))
+    assert results == [42] * 5
+    assert calls == 1
+    assert flights.stats() == {"inflight": 0, "coalesced": 4}
+
+
+async def test_distinct_keys_run_separately():
+    flights = SingleFlight()
+    results = await asyncio.gather(flights.run("a", asyncio.sleep, 0, "a"), flights.run("b", asyncio.sleep, 0, "b"))
+    assert results == ["a", "b"]
+    assert flights.coalesced == 0
+
+
+async def test_exception_reaches_every_caller():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Mahakim indisponible")
+
+    results = await asyncio.gather(*(flights.run("k", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not flights.inflight
+
+
+async def test_cancelled_caller_does_not_cancel_the_flight():
+    flights = SingleFlight()
+    done = asyncio.Event()
+
+    async def fetch():
+        await asyncio.sleep(0.02)
+        done.set()
+        return "ok"
+
+    first = asyncio.create_task(flights.run("k", fetch))
+    second = asyncio.create_task(flights.run("k", fetch))
+    await asyncio.sleep(0.005)
+    first.cancel()
+    assert await second == "ok"
+    assert done.is_set()
+
+
+async def test_new_flight_after_completion():
+    flights = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flights.run("k", fetch) == 1
+    assert await flights.run("k", fetch) == 2
@@ -0,0 +1,55 @@
+"""
+Décomposition du temps d'une requête (en-tête Server-Timing)
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict
+
+_current: ContextVar["Timings | None"] = ContextVar("timings", default=None)
+
+
+class Timings:
+    """Durées cumulées par étape; les étapes parallèles peuvent se chevaucher"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float):
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    @contextmanager
+    def span(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Durées en millisecondes, avec le temps total écoulé"""
+        result = {name: round(seconds * 1000, 2) for name, seconds in self.durations.items()}
+        result["total"] = round((time.perf_counter() - self.started) * 1000, 2)
+        return result
+
+    def header(self) -> str:
+        return ", ".join(f"{name};dur={ms}" for name, ms in self.as_dict().items())
+
+
+def start() -> Timings:
+    """Démarre la mesure pour la requête courante (et les tâches qu'elle lance)"""
+    timings = Timings()
+    _current.set(timings)
+    return timings
+
+
+@contextmanager
+def span(name: str):
+    """Mesure une étape si une mesure est en cours, sinon ne fait rien"""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.span(name):
+        yield
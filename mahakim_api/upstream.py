@@ -0,0 +1,225 @@
+"""
+Client HTTP partagé vers Mahakim (pool de connexions keep-alive)
+"""
+import asyncio
+import importlib.util
+import logging
+import os
+import time
+
+import httpx
+
+import metrics
+from ratelimit import AdaptiveLimiter
+from resilience import RETRY_STATUSES, CircuitBreaker, CircuitOpenError, RetryBudget, backoff_delay
+
+_logger = logging.getLogger(__name__)
+
+MAHAKIM_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+    "Accept": "application/json",
+    "Referer": "https://www.mahakim.ma/"
+}
+
+# === Configuration du pool (variables d'environnement) ===
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+HTTP2 = os.getenv("HTTP2", "false").lower() in ("1", "true", "yes")
+
+# === Régulation adaptative des appels (débit + concurrence) ===
+UPSTREAM_RATE = float(os.getenv("UPSTREAM_RATE", "10"))
+UPSTREAM_MIN_RATE = float(os.getenv("UPSTREAM_MIN_RATE", "1"))
+UPSTREAM_MAX_RATE = float(os.getenv("UPSTREAM_MAX_RATE", "20"))
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", "8"))
+UPSTREAM_MAX_CONCURRENCY = int(os.getenv("UPSTREAM_MAX_CONCURRENCY", str(HTTP_MAX_CONNECTIONS)))
+# Workers uvicorn/gunicorn de l'instance: chaque worker a son propre régulateur
+# et reçoit une part égale des budgets UPSTREAM_* (qui valent pour l'instance)
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+
+def new_limiter() -> AdaptiveLimiter:
+    """Régulateur de ce worker: sa part des budgets de l'instance"""
+    workers = WEB_CONCURRENCY
+    return AdaptiveLimiter(
+        rate=UPSTREAM_RATE / workers,
+        min_rate=UPSTREAM_MIN_RATE / workers,
+        max_rate=UPSTREAM_MAX_RATE / workers,
+        concurrency=max(1, UPSTREAM_CONCURRENCY // workers),
+        max_concurrency=max(1, UPSTREAM_MAX_CONCURRENCY // workers),
+        rate_step=0.1 / workers
+    )
+
+
+limiter = new_limiter()
+
+# === Retries (GET idempotents) et disjoncteur ===
+RETRY_MAX_ATTEMPTS = int(os.getenv("RETRY_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.5"))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "5"))
+RETRY_MAX_ELAPSED = float(os.getenv("RETRY_MAX_ELAPSED", "20"))
+RETRY_BUDGET_RATIO = float(os.getenv("RETRY_BUDGET_RATIO", "0.2"))
+BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("BREAKER_RESET_TIMEOUT", "30"))
+
+retry_budget = RetryBudget(ratio=RETRY_BUDGET_RATIO)
+breaker = CircuitBreaker(threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT)
+
+_client: httpx.AsyncClient | None = None
+_transport: httpx.AsyncHTTPTransport | None = None
+_http2_enabled = False
+
+
+def open_client() -> httpx.AsyncClient:
+    """Ouvre le client partagé (appelé au démarrage de l'application)"""
+    global _client, _transport, _http2_enabled, limiter
+    if _client is not None:
+        return _client
+    # Limiteur neuf, lié à la boucle asyncio de l'application
+    limiter = new_limiter()
+
+    http2 = HTTP2
+    if http2 and importlib.util.find_spec("h2") is None:
+        _logger.warning("HTTP2 demandé mais le paquet 'h2' est absent, repli sur HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+    )
+    _transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+    _http2_enabled = http2
+    _client = httpx.AsyncClient(
+        transport=_transport,
+        timeout=HTTP_TIMEOUT,
+        headers=MAHAKIM_HEADERS
+    )
+    return _client
+
+
+async def close_client():
+    """Ferme le client partagé et ses connexions (arrêt de l'application)"""
+    global _client, _transport, _http2_enabled
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _transport = None
+    _http2_enabled = False
+
+
+def get_client() -> httpx.AsyncClient:
+    """Retourne le client partagé, ouvert à la demande hors lifespan"""
+    return _client if _client is not None else open_client()
+
+
+async def get(url: str, params: dict) -> httpx.Response:
+    """
+    GET vers Mahakim: disjoncteur, limiteur adaptatif et retries avec backoff.
+    Lève CircuitOpenError sans appeler Mahakim si le disjoncteur est ouvert;
+    après le dernier essai, la dernière réponse (ou erreur) est rendue telle quelle.
+    """
+    retry_budget.deposit()
+    start = time.monotonic()
+    attempt = 1
+    while True:
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            metrics.UPSTREAM_ERRORS.labels(metrics.endpoint_name(url), "circuit_open").inc()
+            raise
+        response = None
+        try:
+            response = await _get_once(url, params)
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            error = e
+        except BaseException:
+            breaker.release()
+            raise
+        else:
+            if response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+
+        delay = backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY)
+        if response is not None and response.status_code == 429:
+            # Respecter Retry-After (en secondes) dans la limite du délai maximum
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(float(retry_after), RETRY_MAX_DELAY)
+
+        exhausted = (
+            attempt >= RETRY_MAX_ATTEMPTS
+            or time.monotonic() - start + delay > RETRY_MAX_ELAPSED
+            or breaker.is_open
+            or not retry_budget.withdraw()
+        )
+        if exhausted:
+            if response is not None:
+                return response
+            raise error
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _get_once(url: str, params: dict) -> httpx.Response:
+    """Un essai, sous le contrôle du limiteur adaptatif"""
+    endpoint = metrics.endpoint_name(url)
+    async with limiter.slot() as slot:
+        start = time.perf_counter()
+        try:
+            with metrics.UPSTREAM_INFLIGHT.track_inprogress():
+                response = await get_client().get(url, params=params)
+        except httpx.TimeoutException:
+            slot.observe(None)
+            metrics.UPSTREAM_ERRORS.labels(endpoint, "timeout").inc()
+            raise
+        except httpx.TransportError:
+            metrics.UPSTREAM_ERRORS.labels(endpoint, "transport").inc()
+            raise
+        finally:
+            metrics.UPSTREAM_LATENCY.labels(endpoint).observe(time.perf_counter() - start)
+        slot.observe(response.status_code)
+        metrics.UPSTREAM_PAYLOAD.labels(endpoint).observe(len(response.content))
+        if response.status_code >= 400:
+            kind = "http_429" if response.status_code == 429 else f"http_{response.status_code // 100}xx"
+            metrics.UPSTREAM_ERRORS.labels(endpoint, kind).inc()
+        return response
+
+
+def resilience_stats() -> dict:
+    return {"circuit": breaker.stats(), "retry_budget": retry_budget.stats()}
+
+
+def pool_stats() -> dict:
+    """État du pool: connexions actives, inactives et requêtes en attente"""
+    stats = {
+        "open": _client is not None,
+        "http2": _http2_enabled,
+        "limits": {
+            "max_connections": HTTP_MAX_CONNECTIONS,
+            "max_keepalive_connections": HTTP_MAX_KEEPALIVE,
+            "keepalive_expiry": HTTP_KEEPALIVE_EXPIRY,
+            "timeout": HTTP_TIMEOUT
+        },
+        "connections": 0,
+        "active": 0,
+        "idle": 0,
+        "pending_requests": 0
+    }
+    # httpcore n'expose pas de compteurs publics: on inspecte le pool sous-jacent
+    pool = getattr(_transport, "_pool", None)
+    if pool is None:
+        return stats
+
+    connections = list(pool.connections)
+    stats["connections"] = len(connections)
+    stats["idle"] = sum(1 for c in connections if c.is_idle())
+    stats["active"] = sum(1 for c in connections if not c.is_idle() and not c.is_closed())
+    stats["pending_requests"] = sum(
+        1 for r in getattr(pool, "_requests", []) if getattr(r, "connection", None) is None
+    )
+    return stats
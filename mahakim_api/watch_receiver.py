@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Récepteur de test des notifications de la liste de suivi (remplace n8n ou Odoo en local)
+
+    python watch_receiver.py 9000
+    WATCH_CALLBACK_URL=http://localhost:9000/changes uvicorn main:app
+"""
+import json
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+
+class Receiver(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            self.send_response(400)
+            self.end_headers()
+            return
+        print(f"📬 {datetime.now().isoformat()} {self.path}")
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 9000
+    print(f"👂 En écoute sur http://localhost:{port}")
+    HTTPServer(("", port), Receiver).serve_forever()
@@ -0,0 +1,160 @@
+"""
+Liste de suivi: fréquence de consultation de chaque dossier selon son urgence
+"""
+import re
+from datetime import date, datetime
+from typing import Dict, List, Tuple
+
+_DATE_FR = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_DATE_ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+def parse_hearing_date(text) -> date | None:
+    """Date de prochaine audience Mahakim ("25/11/2025", éventuellement suivie de l'heure)"""
+    if not isinstance(text, str):
+        return None
+    try:
+        match = _DATE_FR.search(text)
+        if match:
+            day, month, year = map(int, match.groups())
+            return date(year, month, day)
+        match = _DATE_ISO.search(text)
+        if match:
+            return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+    return None
+
+
+def poll_interval(carte: dict | None, today: date, intervals: Dict[str, float]) -> Tuple[float, str]:
+    """
+    Délai avant la prochaine consultation -> (secondes, motif):
+    audience imminente, audience proche, audience tout juste passée (décision
+    attendue), affaire jugée sans audience à venir, ou par défaut.
+    """
+    last = (carte or {}).get("lastJugement")
+    last = last if isinstance(last, dict) else {}
+    hearing = parse_hearing_date(last.get("dateProchaineAudienceString"))
+    if hearing is not None:
+        days = (hearing - today).days
+        if -7 <= days <= 2:
+            return intervals["urgent"], "audience_imminente" if days >= 0 else "audience_passee"
+        if 0 < days <= 14:
+            return intervals["soon"], "audience_proche"
+        if days > 14:
+            return intervals["default"], "audience_lointaine"
+    if last.get("finalite"):
+        return intervals["closed"], "juge"
+    return intervals["default"], "sans_audience"
+
+
+class Watch:
+    """Un dossier suivi: inscription (persistée) et planification (en mémoire)"""
+
+    def __init__(self, id_juridiction: str, id_dossier: str, callback_url: str | None = None):
+        self.id_juridiction = id_juridiction
+        self.id_dossier = id_dossier
+        self.callback_url = callback_url
+        self.next_poll = 0.0
+        self.interval: float | None = None
+        self.reason: str | None = None
+        self.last_poll: float | None = None
+        self.last_change: str | None = None
+        self.failures = 0
+        self.polling = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.id_juridiction}:{self.id_dossier}"
+
+    def registration(self) -> dict:
+        return {"id_juridiction": self.id_juridiction, "id_dossier": self.id_dossier,
+                "callback_url": self.callback_url}
+
+    def as_dict(self) -> dict:
+        return {
+            **self.registration(),
+            "next_poll": datetime.fromtimestamp(self.next_poll).isoformat() if self.next_poll else None,
+            "interval": self.interval,
+            "reason": self.reason,
+            "last_poll": datetime.fromtimestamp(self.last_poll).isoformat() if self.last_poll else None,
+            "last_change": self.last_change,
+            "failures": self.failures
+        }
+
+
+class Watchlist:
+    """Dossiers suivis; seule l'inscription est persistée, la planification repart au démarrage"""
+
+    def __init__(self, intervals: Dict[str, float], retry_interval: float):
+        self.intervals = intervals
+        self.retry_interval = retry_interval
+        self.watches: Dict[str, Watch] = {}
+        self.polls = 0
+        self.poll_errors = 0
+        self.changes_detected = 0
+        self.notifications = 0
+        self.notification_errors = 0
+
+    def __len__(self) -> int:
+        return len(self.watches)
+
+    def add(self, id_juridiction: str, id_dossier: str, callback_url: str | None = None) -> bool:
+        """Inscrit un dossier (ou met à jour son URL de rappel); True si nouveau"""
+        watch = Watch(id_juridiction, id_dossier, callback_url)
+        existing = self.watches.get(watch.key)
+        if existing is not None:
+            existing.callback_url = callback_url
+            return False
+        self.watches[watch.key] = watch
+        return True
+
+    def remove(self, key: str) -> bool:
+        return self.watches.pop(key, None) is not None
+
+    def state(self) -> dict:
+        return {"watches": [watch.registration() for watch in self.watches.values()]}
+
+    def load(self, state: dict | None):
+        """Recharge les inscriptions en gardant la planification des dossiers déjà connus"""
+        watches = {}
+        for registration in (state or {}).get("watches", []):
+            watch = Watch(**registration)
+            existing = self.watches.get(watch.key)
+            if existing is not None:
+                existing.callback_url = watch.callback_url
+                watch = existing
+            watches[watch.key] = watch
+        self.watches = watches
+
+    def next_due(self, now: float) -> Watch | None:
+        """Dossier dont la consultation est la plus en retard, s'il y en a un"""
+        due = [watch for watch in self.watches.values() if not watch.polling and watch.next_poll <= now]
+        return min(due, key=lambda watch: watch.next_poll, default=None)
+
+    def schedule(self, watch: Watch, carte: dict | None, now: float):
+        """Planifie la consultation suivante après un succès"""
+        watch.interval, watch.reason = poll_interval(carte, date.fromtimestamp(now), self.intervals)
+        watch.next_poll = now + watch.interval
+        watch.last_poll = now
+        watch.failures = 0
+        self.polls += 1
+
+    def schedule_retry(self, watch: Watch, now: float):
+        watch.failures += 1
+        watch.next_poll = now + self.retry_interval * min(watch.failures, 8)
+        watch.last_poll = now
+        self.poll_errors += 1
+
+    def listing(self) -> List[dict]:
+        return [watch.as_dict() for watch in sorted(self.watches.values(), key=lambda watch: watch.next_poll)]
+
+    def stats(self) -> dict:
+        return {
+            "watched": len(self.watches),
+            "polls": self.polls,
+            "poll_errors": self.poll_errors,
+            "changes_detected": self.changes_detected,
+            "notifications": self.notifications,
+            "notification_errors": self.notification_errors
+        }